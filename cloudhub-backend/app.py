@@ -1,29 +1,38 @@
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import logging
+import secrets
 import traceback
-from time import time
 from bson import ObjectId
-from bson.errors import InvalidId
 import asyncio
 
 from config.config import settings
-from utils.error_handlers import APIError, setup_logging
-from database import get_db, close_db, test_connection
-from beanie import init_beanie
+from utils.error_handlers import APIError
+from utils.logging_config import setup_logging, stop_logging
+from database import get_db, close_db
+from database.health import db_health, DatabaseGateMiddleware
+from database.slow_queries import slow_query_monitor
+from database.schema import init_models
+from services.cache_service import response_cache
+from services.rate_limit_service import rate_limiter
+from auth.utils import password_pool
+from auth.jwt_manager import revocation_sync
+from utils.metrics import MetricsMiddleware, render_metrics
+from utils.responses import FastJSONResponse
+from utils.compression import CompressionMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 
 # Import routes
 from routes import auth, user, hackathon, team, project, upload, message
 from routes.payment import router as payment_router
-from routes import team_members, sponsors, timeline_events, resources, faqs
+from routes import team_members, sponsors, timeline_events, resources, faqs, admin
 
 # Import models
 from models.user import User
-from models.token import RefreshToken
+from models.token import RefreshToken, RevokedAccessToken
 from models.message import Message, GroupMessage, Group
 from models.project import Project
 from models.team import Team
@@ -34,18 +43,11 @@ from models.sponsor import Sponsor
 from models.timeline_event import TimelineEvent
 from models.resource import Resource
 from models.faq import FAQ
+from models.registration import HackathonRegistration
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Cache for database connection status
-db_status = {
-    "last_check": 0,
-    "is_connected": False,
-    "check_interval": 5,  # Check every 5 seconds
-    "beanie_initialized": False
-}
-
 def register_routes(app: FastAPI):
     """Register all route handlers."""
     # Include routers
@@ -64,12 +66,18 @@ def register_routes(app: FastAPI):
     app.include_router(timeline_events.router, prefix="/api/hackathons", tags=["Timeline Events"])
     app.include_router(resources.router, prefix="/api/hackathons", tags=["Resources"])
     app.include_router(faqs.router, prefix="/api/hackathons", tags=["FAQs"])
+    app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events for FastAPI application."""
-    global db_status
     # Startup
+    if settings.WORKERS > 1 and not settings.DEBUG:
+        logger.warning(
+            f"Serving with {settings.WORKERS} workers: /metrics is disabled, "
+            f"each worker only counts the requests it handles"
+        )
+    
     try:
         # Initialize database connection
         client = get_db()
@@ -79,6 +87,7 @@ async def lifespan(app: FastAPI):
         document_models = [
             User,
             RefreshToken,
+            RevokedAccessToken,
             Message,
             GroupMessage,
             Group,
@@ -90,17 +99,15 @@ async def lifespan(app: FastAPI):
             Sponsor,
             TimelineEvent,
             Resource,
-            FAQ
+            FAQ,
+            HackathonRegistration
         ]
         
         try:
-            await init_beanie(
-                database=client[settings.DATABASE_NAME],
-                document_models=document_models,
-                allow_index_dropping=True
-            )
+            # Indexes are only reconciled when their declarations changed
+            await init_models(client[settings.DATABASE_NAME], document_models)
             logger.info("Beanie ODM initialized with all models")
-            db_status["beanie_initialized"] = True
+            db_health.beanie_initialized = True
             
             # Test ObjectId handling
             try:
@@ -116,6 +123,14 @@ async def lifespan(app: FastAPI):
             asyncio.create_task(run_periodic_tasks())
             logger.info("Background tasks started")
             
+            await response_cache.connect()
+            await rate_limiter.connect()
+            
+            # Start background database health checks
+            await db_health.start()
+            await slow_query_monitor.start()
+            await revocation_sync.start()
+            
         except Exception as init_error:
             logger.error(f"Error during Beanie initialization: {str(init_error)}")
             logger.error(f"Traceback: {traceback.format_exc()}")
@@ -129,84 +144,15 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    await revocation_sync.stop()
+    await slow_query_monitor.stop()
+    await db_health.stop()
+    await response_cache.close()
+    await rate_limiter.close()
+    password_pool.shutdown()
     close_db()
-    db_status["beanie_initialized"] = False
     logger.info("MongoDB connection closed")
-
-# Middleware to check database connection
-async def check_db_connection(request: Request, call_next):
-    # Skip checks for non-critical paths
-    path = request.url.path
-    if (path.startswith("/static") or 
-        path.startswith("/_next") or 
-        path == "/health" or 
-        path == "/favicon.ico" or
-        request.method == "OPTIONS"):
-        return await call_next(request)
-
-    current_time = time()
-    global db_status
-
-    try:
-        # Only check connection if enough time has passed since last check
-        if current_time - db_status["last_check"] > db_status["check_interval"]:
-            logger.debug("Checking database connection...")
-            is_connected = await test_connection()
-            db_status["is_connected"] = is_connected
-            db_status["last_check"] = current_time
-            
-            if not is_connected:
-                logger.error("Database connection test failed")
-                raise ConnectionError("Database connection test failed")
-            
-            if not db_status["beanie_initialized"]:
-                logger.error("Beanie ODM not initialized")
-                raise ConnectionError("Database ODM not initialized")
-            
-            logger.debug("Database connection check passed")
-        
-        if not db_status["is_connected"]:
-            raise ConnectionError("Database is not connected")
-
-        # Test ObjectId handling before proceeding
-        try:
-            if "id" in request.path_params:
-                id_str = request.path_params["id"]
-                try:
-                    ObjectId(id_str)
-                except InvalidId:
-                    logger.error(f"Invalid ObjectId in request: {id_str}")
-                    return JSONResponse(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        content={
-                            "status": "error",
-                            "message": "Invalid ID format"
-                        }
-                    )
-        except Exception as id_err:
-            logger.error(f"Error handling ObjectId: {str(id_err)}")
-
-        return await call_next(request)
-
-    except Exception as e:
-        error_msg = str(e)
-        logger.error(f"Database connection error in middleware: {error_msg}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
-        db_status["is_connected"] = False
-        
-        # Create error response with CORS headers
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "error",
-                "message": "Database connection not ready. Please try again in a few seconds.",
-                "error": error_msg
-            },
-            headers={
-                "Access-Control-Allow-Origin": "http://localhost:3000",
-                "Access-Control-Allow-Credentials": "true"
-            }
-        )
+    stop_logging()
 
 # Create FastAPI app
 app = FastAPI(
@@ -216,12 +162,17 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan
 )
 
 # Register routes
 register_routes(app)
 
+# Answer 503 while the database is unavailable; CORS is added after it so
+# these responses carry CORS headers too
+app.add_middleware(DatabaseGateMiddleware)
+
 # Setup CORS
 app.add_middleware(
     CORSMiddleware,
@@ -232,8 +183,17 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# Add database connection check middleware
-app.middleware("http")(check_db_connection)
+# Compress large responses with brotli/gzip
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
+    )
+
+# Request metrics; outermost so the timings include every other middleware
+app.add_middleware(MetricsMiddleware)
 
 # Setup logging
 setup_logging()
@@ -282,13 +242,15 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint, reporting the background monitor's state."""
     try:
-        is_connected = await test_connection()
+        is_connected = db_health.is_connected
         return {
-            "status": "healthy" if is_connected else "unhealthy",
+            "status": "healthy" if db_health.is_available else "unhealthy",
             "database": "connected" if is_connected else "disconnected",
-            "beanie_initialized": db_status["beanie_initialized"]
+            "beanie_initialized": db_health.beanie_initialized,
+            "last_check": db_health.last_check,
+            "error": db_health.last_error
         }
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -297,13 +259,32 @@ async def health_check():
             "error": str(e)
         }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """
+    Prometheus scrape endpoint, requiring METRICS_TOKEN as a bearer token.
+    
+    Metrics are kept per process, so with WORKERS > 1 a scrape would see
+    only the worker answering it; the endpoint is disabled then.
+    """
+    if not settings.METRICS_TOKEN and not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.WORKERS > 1 and not settings.DEBUG:
+        raise HTTPException(status_code=503, detail="Metrics are unavailable with more than one worker")
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not secrets.compare_digest(request.headers.get("Authorization", ""), expected):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     
-    # Run the server
+    # Run the server; WORKERS > 1 starts one process per worker
     uvicorn.run(
         "app:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        workers=1 if settings.DEBUG else settings.WORKERS
     )
\ No newline at end of file
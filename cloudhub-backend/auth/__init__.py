@@ -1,10 +1,13 @@
 from .utils import get_password_hash, verify_password
-from .jwt_manager import TokenManager, get_current_user, get_optional_user
+from .jwt_manager import TokenManager, get_current_user, get_current_principal, get_optional_user
+from .principal import Principal
 
 __all__ = [
     'get_password_hash',
     'verify_password',
     'TokenManager',
     'get_current_user',
-    'get_optional_user'
+    'get_current_principal',
+    'get_optional_user',
+    'Principal'
 ] 
\ No newline at end of file
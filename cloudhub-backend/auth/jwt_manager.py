@@ -1,5 +1,10 @@
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple
+import asyncio
+import hashlib
+import heapq
+import time
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -8,9 +13,11 @@ from bson import ObjectId
 from bson.errors import InvalidId
 
 from models.user import User
-from models.token import RefreshToken
+from models.token import RefreshToken, RevokedAccessToken
+from auth.principal import Principal, principal_cache, load_principal
 from database.dependencies import get_db
 from config.config import settings
+from utils.metrics import Counter
 import logging
 
 # Configure logging
@@ -18,6 +25,81 @@ logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
+JWT_CACHE_LOOKUPS = Counter(
+    "jwt_cache_lookups_total", "Verified token cache lookups, by result.", ("result",)
+)
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified token payloads, keyed by a digest of the token.
+
+    An entry lives until the token's exp, so a cached token is rejected as
+    soon as it expires, exactly as a fresh decode would. Revoked tokens are
+    remembered until their exp so they fail even when decoded again; they
+    are kept apart from the payload cache and never evicted early, so their
+    number is bounded by the logouts within one access token lifetime.
+    Revocations made by other workers are added by RevocationSync.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._revoked: Dict[bytes, float] = {}
+        # (exp, key) min-heap, so expired revocations are purged oldest first
+        self._revoked_expiry: List[Tuple[float, bytes]] = []
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: bytes, payload: dict):
+        exp = payload.get("exp")
+        if self.max_entries <= 0 or not isinstance(exp, (int, float)):
+            return
+        self._entries[key] = (exp, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _purge_revoked(self):
+        now = time.time()
+        while self._revoked_expiry and self._revoked_expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._revoked_expiry)
+            if self._revoked.get(key) == expires_at:
+                del self._revoked[key]
+
+    def is_revoked(self, key: bytes) -> bool:
+        if not self._revoked:
+            return False
+        self._purge_revoked()
+        return key in self._revoked
+
+    def revoke(self, key: bytes, expires_at: float):
+        self._entries.pop(key, None)
+        self._purge_revoked()
+        if expires_at <= time.time() or self._revoked.get(key, 0) >= expires_at:
+            return
+        self._revoked[key] = expires_at
+        heapq.heappush(self._revoked_expiry, (expires_at, key))
+
+    def clear(self):
+        self._entries.clear()
+        self._revoked.clear()
+        self._revoked_expiry.clear()
+
+verified_tokens = VerifiedTokenCache(settings.JWT_CACHE_MAX_ENTRIES)
+
 class TokenManager:
     SECRET_KEY = settings.JWT_SECRET_KEY.get_secret_value()
     ALGORITHM = settings.JWT_ALGORITHM
@@ -38,15 +120,46 @@ class TokenManager:
 
     @classmethod
     def decode_token(cls, token: str) -> dict:
-        """Decode and validate a token."""
+        """Decode and validate a token, reusing the payload of a token verified before."""
+        key = verified_tokens.digest(token)
+        if verified_tokens.is_revoked(key):
+            raise HTTPException(
+                status_code=401,
+                detail="Could not validate credentials: Token has been revoked"
+            )
+
+        payload = verified_tokens.get(key)
+        if payload is not None:
+            JWT_CACHE_LOOKUPS.inc("hit")
+            return dict(payload)
+        JWT_CACHE_LOOKUPS.inc("miss")
+
         try:
             payload = jwt.decode(token, cls.SECRET_KEY, algorithms=[cls.ALGORITHM])
-            return payload
         except JWTError as e:
             raise HTTPException(
                 status_code=401,
                 detail=f"Could not validate credentials: {str(e)}"
             )
+        verified_tokens.set(key, payload)
+        return dict(payload)
+
+    @classmethod
+    def revoke_access_token(cls, token: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Reject an access token in this process from now until it expires.
+
+        Returns the token's digest and expiry, or None if it cannot be read.
+        Use revocation_sync.revoke() to reject it in every worker.
+        """
+        try:
+            exp = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            return None
+        expires_at = exp if isinstance(exp, (int, float)) else time.time() + cls.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        key = verified_tokens.digest(token)
+        verified_tokens.revoke(key, expires_at)
+        return key, expires_at
 
     @classmethod
     async def create_tokens(cls, user: User, request: Request) -> Dict[str, str]:
@@ -59,7 +172,7 @@ class TokenManager:
                 "role": user.role,
                 "type": "access"
             }
-            logger.debug(f"Creating access token with data: {access_token_data}")
+            logger.debug("Creating access token for user: %s", access_token_data["sub"])
             access_token = cls.create_access_token(access_token_data)
             logger.debug("Access token created successfully")
 
@@ -92,14 +205,6 @@ class TokenManager:
     @classmethod
     async def refresh_tokens(cls, refresh_token: str, request: Request) -> Dict[str, str]:
         """Validate refresh token and create new access and refresh tokens."""
-        # Validate refresh token
-        token_doc = await RefreshToken.validate_token(refresh_token)
-        if not token_doc:
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or expired refresh token"
-            )
-
         # Get device info
         device_info = {
             "user_agent": request.headers.get("user-agent"),
@@ -107,14 +212,32 @@ class TokenManager:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-        # Rotate refresh token
-        new_refresh_token, new_token_doc = await token_doc.rotate(device_info)
+        # Revoke the presented token and issue its successor
+        rotated = await RefreshToken.rotate_token(refresh_token, device_info, cls.REFRESH_TOKEN_EXPIRE_DAYS)
+        if rotated is None:
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or expired refresh token"
+            )
+        new_refresh_token, new_token_doc = rotated
+
+        user_id = new_token_doc.user.ref.id
+        email, role = new_token_doc.user_email, new_token_doc.user_role
+        if email is None:
+            # Issued before the claims were stored on the token
+            user = await User.get(user_id)
+            if user is None:
+                raise HTTPException(
+                    status_code=401,
+                    detail="User not found"
+                )
+            email, role = user.email, user.role
 
         # Create new access token
         access_token_data = {
-            "sub": str(token_doc.user.id),  # Convert ObjectId to string
-            "email": token_doc.user.email,
-            "role": token_doc.user.role,
+            "sub": str(user_id),  # Convert ObjectId to string
+            "email": email,
+            "role": role,
             "type": "access"
         }
         new_access_token = cls.create_access_token(access_token_data)
@@ -139,6 +262,7 @@ class TokenManager:
         try:
             user_obj_id = ObjectId(user_id)
             await RefreshToken.revoke_all_for_user(user_obj_id)
+            principal_cache.invalidate(user_obj_id)
         except InvalidId as e:
             logger.error(f"Invalid ObjectId format for user_id: {user_id}")
             raise HTTPException(
@@ -146,10 +270,85 @@ class TokenManager:
                 detail=f"Invalid user ID format: {str(e)}"
             )
 
-async def get_current_user(
+# Revocations recorded this long before the last sync are read again, in
+# case their insert was still in flight or the writer's clock runs behind
+REVOCATION_SYNC_OVERLAP_SECONDS = 30
+
+class RevocationSync:
+    """
+    Share access token revocations between workers through MongoDB.
+
+    revoke() rejects the token in this process at once and records it in
+    revoked_access_tokens until it expires. Every worker polls that
+    collection each JWT_REVOCATION_SYNC_SECONDS and adds new entries to its
+    verified token cache, which decode_token checks before any cached
+    payload. A starting worker loads every revocation that has not expired.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._synced_until: Optional[datetime] = None
+
+    async def revoke(self, token: str):
+        """Reject an access token in every worker until it expires."""
+        revoked = TokenManager.revoke_access_token(token)
+        if revoked is None:
+            return
+        key, expires_at = revoked
+        await RevokedAccessToken.get_motor_collection().update_one(
+            {"_id": key.hex()},
+            {"$setOnInsert": {
+                "expires_at": datetime.utcfromtimestamp(expires_at),
+                "revoked_at": datetime.utcnow()
+            }},
+            upsert=True
+        )
+
+    async def sync(self):
+        """Add revocations recorded since the last sync to the verified token cache."""
+        now = datetime.utcnow()
+        if self._synced_until is None:
+            query = {"expires_at": {"$gt": now}}
+        else:
+            query = {"revoked_at": {"$gte": self._synced_until - timedelta(seconds=REVOCATION_SYNC_OVERLAP_SECONDS)}}
+        async for doc in RevokedAccessToken.get_motor_collection().find(query, {"expires_at": 1}):
+            expires_at = doc["expires_at"].replace(tzinfo=timezone.utc).timestamp()
+            verified_tokens.revoke(bytes.fromhex(doc["_id"]), expires_at)
+        self._synced_until = now
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.JWT_REVOCATION_SYNC_SECONDS)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning(f"Access token revocation sync failed: {str(e)}")
+
+    async def start(self):
+        """Load current revocations and start polling for new ones."""
+        if self._task is not None:
+            return
+        try:
+            await self.sync()
+        except Exception as e:
+            logger.warning(f"Could not load access token revocations: {str(e)}")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+revocation_sync = RevocationSync()
+
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
-    """Dependency to get the current authenticated user."""
+) -> Principal:
+    """Dependency to get the authenticated caller, without loading the full user."""
     try:
         token = credentials.credentials
         payload = TokenManager.decode_token(token)
@@ -171,13 +370,6 @@ async def get_current_user(
         try:
             # Convert string to ObjectId
             user_obj_id = ObjectId(user_id)
-            user = await User.find_one(User.id == user_obj_id)
-            if user is None:
-                raise HTTPException(
-                    status_code=401,
-                    detail="User not found"
-                )
-            return user
         except InvalidId as e:
             logger.error(f"Invalid ObjectId format in token: {user_id}")
             raise HTTPException(
@@ -185,12 +377,33 @@ async def get_current_user(
                 detail=f"Invalid user ID format in token: {str(e)}"
             )
         
+        principal = await load_principal(user_obj_id)
+        if principal is None or principal.is_deleted:
+            raise HTTPException(
+                status_code=401,
+                detail="User not found"
+            )
+        return principal
+        
     except JWTError as e:
         raise HTTPException(
             status_code=401,
             detail=f"Could not validate credentials: {str(e)}"
         )
 
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal)
+) -> User:
+    """Dependency to get the current authenticated user's full document."""
+    user = await User.get(principal.id)
+    if user is None:
+        principal_cache.invalidate(principal.id)
+        raise HTTPException(
+            status_code=401,
+            detail="User not found"
+        )
+    return user
+
 # Optional dependency to get current user, returns None if not authenticated
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
@@ -199,13 +412,13 @@ async def get_optional_user(
     if not credentials:
         return None
     try:
-        return await get_current_user(credentials)
+        return await get_current_user(await get_current_principal(credentials))
     except HTTPException:
         return None
 
 async def get_admin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_principal)
+) -> Principal:
     """Get current user and verify they are an admin."""
     if current_user.role != "admin":
         raise HTTPException(
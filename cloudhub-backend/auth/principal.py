@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel
+
+from config.config import settings
+from models.user import User
+
+# The user fields a principal is built from
+PRINCIPAL_FIELDS = ("email", "role", "is_deleted", "account_locked", "account_locked_until")
+
+class Principal(BaseModel):
+    """
+    The authenticated caller: the few user fields authorization needs.
+
+    Handlers that only check who the caller is depend on this instead of the
+    full User document; load the User with User.get(principal.id) when the
+    profile itself is needed.
+    """
+    id: PydanticObjectId
+    email: str
+    role: str
+    is_deleted: bool = False
+    account_locked: bool = False
+    account_locked_until: Optional[datetime] = None
+
+    @property
+    def is_locked(self) -> bool:
+        return bool(
+            self.account_locked
+            and self.account_locked_until
+            and self.account_locked_until > datetime.utcnow()
+        )
+
+class PrincipalCache:
+    """
+    Per-process TTL cache of principals by user id.
+
+    Writes that change a principal's fields call invalidate(); other workers
+    keep their copy until it expires, so PRINCIPAL_CACHE_TTL_SECONDS bounds
+    how long a change takes to reach every process.
+    """
+
+    def __init__(self, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        # Bumped by every invalidation so loads racing with one are not cached
+        self.generation = 0
+
+    def get(self, user_id: str) -> Optional[Principal]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def set(self, user_id: str, principal: Principal, generation: int):
+        if self.ttl <= 0 or generation != self.generation:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id) -> None:
+        self.generation += 1
+        self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_TTL_SECONDS, settings.PRINCIPAL_CACHE_MAX_ENTRIES)
+
+async def load_principal(user_id: PydanticObjectId) -> Optional[Principal]:
+    """The principal for user_id from the cache, else from a projected users lookup."""
+    key = str(user_id)
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
+
+    generation = principal_cache.generation
+    document = await User.get_motor_collection().find_one(
+        {"_id": user_id},
+        {field: 1 for field in PRINCIPAL_FIELDS}
+    )
+    if document is None:
+        return None
+    principal = Principal(id=document["_id"], **{field: document[field] for field in PRINCIPAL_FIELDS if field in document})
+    principal_cache.set(key, principal, generation)
+    return principal
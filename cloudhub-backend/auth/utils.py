@@ -1,4 +1,34 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Optional
+
 import bcrypt
+from fastapi import HTTPException, status
+
+from config.config import settings
+from utils.metrics import Counter, Gauge, Histogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+PASSWORD_HASH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds", "Time bcrypt work waited for a pool thread.", ("operation",),
+    buckets=(0.001,) + PASSWORD_HASH_BUCKETS
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds", "Time spent running bcrypt.", ("operation",),
+    buckets=PASSWORD_HASH_BUCKETS
+)
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending", "bcrypt operations queued or running in the pool."
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total", "bcrypt operations rejected because the pool queue was full.", ("operation",)
+)
 
 def get_password_hash(password: str) -> str:
     """Generate a password hash using bcrypt."""
@@ -8,13 +38,13 @@ def get_password_hash(password: str) -> str:
             password = password.encode('utf-8')
             
         # Generate salt and hash
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password, salt)
         
         # Return as string
         return hashed.decode('utf-8')
     except Exception as e:
-        print(f"Error in get_password_hash: {str(e)}")
+        logger.exception("Error in get_password_hash")
         raise Exception(f"Failed to hash password: {str(e)}")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -29,5 +59,66 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         # Verify the password
         return bcrypt.checkpw(plain_password, hashed_password)
     except Exception as e:
-        print(f"Error in verify_password: {str(e)}")
-        raise Exception(f"Failed to verify password: {str(e)}") 
\ No newline at end of file
+        logger.exception("Error in verify_password")
+        raise Exception(f"Failed to verify password: {str(e)}")
+
+class PasswordHashPool:
+    """
+    Bounded thread pool for bcrypt, keeping it off the event loop.
+
+    bcrypt releases the GIL while hashing, so PASSWORD_HASH_WORKERS threads
+    hash in parallel while the loop keeps serving other requests. At most
+    PASSWORD_HASH_MAX_PENDING operations may be queued or running; beyond
+    that callers get a 503 instead of an ever-growing wait.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _timed(self, operation: str, queued_at: float, func, *args):
+        started = perf_counter()
+        PASSWORD_HASH_QUEUE_WAIT.observe(started - queued_at, operation)
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_DURATION.observe(perf_counter() - started, operation)
+
+    async def run(self, operation: str, func, *args):
+        """Run func(*args) in the pool, or raise 503 when the queue is full."""
+        if self.pending >= self.max_pending:
+            PASSWORD_HASH_REJECTED.inc(operation)
+            logger.warning(f"Password hash queue full ({self.pending} pending), rejecting {operation}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy. Please try again shortly.",
+                headers={"Retry-After": "1"}
+            )
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+
+        self.pending += 1
+        PASSWORD_HASH_PENDING.set(value=self.pending)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._timed, operation, perf_counter(), func, *args)
+        finally:
+            self.pending -= 1
+            PASSWORD_HASH_PENDING.set(value=self.pending)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+password_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
+async def hash_password(password: str) -> str:
+    """get_password_hash, run in the password hash pool."""
+    return await password_pool.run("hash", get_password_hash, password)
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password, run in the password hash pool."""
+    return await password_pool.run("verify", verify_password, plain_password, hashed_password)
@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = 1  # Server processes; ignored when DEBUG (reload) is on
     PROJECT_NAME: str = "CloudHub"
     VERSION: str = "1.0.0"
     API_PREFIX: str = "/api"
@@ -15,9 +16,20 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str
     DATABASE_NAME: str = "CloudHub"
+    # Pool sizes are totals for the host and are split across WORKERS
     MONGODB_MIN_POOL_SIZE: int = 10
     MONGODB_MAX_POOL_SIZE: int = 100
     MONGODB_MAX_IDLE_TIME_MS: int = 10000
+    DB_HEALTH_CHECK_INTERVAL_SECONDS: float = 5
+    DB_HEALTH_PING_TIMEOUT_SECONDS: float = 2
+    DB_HEALTH_FAILURE_THRESHOLD: int = 3
+    DB_HEALTH_RECOVERY_THRESHOLD: int = 2
+    INDEX_RECONCILE_LEASE_SECONDS: float = 600
+    INDEX_RECONCILE_FORCE: bool = False  # Reconcile indexes even if the fingerprint is unchanged
+    SLOW_QUERY_THRESHOLD_MS: float = 100  # 0 disables the slow-query log
+    SLOW_QUERY_LOG_SIZE: int = 500
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: float = 600  # Re-explain a query shape at most this often
     
     @validator("DATABASE_URL")
     def validate_database_url(cls, v: str) -> str:
@@ -30,6 +42,10 @@ class Settings(BaseSettings):
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     JWT_ALGORITHM: str = "HS256"
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # How long another worker may see a stale role or deleted flag
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    JWT_CACHE_MAX_ENTRIES: int = 10000  # Verified access token payloads kept per worker; 0 disables (revocations are kept regardless)
+    JWT_REVOCATION_SYNC_SECONDS: float = 1  # How long other workers may still accept a token revoked at logout
     
     # CORS settings
     CORS_ORIGINS: List[str] = ["*"]
@@ -41,17 +57,47 @@ class Settings(BaseSettings):
     BUNNYNET_PULL_ZONE: str = "https://cdn.lynq.ae"
     BUNNYNET_CDN_URL: str = "https://cdn.lynq.ae"
     
-    # Rate limiting
-    RATE_LIMIT_DEFAULT: str = "100/minute"
+    # Rate limiting (token buckets: "count/period", e.g. "5/minute" or "100/15minutes")
+    RATE_LIMIT_ENABLED: bool = True
+    # Budgets apply only to the routes declaring them (login, registration, uploads...)
+    RATE_LIMIT_DEFAULT: str = "100/minute"  # Budgets not listed in RATE_LIMITS
+    RATE_LIMITS: str = "login=10/minute,register=5/minute,refresh=30/minute,password=5/15minutes,upload=30/minute"
+    RATE_LIMIT_MAX_KEYS: int = 10000  # Buckets kept by the in-process fallback
+    # Must be on behind a reverse proxy, or every anonymous client shares the
+    # proxy's bucket; only enable it when the proxy sets X-Forwarded-For
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_RETRY_SECONDS: float = 5  # How often a Redis that failed mid-run is pinged before switching back
+    
+    # Response cache
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_MAX_ENTRIES: int = 2048
+    
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Bytes; smaller responses are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
     
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    LOG_FILE: str = "logs/app.log"
+    LOG_FILE: str = "logs/app.log"  # With WORKERS > 1 each worker writes its own file, pid added to the name
+    LOG_JSON: bool = True
+    LOG_LEVELS: str = ""  # Per-logger overrides, e.g. "beanie=WARNING,routes.hackathon=DEBUG"
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+    LOG_ERROR_SAMPLE_WINDOW_SECONDS: float = 60
+    LOG_ERROR_SAMPLE_BURST: int = 5
+    
+    # Metrics
+    METRICS_TOKEN: str = ""  # Bearer token for /metrics; unset disables it outside DEBUG
     
     # Security
     BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4  # Threads hashing passwords, per worker process
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Queued or running hashes before answering 503
     MAX_LOGIN_ATTEMPTS: int = 5
     PASSWORD_RESET_EXPIRE_HOURS: int = 24
     
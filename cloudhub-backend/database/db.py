@@ -1,34 +1,43 @@
-from typing import Optional
+from typing import Optional, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from config.config import settings
+from .monitoring import CommandMetricsListener, PoolMetricsListener, MONGO_POOL_MAX_SIZE
+from .slow_queries import slow_query_monitor
 import logging
 import traceback
 from bson import ObjectId
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)  # Changed to DEBUG level
 logger = logging.getLogger(__name__)
 
 # Global variables
 client: Optional[AsyncIOMotorClient] = None
 
+def pool_sizes() -> Tuple[int, int]:
+    """Per-process (min, max) pool size: the configured sizes split across WORKERS."""
+    workers = max(1, settings.WORKERS)
+    max_size = max(1, settings.MONGODB_MAX_POOL_SIZE // workers)
+    min_size = min(max_size, settings.MONGODB_MIN_POOL_SIZE // workers)
+    return min_size, max_size
+
 def get_db():
     """Get database client."""
     global client
     
     if client is None:
         try:
+            min_pool_size, max_pool_size = pool_sizes()
             logger.debug(f"Attempting to connect to MongoDB at: {settings.DATABASE_URL}")
             logger.debug(f"Database name: {settings.DATABASE_NAME}")
-            logger.debug(f"Connection settings: Pool Size: {settings.MONGODB_MIN_POOL_SIZE}-{settings.MONGODB_MAX_POOL_SIZE}, "
+            logger.debug(f"Connection settings: Pool Size: {min_pool_size}-{max_pool_size} per worker, "
                       f"Idle Time: {settings.MONGODB_MAX_IDLE_TIME_MS}ms")
             
             # Create MongoDB client with optimized connection settings
             client = AsyncIOMotorClient(
                 settings.DATABASE_URL,
-                minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
-                maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                minPoolSize=min_pool_size,
+                maxPoolSize=max_pool_size,
                 maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
                 serverSelectionTimeoutMS=30000,  # Increased to 30 seconds
                 connectTimeoutMS=30000,          # Increased to 30 seconds
@@ -41,8 +50,10 @@ def get_db():
                 maxConnecting=2,                 # Keep max concurrent connections
                 localThresholdMS=15,             # Keep local threshold
                 w="majority",                    # Added write concern
-                readPreference="primaryPreferred" # Added read preference
+                readPreference="primaryPreferred", # Added read preference
+                event_listeners=[CommandMetricsListener(), PoolMetricsListener(), slow_query_monitor]
             )
+            MONGO_POOL_MAX_SIZE.set(value=max_pool_size)
             
             try:
                 # Test connection
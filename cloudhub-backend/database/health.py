@@ -0,0 +1,125 @@
+import asyncio
+import logging
+from time import time
+from typing import Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config.config import settings
+from .db import test_connection
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class DatabaseHealthMonitor:
+    """
+    Tracks database availability from a background ping loop.
+
+    Availability only flips after DB_HEALTH_FAILURE_THRESHOLD consecutive
+    failed pings (or DB_HEALTH_RECOVERY_THRESHOLD consecutive successful
+    ones), so a single slow ping does not take the API down. Requests only
+    read the resulting state.
+    """
+
+    def __init__(self):
+        self.is_connected = False
+        self.beanie_initialized = False
+        self.last_check = 0.0
+        self.last_error: Optional[str] = None
+        self._failures = 0
+        self._successes = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_available(self) -> bool:
+        return self.is_connected and self.beanie_initialized
+
+    async def check(self, initial: bool = False) -> bool:
+        """Ping the database once and update the state with hysteresis."""
+        try:
+            ok = await asyncio.wait_for(test_connection(), settings.DB_HEALTH_PING_TIMEOUT_SECONDS)
+            self.last_error = None if ok else "Database ping failed"
+        except asyncio.TimeoutError:
+            ok = False
+            self.last_error = "Database ping timed out"
+        self.last_check = time()
+
+        if ok:
+            self._successes += 1
+            self._failures = 0
+            if not self.is_connected and (initial or self._successes >= settings.DB_HEALTH_RECOVERY_THRESHOLD):
+                self.is_connected = True
+                logger.info("Database connection available")
+        else:
+            self._failures += 1
+            self._successes = 0
+            if self.is_connected and self._failures >= settings.DB_HEALTH_FAILURE_THRESHOLD:
+                self.is_connected = False
+                logger.error(f"Database marked unavailable after {self._failures} failed checks: {self.last_error}")
+        return self.is_connected
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.DB_HEALTH_CHECK_INTERVAL_SECONDS)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"Database health check error: {str(e)}")
+
+    async def start(self):
+        """Seed the state with one check and start the background loop."""
+        await self.check(initial=True)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.is_connected = False
+        self.beanie_initialized = False
+
+db_health = DatabaseHealthMonitor()
+
+class DatabaseGateMiddleware:
+    """
+    Pure ASGI middleware answering 503 while the database is unavailable.
+
+    Only reads db_health, so requests never wait on a ping.
+    """
+
+    EXEMPT_PREFIXES = ("/static", "/_next")
+    EXEMPT_PATHS = {"/health", "/metrics", "/favicon.ico"}
+
+    def __init__(self, app: ASGIApp, monitor: DatabaseHealthMonitor = db_health):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self.monitor.is_available or self._is_exempt(scope):
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            status_code=503,
+            content={
+                "status": "error",
+                "message": "Database connection not ready. Please try again in a few seconds.",
+                "error": self.monitor.last_error or "Database is not connected"
+            },
+            headers={"Retry-After": str(max(1, int(settings.DB_HEALTH_CHECK_INTERVAL_SECONDS)))}
+        )
+        await response(scope, receive, send)
+
+    def _is_exempt(self, scope: Scope) -> bool:
+        path = scope["path"]
+        return (
+            scope["method"] == "OPTIONS"
+            or path in self.EXEMPT_PATHS
+            or path.startswith(self.EXEMPT_PREFIXES)
+        )
@@ -0,0 +1,38 @@
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+# Collection holding one document per lease: {_id: name, owner, expires_at};
+# the scheduler also keeps each job's last_run_at on its lease
+LEASE_COLLECTION = "leases"
+
+# Identifies this process as a lease owner
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+async def acquire_lease(database, name: str, ttl_seconds: float, owner: str = WORKER_ID) -> bool:
+    """
+    Take or renew the named lease for ttl_seconds.
+
+    Succeeds if the lease is free, expired or already held by owner. The
+    _id unique index makes concurrent attempts race safely: at most one
+    upsert wins and the others get a DuplicateKeyError.
+    """
+    now = datetime.utcnow()
+    try:
+        await database[LEASE_COLLECTION].find_one_and_update(
+            {"_id": name, "$or": [{"owner": owner}, {"expires_at": {"$lte": now}}]},
+            {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=ttl_seconds), "renewed_at": now}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        return False
+    return True
+
+async def release_lease(database, name: str, owner: str = WORKER_ID):
+    """Give up the named lease if owner still holds it."""
+    await database[LEASE_COLLECTION].delete_one({"_id": name, "owner": owner})
@@ -0,0 +1,98 @@
+import threading
+from time import perf_counter
+
+from pymongo import monitoring
+
+from utils.metrics import Counter, Gauge, Histogram
+
+MONGO_COMMAND_LATENCY = Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command latency by command name.", ("command",)
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures_total", "Failed MongoDB commands by command name.", ("command",)
+)
+MONGO_POOL_CHECKOUT_WAIT = Histogram(
+    "mongodb_pool_checkout_wait_seconds", "Time spent waiting to check a connection out of the pool.", ("address",)
+)
+MONGO_POOL_CHECKOUT_FAILURES = Counter(
+    "mongodb_pool_checkout_failures_total", "Connection checkouts that failed, by reason.", ("address", "reason")
+)
+MONGO_POOL_CONNECTIONS = Gauge(
+    "mongodb_pool_connections", "Open connections per pool.", ("address",)
+)
+MONGO_POOL_CHECKED_OUT = Gauge(
+    "mongodb_pool_checked_out_connections", "Connections currently checked out per pool.", ("address",)
+)
+MONGO_POOL_MAX_SIZE = Gauge(
+    "mongodb_pool_max_size", "Configured maxPoolSize."
+)
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Record MongoDB command durations reported by the driver."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        MONGO_COMMAND_LATENCY.observe(event.duration_micros / 1_000_000, event.command_name)
+
+    def failed(self, event):
+        MONGO_COMMAND_LATENCY.observe(event.duration_micros / 1_000_000, event.command_name)
+        MONGO_COMMAND_FAILURES.inc(event.command_name)
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """
+    Track pool sizes and checkout wait times from CMAP events.
+
+    A checkout starts and completes on the same driver thread, so the start
+    time is kept in a thread-local.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        MONGO_POOL_CONNECTIONS.set(_address(event), value=0)
+        MONGO_POOL_CHECKED_OUT.set(_address(event), value=0)
+
+    def connection_created(self, event):
+        MONGO_POOL_CONNECTIONS.inc(_address(event))
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        MONGO_POOL_CONNECTIONS.dec(_address(event))
+
+    def connection_check_out_started(self, event):
+        self._local.checkout_started = perf_counter()
+
+    def connection_check_out_failed(self, event):
+        self._observe_wait(event)
+        MONGO_POOL_CHECKOUT_FAILURES.inc(_address(event), str(event.reason))
+
+    def connection_checked_out(self, event):
+        self._observe_wait(event)
+        MONGO_POOL_CHECKED_OUT.inc(_address(event))
+
+    def connection_checked_in(self, event):
+        MONGO_POOL_CHECKED_OUT.dec(_address(event))
+
+    def _observe_wait(self, event):
+        started = getattr(self._local, "checkout_started", None)
+        if started is not None:
+            MONGO_POOL_CHECKOUT_WAIT.observe(perf_counter() - started, _address(event))
+            self._local.checkout_started = None
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import List, Type
+
+from beanie import Document
+from beanie.odm.utils.init import Initializer
+from beanie.odm.utils.pydantic import get_model_fields
+from beanie.odm.utils.typing import get_index_attributes
+from pymongo import IndexModel
+
+from config.config import settings
+from .leases import WORKER_ID, acquire_lease, release_lease
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Collection holding the fingerprint of the last applied index declarations
+SCHEMA_COLLECTION = "schema_state"
+INDEX_STATE_ID = "indexes"
+INDEX_LEASE_NAME = "index-reconcile"
+
+class _Initializer(Initializer):
+    """Beanie initializer that can skip index reconciliation (Beanie 1.25 has no skip_indexes)."""
+
+    def __init__(self, *args, skip_indexes: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.skip_indexes = skip_indexes
+
+    async def init_indexes(self, cls, allow_index_dropping: bool = False):
+        if not self.skip_indexes:
+            await super().init_indexes(cls, allow_index_dropping)
+
+def _normalize_index(index) -> list:
+    if isinstance(index, IndexModel):
+        document = dict(index.document)
+        # Key order matters for compound indexes, so keep it as a list
+        document["key"] = list(document["key"].items())
+        return sorted(document.items())
+    if isinstance(index, str):
+        return [("key", [(index, 1)])]
+    return [("key", [tuple(item) if isinstance(item, (list, tuple)) else (item, 1) for item in index])]
+
+def index_fingerprint(document_models: List[Type[Document]]) -> str:
+    """Hash the collection names and index declarations of the given models."""
+    declarations = []
+    for model in document_models:
+        model_settings = getattr(model, "Settings", None)
+        indexed_fields = sorted(
+            (name, repr(attributes))
+            for name, field in get_model_fields(model).items()
+            if (attributes := get_index_attributes(field)) is not None
+        )
+        declarations.append({
+            "collection": getattr(model_settings, "name", None) or model.__name__,
+            "indexes": [_normalize_index(index) for index in getattr(model_settings, "indexes", None) or []],
+            "indexed_fields": indexed_fields
+        })
+    declarations.sort(key=lambda declaration: declaration["collection"])
+    payload = json.dumps(declarations, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+async def init_models(database, document_models: List[Type[Document]]):
+    """
+    Initialize Beanie, reconciling indexes only when their declarations changed.
+
+    The fingerprint of the last applied declarations is stored in Mongo. When
+    it differs, the process that wins the index-reconcile lease builds (and
+    drops) indexes and records the new fingerprint; every other process
+    initializes Beanie without touching indexes and starts immediately.
+    """
+    fingerprint = index_fingerprint(document_models)
+    state = await database[SCHEMA_COLLECTION].find_one({"_id": INDEX_STATE_ID})
+
+    if state and state.get("fingerprint") == fingerprint and not settings.INDEX_RECONCILE_FORCE:
+        logger.info("Index declarations unchanged; skipping index reconciliation")
+        await _Initializer(database=database, document_models=document_models, skip_indexes=True)
+        return
+
+    if not await acquire_lease(database, INDEX_LEASE_NAME, settings.INDEX_RECONCILE_LEASE_SECONDS):
+        logger.info("Index reconciliation is running in another process; starting without it")
+        await _Initializer(database=database, document_models=document_models, skip_indexes=True)
+        return
+
+    try:
+        logger.info(f"Reconciling indexes for fingerprint {fingerprint[:12]}")
+        await _Initializer(database=database, document_models=document_models, allow_index_dropping=True)
+        await database[SCHEMA_COLLECTION].update_one(
+            {"_id": INDEX_STATE_ID},
+            {"$set": {"fingerprint": fingerprint, "applied_at": datetime.utcnow(), "applied_by": WORKER_ID}},
+            upsert=True
+        )
+    finally:
+        await release_lease(database, INDEX_LEASE_NAME)
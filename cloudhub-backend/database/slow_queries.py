@@ -0,0 +1,279 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+from pymongo import monitoring
+
+from config.config import settings
+from utils.metrics import current_route
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Commands whose plan can be explained
+EXPLAINABLE_COMMANDS = {"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"}
+
+# Fields the driver adds to a command that explain does not accept
+_DRIVER_FIELDS = {
+    "lsid", "$db", "$clusterTime", "$readPreference", "txnNumber", "autocommit",
+    "startTransaction", "readConcern", "writeConcern", "apiVersion", "apiStrict",
+    "apiDeprecationErrors"
+}
+
+# Explain output that is not part of the winning plan
+_SKIPPED_EXPLAIN_FIELDS = {"rejectedPlans", "command", "serverInfo", "serverParameters"}
+
+MAX_TRACKED_SHAPES = 1000
+MAX_ROUTES_PER_SHAPE = 10
+EXPLAIN_QUEUE_SIZE = 100
+
+def _shape(value: Any) -> Any:
+    """Replace the values in a filter with "?", keeping field names and operators."""
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+        # $and / $or / $nor hold sub-filters
+        return [_shape(item) for item in value]
+    return "?"
+
+def command_shape(name: str, command: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe a command by collection, filter shape and sort, without its values."""
+    shape = {"command": name, "collection": command.get(name)}
+    if name == "find":
+        shape["filter"] = _shape(command.get("filter", {}))
+        if command.get("sort"):
+            shape["sort"] = dict(command["sort"])
+    elif name == "aggregate":
+        shape["pipeline"] = [_shape(stage) for stage in command.get("pipeline", [])]
+    elif name in ("count", "distinct"):
+        shape["filter"] = _shape(command.get("query", {}))
+        if name == "distinct":
+            shape["key"] = command.get("key")
+    elif name == "findAndModify":
+        shape["filter"] = _shape(command.get("query", {}))
+        if command.get("sort"):
+            shape["sort"] = dict(command["sort"])
+    elif name in ("update", "delete"):
+        statements = command.get(f"{name}s") or [{}]
+        shape["filter"] = _shape(statements[0].get("q", {}))
+    return shape
+
+def summarize_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the winning plan's stages and indexes from explain output."""
+    stages: List[str] = []
+    indexes: List[str] = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in _SKIPPED_EXPLAIN_FIELDS:
+                    continue
+                if key == "stage" and isinstance(value, str):
+                    stages.append(value)
+                elif key == "indexName" and isinstance(value, str):
+                    indexes.append(value)
+                elif key == "$sort":
+                    # Aggregation $sort that was not pushed down into the query
+                    stages.append("$sort")
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(explain)
+    stages = list(dict.fromkeys(stages))
+    return {
+        "stages": stages,
+        "indexes": list(dict.fromkeys(indexes)),
+        "collscan": "COLLSCAN" in stages,
+        "in_memory_sort": "SORT" in stages or "$sort" in stages
+    }
+
+class SlowQueryMonitor(monitoring.CommandListener):
+    """
+    Record MongoDB commands slower than SLOW_QUERY_THRESHOLD_MS.
+
+    Each slow command is logged with its query shape (values stripped) and
+    the route that issued it, kept in a rolling in-memory log, and
+    aggregated per shape. A background task explains each shape at most once
+    per SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS and flags collection scans and
+    in-memory sorts.
+    """
+
+    def __init__(self):
+        self.recent = deque(maxlen=settings.SLOW_QUERY_LOG_SIZE)
+        self.shapes: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # CommandListener interface; called on the driver's threads
+
+    def started(self, event):
+        if settings.SLOW_QUERY_THRESHOLD_MS > 0 and event.command_name in EXPLAINABLE_COMMANDS:
+            self._pending[(event.connection_id, event.request_id)] = (
+                event.database_name, event.command, current_route()
+            )
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool):
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        duration_ms = event.duration_micros / 1000
+        if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+            database, command, route = pending
+            self.record(event.command_name, database, command, duration_ms, route, failed)
+
+    def record(
+        self,
+        name: str,
+        database: str,
+        command: Dict[str, Any],
+        duration_ms: float,
+        route: Optional[str] = None,
+        failed: bool = False
+    ):
+        """Add a slow command to the log and schedule an explain of its shape if due."""
+        shape = command_shape(name, command)
+        key = json.dumps(shape, sort_keys=True, default=str)
+        route = route or "background"
+        now = datetime.utcnow()
+        explain_due = False
+
+        with self._lock:
+            self.recent.append({
+                **shape,
+                "database": database,
+                "duration_ms": round(duration_ms, 1),
+                "route": route,
+                "failed": failed,
+                "time": now
+            })
+
+            stats = self.shapes.get(key)
+            if stats is None and len(self.shapes) < MAX_TRACKED_SHAPES:
+                stats = self.shapes[key] = {
+                    **shape,
+                    "database": database,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "routes": [],
+                    "plan": None,
+                    "explained_at": None,
+                    "_explain_requested": None
+                }
+            if stats is not None:
+                stats["count"] += 1
+                stats["total_ms"] = round(stats["total_ms"] + duration_ms, 1)
+                stats["max_ms"] = max(stats["max_ms"], round(duration_ms, 1))
+                stats["last_seen"] = now
+                if route not in stats["routes"] and len(stats["routes"]) < MAX_ROUTES_PER_SHAPE:
+                    stats["routes"].append(route)
+
+                requested = stats["_explain_requested"]
+                if settings.SLOW_QUERY_EXPLAIN and (
+                    requested is None or monotonic() - requested >= settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS
+                ):
+                    stats["_explain_requested"] = monotonic()
+                    explain_due = True
+
+        logger.warning(
+            f"Slow MongoDB {name} on {database}.{shape['collection']} took {duration_ms:.1f} ms ({route})",
+            extra={"query_shape": shape, "duration_ms": round(duration_ms, 1), "route": route}
+        )
+
+        if explain_due and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._enqueue, (key, database, name, command))
+
+    def _enqueue(self, item: tuple):
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            with self._lock:
+                stats = self.shapes.get(item[0])
+                if stats is not None:
+                    stats["_explain_requested"] = None
+
+    # Background explain
+
+    async def _explain(self, database: str, name: str, command: Dict[str, Any]) -> Dict[str, Any]:
+        from .db import get_db
+
+        explain_command = {key: value for key, value in command.items() if key not in _DRIVER_FIELDS}
+        if name in ("update", "delete"):
+            # explain accepts a single statement
+            explain_command[f"{name}s"] = explain_command[f"{name}s"][:1]
+        result = await get_db()[database].command({"explain": explain_command, "verbosity": "queryPlanner"})
+        return summarize_plan(result)
+
+    async def _run(self):
+        while True:
+            key, database, name, command = await self._queue.get()
+            try:
+                plan = await self._explain(database, name, command)
+            except Exception as e:
+                plan = {"error": str(e)}
+
+            with self._lock:
+                stats = self.shapes.get(key)
+                if stats is not None:
+                    stats["plan"] = plan
+                    stats["explained_at"] = datetime.utcnow()
+
+            if plan.get("collscan") or plan.get("in_memory_sort"):
+                problems = [label for flag, label in (("collscan", "COLLSCAN"), ("in_memory_sort", "in-memory sort")) if plan.get(flag)]
+                logger.warning(
+                    f"Slow query plan uses {' and '.join(problems)}: {key}",
+                    extra={"plan": plan}
+                )
+
+    async def start(self):
+        """Start the background explain task."""
+        if self._task is None and settings.SLOW_QUERY_EXPLAIN:
+            self._loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._loop = None
+
+    def report(self, limit: int = 50) -> Dict[str, Any]:
+        """Slowest query shapes by total time, and the most recent slow commands."""
+        with self._lock:
+            shapes = sorted(self.shapes.values(), key=lambda stats: stats["total_ms"], reverse=True)[:limit]
+            shapes = [{key: value for key, value in stats.items() if not key.startswith("_")} for stats in shapes]
+            recent = list(self.recent)[-limit:][::-1]
+        return {
+            "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+            "shapes": shapes,
+            "recent": recent
+        }
+
+    def reset(self):
+        with self._lock:
+            self.recent.clear()
+            self.shapes.clear()
+
+slow_query_monitor = SlowQueryMonitor()
@@ -1,12 +1,14 @@
+import asyncio
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import Field, HttpUrl
-from beanie import Document, Link, before_event, Replace, Insert
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import BaseModel, Field, HttpUrl
+from beanie import Document, Link, before_event, Replace, Insert, PydanticObjectId
 from models.base import BaseModel as BaseDBModel
 from enum import Enum
 from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
 from bson import ObjectId
 from utils.code_generator import generate_access_code
+from services.cache_service import response_cache, hackathon_tag
 
 class HackathonStatus(str, Enum):
     DRAFT = "draft"
@@ -63,6 +65,76 @@ class Challenge(BaseDBModel):
     title: str = Field(..., min_length=1)
     description: str = Field(..., min_length=1)
 
+# Sort options of the public discovery listing: name -> (field, direction)
+DISCOVERY_SORTS = {
+    "start_date": ("timeline.event_start", ASCENDING),
+    "prize_pool": ("total_prize_pool", DESCENDING),
+    "created_at": ("created_at", DESCENDING),
+}
+
+# Equality filters of the discovery listing that get their own index prefix
+DISCOVERY_FILTERS = {
+    "all": [],
+    "status": [("status", ASCENDING)],
+    "featured": [("is_featured", ASCENDING)],
+    "tag": [("tags", ASCENDING)],
+}
+
+def discovery_query(
+    status: Optional[str] = None,
+    tag: Optional[str] = None,
+    featured: Optional[bool] = None,
+    starts_after: Optional[datetime] = None,
+    starts_before: Optional[datetime] = None,
+    sort: str = "start_date"
+) -> Tuple[Dict[str, Any], str, int]:
+    """
+    Build the discovery listing query, returning (query, sort field, direction).
+
+    Only combinations an idx_hackathon_discovery_* index serves without a
+    scan or in-memory sort are accepted: at most one equality filter, and
+    a start date range only when sorting by start date. Anything else
+    raises ValueError.
+    """
+    if sort not in DISCOVERY_SORTS:
+        raise ValueError(f"Invalid sort. Use one of: {', '.join(DISCOVERY_SORTS)}")
+    filters = {"status": status, "tag": tag, "featured": featured}
+    used = [name for name, value in filters.items() if value is not None]
+    if len(used) > 1:
+        raise ValueError(f"Filter by at most one of: {', '.join(filters)}")
+    if (starts_after or starts_before) and sort != "start_date":
+        raise ValueError("starts_after and starts_before require sort=start_date")
+
+    query: Dict[str, Any] = {"is_deleted": False, "is_private": False}
+    if status is not None:
+        query["status"] = status
+    if tag is not None:
+        query["tags"] = tag
+    if featured is not None:
+        query["is_featured"] = featured
+    if starts_after or starts_before:
+        query["timeline.event_start"] = {}
+        if starts_after:
+            query["timeline.event_start"]["$gte"] = starts_after
+        if starts_before:
+            query["timeline.event_start"]["$lt"] = starts_before
+
+    sort_field, direction = DISCOVERY_SORTS[sort]
+    return query, sort_field, direction
+
+def _discovery_indexes() -> List[IndexModel]:
+    """One compound index per discovery filter/sort combination."""
+    indexes = []
+    for filter_name, filter_keys in DISCOVERY_FILTERS.items():
+        for sort_name, (sort_field, direction) in DISCOVERY_SORTS.items():
+            indexes.append(IndexModel(
+                [("is_deleted", ASCENDING), ("is_private", ASCENDING)]
+                + filter_keys
+                + [(sort_field, direction), ("_id", direction)],
+                name=f"idx_hackathon_discovery_{filter_name}_{sort_name}"
+            ))
+    return indexes
+
 class Hackathon(Document):
     """Hackathon model."""
     
@@ -110,6 +182,7 @@ class Hackathon(Document):
     active_participants: int = Field(default=0)
     submitted_projects: int = Field(default=0)
     total_teams: int = Field(default=0)
+    counters_updated_at: Optional[datetime] = None  # Last $inc of a statistics counter
     
     # Billing
     billing: BillingInfo
@@ -133,9 +206,30 @@ class Hackathon(Document):
         indexes = [
             # Basic indexes
             IndexModel([("slug", 1)], unique=True, name="idx_hackathon_slug_unique"),
-            IndexModel([("organizer_id", 1)], name="idx_hackathon_organizer"),
             IndexModel([("status", 1)], name="idx_hackathon_status"),
-            IndexModel([("is_featured", 1)], name="idx_hackathon_featured"),
+            # Keyset pagination indexes for (created_at, _id) ordering
+            IndexModel(
+                [("organizer_id", 1), ("created_at", -1), ("_id", -1)],
+                name="idx_hackathon_organizer_created"
+            ),
+            IndexModel(
+                [("organizer_id", 1), ("status", 1), ("created_at", -1), ("_id", -1)],
+                name="idx_hackathon_organizer_status_created"
+            ),
+            IndexModel(
+                [("management_team", 1), ("created_at", -1), ("_id", -1)],
+                name="idx_hackathon_management_created"
+            ),
+            IndexModel(
+                [("collaborators", 1), ("created_at", -1), ("_id", -1)],
+                name="idx_hackathon_collaborators_created"
+            ),
+            IndexModel(
+                [("co_organizers", 1), ("created_at", -1), ("_id", -1)],
+                name="idx_hackathon_co_organizers_created"
+            ),
+            # Public discovery listing
+            *_discovery_indexes(),
             # Text search index
             IndexModel(
                 [("title", "text"), ("description", "text")],
@@ -237,29 +331,42 @@ class Hackathon(Document):
         self.generate_access_code_if_needed()
 
     async def update_counts(self):
-        """Update participant counts."""
-        from models.user import User
+        """Recount registrations, teams and submitted projects into the statistics counters."""
+        from models.registration import HackathonRegistration
         from models.team import Team
         from models.project import Project
         
-        # Update participant count
-        self.participant_count = await User.find(
-            User.active_hackathons.contains(str(self.id))
-        ).count()
+        hackathon_key = str(self.id)
+        registered, teams, submitted = await asyncio.gather(
+            HackathonRegistration.find({"hackathon_id": hackathon_key}).count(),
+            Team.find({"hackathon_id": hackathon_key, "is_deleted": False}).count(),
+            Project.find(
+                Project.hackathon.id == self.id,
+                Project.is_deleted == False,
+                Project.status != "draft"
+            ).count()
+        )
         
-        # Update team count
-        self.team_count = await Team.find(
-            Team.hackathon.id == str(self.id),
-            Team.is_deleted == False
-        ).count()
-        
-        # Update submission count
-        self.submission_count = await Project.find(
-            Project.hackathon.id == str(self.id),
-            Project.is_deleted == False
-        ).count()
+        await self.set({
+            "registered_participants": registered,
+            "total_teams": teams,
+            "submitted_projects": submitted
+        })
+    
+    @classmethod
+    async def increment_counters(cls, hackathon_id: str, **deltas: int):
+        """
+        Atomically adjust statistics counters at the point of change,
+        e.g. increment_counters(hackathon_id, total_teams=1).
         
-        await self.save()
+        Drift from failed requests is repaired by tasks.counters. Cached
+        responses showing the counters are invalidated.
+        """
+        await cls.find_one({"_id": PydanticObjectId(hackathon_id)}).update({
+            "$inc": deltas,
+            "$set": {"counters_updated_at": datetime.utcnow()}
+        })
+        await response_cache.invalidate(hackathon_tag(hackathon_id))
     
     def update_progress(self):
         """Update hackathon progress based on timeline."""
@@ -299,4 +406,117 @@ class Hackathon(Document):
         return await cls.find(
             cls.status == HackathonStatus.COMPLETED,
             cls.is_deleted == False
-        ).to_list()
\ No newline at end of file
+        ).to_list()
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() + 'Z' if value else None
+
+class CardTimeline(BaseModel):
+    """Timeline dates shown on hackathon cards."""
+    registration_end: Optional[datetime] = None
+    event_start: Optional[datetime] = None
+    event_end: Optional[datetime] = None
+
+class HackathonCard(BaseModel):
+    """
+    Read-only summary of a hackathon for list endpoints.
+
+    Loaded through a Mongo projection with Hackathon.find(...).project(HackathonCard),
+    so prizes, billing, rules and other heavy fields never leave the database and
+    no Beanie document state is tracked. URLs are kept as plain strings.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    title: str = ""
+    description: str = ""
+    short_description: str = ""
+    cover_image: Optional[str] = None
+    banner_image: Optional[str] = None
+    organizer_id: Optional[str] = None
+    organization_name: str = ""
+    organization_logo: Optional[str] = None
+    management_team: List[str] = Field(default_factory=list)
+    collaborators: List[str] = Field(default_factory=list)
+    co_organizers: List[str] = Field(default_factory=list)
+    status: str = HackathonStatus.DRAFT.value
+    max_participants: int = 100
+    total_prize_pool: float = 0
+    timeline: Optional[CardTimeline] = None
+    registered_participants: int = 0
+    submitted_projects: int = 0
+    total_teams: int = 0
+    tags: List[str] = Field(default_factory=list)
+    is_featured: bool = False
+    is_private: bool = False
+    created_at: Optional[datetime] = None
+    
+    class Settings:
+        projection = {
+            "_id": 1,
+            "title": 1,
+            "description": 1,
+            "short_description": 1,
+            "cover_image": 1,
+            "banner_image": 1,
+            "organizer_id": 1,
+            "organization_name": 1,
+            "organization_logo": 1,
+            "management_team": 1,
+            "collaborators": 1,
+            "co_organizers": 1,
+            "status": 1,
+            "max_participants": 1,
+            "total_prize_pool": 1,
+            "timeline.registration_end": 1,
+            "timeline.event_start": 1,
+            "timeline.event_end": 1,
+            "registered_participants": 1,
+            "submitted_projects": 1,
+            "total_teams": 1,
+            "tags": 1,
+            "is_featured": 1,
+            "is_private": 1,
+            "created_at": 1,
+        }
+    
+    def get_sort_value(self, field: str) -> Any:
+        """Resolve a dotted sort field such as timeline.event_start."""
+        value = self
+        for part in field.split("."):
+            value = getattr(value, part, None)
+        return value
+    
+    def to_dict(self) -> dict:
+        """Convert to the same keys Hackathon.to_dict() uses for these fields."""
+        timeline_dict = None
+        if self.timeline:
+            timeline_dict = {
+                'registration_end': _iso(self.timeline.registration_end),
+                'event_start': _iso(self.timeline.event_start),
+                'event_end': _iso(self.timeline.event_end),
+            }
+        
+        return {
+            'id': str(self.id),
+            'title': self.title,
+            'description': self.description,
+            'short_description': self.short_description,
+            'cover_image': self.cover_image,
+            'banner_image': self.banner_image,
+            'organizer_id': self.organizer_id,
+            'organization_name': self.organization_name,
+            'organization_logo': self.organization_logo,
+            'management_team': self.management_team,
+            'collaborators': self.collaborators,
+            'co_organizers': self.co_organizers,
+            'status': self.status,
+            'max_participants': self.max_participants,
+            'total_prize_pool': float(self.total_prize_pool),
+            'timeline': timeline_dict,
+            'registered_participants': self.registered_participants,
+            'submitted_projects': self.submitted_projects,
+            'total_teams': self.total_teams,
+            'tags': self.tags,
+            'is_featured': self.is_featured,
+            'is_private': self.is_private,
+            'created_at': _iso(self.created_at),
+        }
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from beanie import Document
 from pydantic import Field
+from pymongo import IndexModel
 
 class PendingHackathon(Document):
     """Model for storing pending hackathon data before payment confirmation."""
@@ -23,6 +24,11 @@ class PendingHackathon(Document):
         indexes = [
             "checkout_id",
             "created_at",
-            "expires_at",
-            "is_processed"
+            # Mongo deletes unpaid checkouts once they expire; processed ones are kept
+            IndexModel(
+                [("expires_at", 1)],
+                expireAfterSeconds=0,
+                partialFilterExpression={"is_processed": False},
+                name="ttl_pending_hackathon_expires"
+            )
         ] 
\ No newline at end of file
@@ -74,6 +74,16 @@ class Project(BaseDBModel):
             )
         ]
     
+    @property
+    def team_id(self) -> str:
+        """ID of the linked team."""
+        return str(self.team.ref.id if isinstance(self.team, Link) else self.team.id)
+    
+    @property
+    def hackathon_id(self) -> str:
+        """ID of the linked hackathon."""
+        return str(self.hackathon.ref.id if isinstance(self.hackathon, Link) else self.hackathon.id)
+    
     async def submit(self):
         """Submit the project for review."""
         if self.status == 'draft':
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+from beanie import Document
+from pymongo import DESCENDING, IndexModel
+
+from utils.pagination import with_cursor, keyset_sort
+
+class HackathonRegistration(Document):
+    """A participant's registration for a hackathon, one document per (hackathon, user)."""
+
+    hackathon_id: str = Field(..., description="ID of the hackathon")
+    user_id: str = Field(..., description="ID of the registered user")
+    registered_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "hackathon_registrations"
+        indexes = [
+            IndexModel(
+                [("hackathon_id", 1), ("user_id", 1)],
+                unique=True,
+                name="idx_registration_hackathon_user"
+            ),
+            IndexModel(
+                [("hackathon_id", 1), ("registered_at", DESCENDING), ("_id", DESCENDING)],
+                name="idx_registration_hackathon_registered"
+            ),
+            IndexModel(
+                [("user_id", 1), ("registered_at", DESCENDING), ("_id", DESCENDING)],
+                name="idx_registration_user_registered"
+            )
+        ]
+
+    @classmethod
+    async def page_for_hackathon(
+        cls,
+        hackathon_id: str,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> List["HackathonRegistration"]:
+        """
+        Return up to limit registrations for a hackathon, newest first,
+        starting after the given cursor.
+        """
+        query: Dict[str, Any] = with_cursor({"hackathon_id": hackathon_id}, "registered_at", cursor)
+        return await cls.find(query).sort(keyset_sort("registered_at")).limit(limit).to_list()
+
+    @classmethod
+    async def is_registered(cls, hackathon_id: str, user_id: str) -> bool:
+        """Check whether a user is registered for a hackathon."""
+        return await cls.find_one({"hackathon_id": hackathon_id, "user_id": user_id}) is not None
+
+    def to_dict(self) -> dict:
+        """Convert the registration to a dictionary."""
+        return {
+            'id': str(self.id),
+            'hackathon_id': self.hackathon_id,
+            'user_id': self.user_id,
+            'registered_at': self.registered_at.isoformat() + 'Z'
+        }
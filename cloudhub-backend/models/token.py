@@ -8,6 +8,9 @@ import hashlib
 import secrets
 from beanie.odm.fields import IndexModel
 
+# How long revoked tokens are kept for reuse detection and session history
+REVOKED_TOKEN_RETENTION_SECONDS = 30 * 24 * 3600
+
 class RefreshToken(Document):
     id: UUID = Field(default_factory=uuid4)
     user: Link[User]
@@ -19,6 +22,9 @@ class RefreshToken(Document):
     device_info: Dict = Field(default_factory=dict)
     token_family: UUID = Field(default_factory=uuid4)  # For tracking token lineage
     previous_token: Optional[UUID] = None  # For token rotation tracking
+    # Access token claims, so rotation does not need to load the user
+    user_email: Optional[str] = None
+    user_role: Optional[str] = None
     
     class Settings:
         name = "refresh_tokens"
@@ -27,7 +33,15 @@ class RefreshToken(Document):
             IndexModel([("token_hash", 1)], name="idx_refresh_token_hash"),
             IndexModel([("token_family", 1)], name="idx_refresh_token_family"),
             IndexModel([("user", 1), ("token_family", 1)], name="idx_refresh_token_user_family"),
-            IndexModel([("token_hash", 1), ("revoked", 1)], unique=True, name="idx_refresh_token_hash_revoked")
+            IndexModel([("token_hash", 1), ("revoked", 1)], unique=True, name="idx_refresh_token_hash_revoked"),
+            # Mongo's TTL monitor deletes expired tokens, and revoked ones after the retention period
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0, name="ttl_refresh_token_expires"),
+            IndexModel(
+                [("revoked_at", 1)],
+                expireAfterSeconds=REVOKED_TOKEN_RETENTION_SECONDS,
+                partialFilterExpression={"revoked": True},
+                name="ttl_refresh_token_revoked"
+            )
         ]
     
     @classmethod
@@ -45,7 +59,9 @@ class RefreshToken(Document):
                 user=user,
                 token_hash=token_hash,
                 expires_at=datetime.utcnow() + timedelta(days=expires_in_days),
-                device_info=device_info
+                device_info=device_info,
+                user_email=user.email,
+                user_role=user.role
             )
             
             # Save to database
@@ -121,12 +137,65 @@ class RefreshToken(Document):
         return raw_token, new_token
     
     @classmethod
-    async def cleanup_expired(cls):
-        """Remove expired and revoked tokens older than 30 days."""
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        await cls.find({
-            "$or": [
-                {"expires_at": {"$lt": datetime.utcnow()}},
-                {"revoked": True, "revoked_at": {"$lt": thirty_days_ago}}
-            ]
-        }).delete() 
\ No newline at end of file
+    async def rotate_token(
+        cls, token: str, device_info: Dict, expires_in_days: int = 30
+    ) -> Optional[Tuple[str, "RefreshToken"]]:
+        """
+        Atomically revoke a valid refresh token and issue its successor.
+
+        The old token is revoked by a single conditional find_one_and_update,
+        so of two concurrent refreshes with the same token only one succeeds.
+        Presenting a token that was already revoked is treated as reuse of a
+        stolen token: its whole family is revoked and None is returned.
+        """
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        now = datetime.utcnow()
+        collection = cls.get_motor_collection()
+
+        old = await collection.find_one_and_update(
+            {"token_hash": token_hash, "revoked": False, "expires_at": {"$gt": now}},
+            {"$set": {"revoked": True, "revoked_at": now}},
+            projection={"user": 1, "token_family": 1, "user_email": 1, "user_role": 1}
+        )
+        if old is None:
+            # Only failed refreshes pay for reuse detection
+            reused = await collection.find_one(
+                {"token_hash": token_hash, "revoked": True},
+                projection={"token_family": 1}
+            )
+            if reused is not None:
+                await collection.update_many(
+                    {"token_family": reused["token_family"], "revoked": False},
+                    {"$set": {"revoked": True, "revoked_at": now}}
+                )
+            return None
+
+        raw_token = secrets.token_urlsafe(64)
+        new_token = cls(
+            user=old["user"],
+            token_hash=hashlib.sha256(raw_token.encode()).hexdigest(),
+            expires_at=now + timedelta(days=expires_in_days),
+            device_info=device_info,
+            token_family=old["token_family"],
+            previous_token=old["_id"],
+            user_email=old.get("user_email"),
+            user_role=old.get("user_role")
+        )
+        await new_token.insert()
+
+        return raw_token, new_token
+
+
+class RevokedAccessToken(Document):
+    """An access token revoked before its exp, shared with every worker until it expires."""
+    id: str  # sha256 hex digest of the token
+    expires_at: datetime
+    revoked_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "revoked_access_tokens"
+        indexes = [
+            IndexModel([("revoked_at", 1)], name="idx_revoked_access_token_revoked"),
+            # Once the token has expired it is rejected anyway
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0, name="ttl_revoked_access_token_expires")
+        ]
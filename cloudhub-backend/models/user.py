@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from beanie import Document, Link, before_event, Replace, Insert
-from pydantic import Field, EmailStr
+from beanie import Document, Link, before_event, Replace, Insert, PydanticObjectId
+from pydantic import BaseModel, Field, EmailStr
 from bson import ObjectId
 from pymongo import ASCENDING, DESCENDING, IndexModel
 from pymongo import TEXT
@@ -164,6 +164,12 @@ class User(Document):
         self.last_seen = datetime.utcnow()
         await self.save()
     
+    def _invalidate_principal(self):
+        """Drop this user's cached principal after a change to its role, lock or deleted flag."""
+        # Imported here: auth imports this module
+        from auth.principal import principal_cache
+        principal_cache.invalidate(self.id)
+    
     async def increment_failed_login(self):
         """Increment failed login attempts and lock account if threshold reached."""
         self.failed_login_attempts += 1
@@ -171,6 +177,7 @@ class User(Document):
             self.account_locked = True
             self.account_locked_until = datetime.utcnow() + timedelta(minutes=30)
         await self.save()
+        self._invalidate_principal()
     
     async def reset_failed_login(self):
         """Reset failed login attempts counter."""
@@ -178,6 +185,7 @@ class User(Document):
         self.account_locked = False
         self.account_locked_until = None
         await self.save()
+        self._invalidate_principal()
     
     async def verify_email(self):
         """Mark email as verified."""
@@ -212,4 +220,51 @@ class User(Document):
     @classmethod
     async def get_active_users(cls) -> List['User']:
         """Get all active users."""
-        return await cls.find(cls.is_deleted == False).to_list() 
\ No newline at end of file
+        return await cls.find(cls.is_deleted == False).to_list() 
+
+class ParticipantProfile(BaseModel):
+    """
+    Public profile of a user for participant listings.
+
+    Loaded through a Mongo projection with User.find(...).project(ParticipantProfile),
+    so contact details, credentials and preferences are never read.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    name: str = ""
+    avatar: Optional[str] = None
+    role: str = ""
+    country: Optional[str] = None
+    skills: List[str] = Field(default_factory=list)
+    bio: Optional[str] = None
+    social_links: Dict[str, str] = Field(default_factory=dict)
+    organization_name: Optional[str] = None
+    reputation_score: int = 0
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "name": 1,
+            "avatar": 1,
+            "role": 1,
+            "country": 1,
+            "skills": 1,
+            "bio": 1,
+            "social_links": 1,
+            "organization_name": 1,
+            "reputation_score": 1
+        }
+
+    def to_dict(self) -> dict:
+        """Convert to the same keys User.to_dict() uses for these fields."""
+        return {
+            'id': str(self.id),
+            'name': self.name,
+            'avatar': self.avatar,
+            'role': self.role,
+            'country': self.country,
+            'skills': self.skills,
+            'bio': self.bio,
+            'social_links': self.social_links,
+            'organization_name': self.organization_name,
+            'reputation_score': self.reputation_score
+        }
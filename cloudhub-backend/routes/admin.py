@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+
+from auth.jwt_manager import get_admin_user
+from auth.principal import Principal
+from database.slow_queries import slow_query_monitor
+
+router = APIRouter()
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    current_user: Principal = Depends(get_admin_user)
+):
+    """
+    Slow MongoDB commands recorded since startup.
+    
+    Returns the slowest query shapes by total time, with the routes that
+    issued them and their explain summary (COLLSCAN / in-memory sort), and
+    the most recent slow commands.
+    """
+    return slow_query_monitor.report(limit)
+
+@router.delete("/slow-queries")
+async def clear_slow_queries(current_user: Principal = Depends(get_admin_user)):
+    """Clear the slow query log."""
+    slow_query_monitor.reset()
+    return {"message": "Slow query log cleared"}
@@ -1,6 +1,6 @@
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Form
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
 import jwt
 from jwt.exceptions import PyJWTError
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -15,10 +15,12 @@ from models.auth import (
 from models.user import User
 from models.token import RefreshToken
 from services.auth_service import AuthService
+from services.rate_limit_service import rate_limit
 from database.dependencies import get_database
 from config.config import settings
-from auth.jwt_manager import TokenManager, get_current_user
-from auth.utils import get_password_hash, verify_password
+from auth.jwt_manager import TokenManager, revocation_sync, get_current_user, get_current_principal, security
+from auth.principal import Principal
+from auth.utils import get_password_hash, verify_password, check_password
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -56,7 +58,12 @@ async def get_current_user(
 
     return user
 
-@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/register",
+    response_model=TokenResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("register"))]
+)
 async def register(
     user_data: UserCreate,
     request: Request,
@@ -148,6 +155,8 @@ async def register(
             user=user_response_data
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -169,12 +178,12 @@ class TokenResponse(BaseModel):
     refresh_token: str
     token_type: str
     expires_in: int
-    user: dict
+    user: Optional[dict] = None  # Not sent by /refresh
 
 class RefreshRequest(BaseModel):
     refresh_token: str
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(rate_limit("login"))])
 async def login(
     username: str = Form(...),
     password: str = Form(...),
@@ -192,7 +201,7 @@ async def login(
         
         # Verify password
         try:
-            is_valid = verify_password(password, user.password_hash)
+            is_valid = await check_password(password, user.password_hash)
             if not is_valid:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -277,7 +286,7 @@ async def login(
             detail="Incorrect email or password"
         )
     
-@router.post("/refresh", response_model=TokenResponse)
+@router.post("/refresh", response_model=TokenResponse, dependencies=[Depends(rate_limit("refresh"))])
 async def refresh_token(
     refresh_request: RefreshRequest,
     request: Request
@@ -297,23 +306,27 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     refresh_request: RefreshRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """Logout user and revoke refresh token."""
     await TokenManager.revoke_token(refresh_request.refresh_token)
+    await revocation_sync.revoke(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 @router.post("/logout-all")
 async def logout_all_devices(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     """Logout from all devices by revoking all refresh tokens."""
     await TokenManager.revoke_all_user_tokens(str(current_user.id))
+    await revocation_sync.revoke(credentials.credentials)
     return {"message": "Successfully logged out from all devices"}
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Get current user information."""
@@ -370,7 +383,7 @@ async def get_current_user_info(
 
 @router.get("/sessions")
 async def get_active_sessions(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get all active sessions for the current user."""
     active_tokens = await RefreshToken.find({
@@ -389,7 +402,7 @@ async def get_active_sessions(
 @router.post("/sessions/{session_id}/revoke")
 async def revoke_session(
     session_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Revoke a specific session."""
     token = await RefreshToken.find_one({
@@ -415,7 +428,7 @@ async def verify_email(
     await auth_service.verify_email(token)
     return {"message": "Email verified successfully"}
 
-@router.post("/forgot-password")
+@router.post("/forgot-password", dependencies=[Depends(rate_limit("password"))])
 async def forgot_password(
     email_data: PasswordReset,
     auth_service: AuthService = Depends(get_auth_service)
@@ -424,7 +437,7 @@ async def forgot_password(
     await auth_service.initiate_password_reset(email_data.email)
     return {"message": "If the email exists, a password reset link has been sent"}
 
-@router.post("/reset-password")
+@router.post("/reset-password", dependencies=[Depends(rate_limit("password"))])
 async def reset_password(
     reset_data: PasswordResetConfirm,
     auth_service: AuthService = Depends(get_auth_service)
@@ -435,7 +448,7 @@ async def reset_password(
 
 @router.post("/2fa/setup", response_model=dict)
 async def setup_2fa(
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Set up 2FA for user."""
@@ -448,7 +461,7 @@ async def setup_2fa(
 @router.post("/2fa/verify")
 async def verify_2fa(
     token: str,
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Verify 2FA token."""
@@ -462,7 +475,7 @@ async def verify_2fa(
 
 @router.post("/2fa/disable")
 async def disable_2fa(
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Disable 2FA for user."""
@@ -470,7 +483,7 @@ async def disable_2fa(
     return {"message": "2FA disabled successfully"}
 
 @router.get("/check-role")
-async def check_role(current_user: User = Depends(get_current_user)):
+async def check_role(current_user: Principal = Depends(get_current_principal)):
     """Check the role of the current user."""
     return {
         "role": current_user.role,
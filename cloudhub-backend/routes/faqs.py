@@ -2,27 +2,42 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
 
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+
 from models.faq import FAQ
 from models.hackathon import Hackathon
-from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
+from services.cache_service import response_cache, hackathon_tag
 from schemas.faq import FAQCreate, FAQUpdate, FAQResponse, FAQVoteRequest
 from datetime import datetime
 
 router = APIRouter()
 
-@router.get("/{hackathon_id}/faqs", response_model=List[FAQResponse])
-async def get_faqs(
+async def list_faqs(
     hackathon_id: str,
-    category: Optional[str] = Query(None),
-    published: Optional[bool] = Query(None),
-    featured: Optional[bool] = Query(None),
-    current_user: User = Depends(get_current_user)
-):
-    """Get all FAQs for a hackathon."""
-    hackathon = await Hackathon.get(hackathon_id)
-    if not hackathon:
-        raise HTTPException(status_code=404, detail="Hackathon not found")
+    category: Optional[str] = None,
+    published: Optional[bool] = None,
+    featured: Optional[bool] = None,
+    verify_hackathon: bool = True
+) -> list:
+    """
+    Load a hackathon's FAQs through the response cache.
+    
+    Callers that already loaded the hackathon pass verify_hackathon=False.
+    """
+    cache_key = f"{hackathon_tag(hackathon_id, 'faqs')}:{category or ''}:{published}:{featured}"
+    tags = [hackathon_tag(hackathon_id), hackathon_tag(hackathon_id, "faqs")]
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = await response_cache.generation(tags)
+    
+    if verify_hackathon:
+        hackathon = await Hackathon.get(hackathon_id)
+        if not hackathon:
+            raise HTTPException(status_code=404, detail="Hackathon not found")
     
     query = {"hackathon_id": hackathon_id, "is_deleted": False}
     if category: query["category"] = category
@@ -30,13 +45,26 @@ async def get_faqs(
     if featured is not None: query["featured"] = featured
     
     faqs = await FAQ.find(query).sort("order", "featured").to_list()
-    return [FAQResponse(**faq.to_dict()) for faq in faqs]
+    result = [FAQResponse(**faq.to_dict()) for faq in faqs]
+    await response_cache.set(cache_key, result, tags=tags, generation=generation)
+    return result
+
+@router.get("/{hackathon_id}/faqs", response_model=List[FAQResponse])
+async def get_faqs(
+    hackathon_id: str,
+    category: Optional[str] = Query(None),
+    published: Optional[bool] = Query(None),
+    featured: Optional[bool] = Query(None),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """Get all FAQs for a hackathon."""
+    return await list_faqs(hackathon_id, category, published, featured)
 
 @router.post("/{hackathon_id}/faqs", response_model=FAQResponse)
 async def create_faq(
     hackathon_id: str,
     faq_data: FAQCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Create a new FAQ."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -49,6 +77,7 @@ async def create_faq(
         created_by=str(current_user.id)
     )
     await faq.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "faqs"))
     return FAQResponse(**faq.to_dict())
 
 @router.put("/{hackathon_id}/faqs/{faq_id}", response_model=FAQResponse)
@@ -56,7 +85,7 @@ async def update_faq(
     hackathon_id: str,
     faq_id: str,
     faq_data: FAQUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update an FAQ."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -73,13 +102,14 @@ async def update_faq(
     
     faq.updated_at = datetime.utcnow()
     await faq.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "faqs"))
     return FAQResponse(**faq.to_dict())
 
 @router.delete("/{hackathon_id}/faqs/{faq_id}")
 async def delete_faq(
     hackathon_id: str,
     faq_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Delete an FAQ."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -94,47 +124,48 @@ async def delete_faq(
     faq.deleted_at = datetime.utcnow()
     faq.deleted_by = str(current_user.id)
     await faq.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "faqs"))
     return {"message": "FAQ deleted successfully"}
 
+async def _increment_faq(hackathon_id: str, faq_id: str, field: str):
+    """$inc one of an FAQ's counters and invalidate the cached FAQ lists showing it."""
+    try:
+        object_id = PydanticObjectId(faq_id)
+    except InvalidId:
+        raise HTTPException(status_code=404, detail="FAQ not found")
+    
+    result = await FAQ.find_one(
+        {"_id": object_id, "hackathon_id": hackathon_id, "is_deleted": False}
+    ).update({"$inc": {field: 1}})
+    if not result or result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="FAQ not found")
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "faqs"))
+
 @router.post("/{hackathon_id}/faqs/{faq_id}/vote")
 async def vote_faq(
     hackathon_id: str,
     faq_id: str,
     vote_data: FAQVoteRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Vote on FAQ helpfulness."""
-    faq = await FAQ.get(faq_id)
-    if not faq or faq.hackathon_id != hackathon_id or faq.is_deleted:
-        raise HTTPException(status_code=404, detail="FAQ not found")
-    
-    if vote_data.helpful:
-        faq.helpful += 1
-    else:
-        faq.not_helpful += 1
-    
-    await faq.save()
+    await _increment_faq(hackathon_id, faq_id, "helpful" if vote_data.helpful else "not_helpful")
     return {"message": "Vote recorded"}
 
 @router.post("/{hackathon_id}/faqs/{faq_id}/view")
 async def track_view(
     hackathon_id: str,
     faq_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Track FAQ view."""
-    faq = await FAQ.get(faq_id)
-    if not faq or faq.hackathon_id != hackathon_id or faq.is_deleted:
-        raise HTTPException(status_code=404, detail="FAQ not found")
-    
-    faq.views += 1
-    await faq.save()
+    await _increment_faq(hackathon_id, faq_id, "views")
     return {"message": "View tracked"}
 
 @router.get("/{hackathon_id}/faqs/stats")
 async def get_faq_stats(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get FAQ statistics."""
     hackathon = await Hackathon.get(hackathon_id)
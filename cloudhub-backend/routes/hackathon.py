@@ -3,19 +3,46 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status as http_status, Request
 from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
+from bson.errors import InvalidId
+from beanie import UpdateResponse
 from pydantic import ValidationError
+from pymongo import DESCENDING
+from pymongo.errors import DuplicateKeyError
 import re
 import logging
-import json
+import asyncio
 from utils.code_generator import generate_access_code
+from utils.pagination import encode_cursor, with_cursor, keyset_sort, InvalidCursorError
+from utils.responses import FastJSONResponse
+from services.cache_service import response_cache, hackathon_tag
+from services.maintenance_service import run_bulk_update
+from routes.sponsors import list_sponsors
+from routes.timeline_events import list_timeline_events
+from routes.resources import list_resources
+from routes.faqs import list_faqs
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Statuses in which participants may register
+REGISTRATION_OPEN_STATUSES = ['active', 'registration_open']
+
+# Registrations scanned per query when participants are filtered by profile
+PARTICIPANT_SCAN_BATCH = 500
+
+# Sections the hackathon bundle endpoint can include
+BUNDLE_SECTIONS = {
+    "sponsors": list_sponsors,
+    "timeline_events": list_timeline_events,
+    "resources": list_resources,
+    "faqs": list_faqs
+}
+
 from models.hackathon import (
     Hackathon, 
+    HackathonCard,
     HackathonStatus, 
+    discovery_query,
     Timeline,
     BillingInfo,
     Technology,
@@ -24,9 +51,11 @@ from models.hackathon import (
     JudgingCriterion as ModelJudgingCriterion,  # Import from models
     Challenge as ModelChallenge  # Import from models
 )
-from models.user import User
+from models.user import User, ParticipantProfile
+from models.registration import HackathonRegistration
 from database.dependencies import get_db
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_user, get_current_principal
+from auth.principal import Principal
 from schemas.hackathon import (
     HackathonCreate,
     HackathonUpdate,
@@ -39,15 +68,16 @@ router = APIRouter()
 
 @router.get("/my-hackathons")
 async def get_my_hackathons(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     hackathon_status: Optional[str] = Query(None, description="Filter by status: draft, active, completed"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of hackathons to return"),
-    skip: int = Query(0, ge=0, description="Number of hackathons to skip for pagination"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    include_total: bool = Query(True, description="Whether to count all matching hackathons"),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Get hackathons created by the current user."""
     try:
-        logger.debug(f"Fetching hackathons for user: {current_user.email}")
+        logger.debug("Fetching hackathons for user: %s", current_user.id)
         
         # Build query to find hackathons where current user is the organizer
         query = {
@@ -58,14 +88,12 @@ async def get_my_hackathons(
         # Add status filter if provided
         if hackathon_status:
             query["status"] = hackathon_status.lower()
-            logger.debug(f"Filtering by status: {hackathon_status}")
-        
-        logger.debug(f"Query: {query}")
+            logger.debug("Filtering by status: %s", hackathon_status)
         
-        # Find hackathons with pagination
-        hackathons = await Hackathon.find(query).skip(skip).limit(limit).to_list()
+        # Find hackathons with keyset pagination
+        hackathons, next_cursor, total_count = await paginate_hackathons(query, limit, cursor, include_total)
         
-        logger.debug(f"Found {len(hackathons)} hackathons")
+        logger.debug("Found %d hackathons", len(hackathons))
         
         # Convert to response format
         hackathon_list = []
@@ -114,17 +142,20 @@ async def get_my_hackathons(
                 logger.error(f"Error processing hackathon {hackathon.id}: {str(e)}")
                 continue
         
-        # Get total count for pagination
-        total_count = len(await Hackathon.find(query).to_list())
-        
-        return {
+        # Built here from plain values, so skip re-validation and re-encoding
+        return FastJSONResponse({
             "hackathons": hackathon_list,
             "total": total_count,
-            "page": skip // limit + 1,
-            "pages": (total_count + limit - 1) // limit,
-            "has_more": skip + limit < total_count
-        }
+            "pages": (total_count + limit - 1) // limit if total_count is not None else None,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor
+        })
         
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error fetching user hackathons: {str(e)}")
         logger.error(f"Full error traceback:", exc_info=True)
@@ -135,15 +166,16 @@ async def get_my_hackathons(
 
 @router.get("/team-hackathons")
 async def get_team_hackathons(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     hackathon_status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(50, ge=1, le=100),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    include_total: bool = Query(True, description="Whether to count all matching hackathons"),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Get hackathons where the current user is part of the management team."""
     try:
-        logger.debug(f"Fetching team hackathons for user: {current_user.email}")
+        logger.debug("Fetching team hackathons for user: %s", current_user.id)
         
         # Build query to find hackathons where user is in management team
         query = {
@@ -158,7 +190,7 @@ async def get_team_hackathons(
         if hackathon_status:
             query["status"] = hackathon_status.lower()
         
-        hackathons = await Hackathon.find(query).skip(skip).limit(limit).to_list()
+        hackathons, next_cursor, total_count = await paginate_hackathons(query, limit, cursor, include_total)
         
         # Process hackathons similar to my-hackathons
         hackathon_list = []
@@ -176,8 +208,8 @@ async def get_team_hackathons(
                     "organization_name": hackathon_dict.get("organization_name", ""),
                     "organization_logo": hackathon_dict.get("organization_logo", ""),
                     "max_participants": hackathon_dict.get("max_participants", 100),
-                    "participants_count": len(hackathon_dict.get("participants", [])),
-                    "submission_count": len(hackathon_dict.get("submissions", [])),
+                    "participants_count": hackathon_dict.get("registered_participants", 0),
+                    "submission_count": hackathon_dict.get("submitted_projects", 0),
                     "prize_pool": hackathon_dict.get("total_prize_pool", 0),
                     "featured": hackathon_dict.get("is_featured", False),
                     "categories": hackathon_dict.get("tags", []),
@@ -207,17 +239,19 @@ async def get_team_hackathons(
                 logger.error(f"Error processing team hackathon {hackathon.id}: {str(e)}")
                 continue
         
-        # Get total count for pagination
-        total_count = len(await Hackathon.find(query).to_list())
-        
         return {
             "hackathons": hackathon_list,
             "total": total_count,
-            "page": skip // limit + 1,
-            "pages": (total_count + limit - 1) // limit,
-            "has_more": skip + limit < total_count
+            "pages": (total_count + limit - 1) // limit if total_count is not None else None,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error fetching team hackathons: {str(e)}")
         raise HTTPException(
@@ -225,6 +259,42 @@ async def get_team_hackathons(
             detail=f"Failed to fetch team hackathons: {str(e)}"
         )
 
+async def paginate_hackathons(
+    query: dict,
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+    sort_field: str = "created_at",
+    descending: bool = True
+):
+    """
+    Fetch one page of hackathon cards ordered by (sort_field, _id).
+
+    The page query and the optional count run concurrently, so the cost of
+    a page does not depend on how deep into the result set it is.
+
+    Returns:
+        tuple: (List[HackathonCard], next_cursor, total_count or None)
+    """
+    page_query = Hackathon.find(with_cursor(query, sort_field, cursor, descending)) \
+        .sort(keyset_sort(sort_field, descending)) \
+        .limit(limit + 1) \
+        .project(HackathonCard) \
+        .to_list()
+    
+    if include_total:
+        hackathons, total_count = await asyncio.gather(page_query, Hackathon.find(query).count())
+    else:
+        hackathons, total_count = await page_query, None
+    
+    next_cursor = None
+    if len(hackathons) > limit:
+        hackathons = hackathons[:limit]
+        last = hackathons[-1]
+        next_cursor = encode_cursor(last.get_sort_value(sort_field), last.id)
+    
+    return hackathons, next_cursor, total_count
+
 def generate_slug(title: str) -> str:
     """Generate a URL-friendly slug from the title."""
     # Convert to lowercase and remove special characters
@@ -258,13 +328,9 @@ async def create_hackathon(
     """Create a new hackathon."""
     try:
         # Log raw request body for debugging
-        raw_body = await request.body()
-        try:
-            body_json = json.loads(raw_body)
-            logger.debug(f"Raw request body: {json.dumps(body_json, indent=2)}")
-        except json.JSONDecodeError as e:
-            logger.error(f"Could not parse request body as JSON: {str(e)}")
-            logger.debug(f"Raw request body: {raw_body}")
+        if logger.isEnabledFor(logging.DEBUG):
+            raw_body = await request.body()
+            logger.debug("Raw request body: %s", raw_body)
 
         # Log parsed data
         logger.debug("Parsed request data:")
@@ -551,24 +617,124 @@ async def create_hackathon(
 
 @router.get("/")
 async def get_hackathons(
-    status: Optional[str] = None,
-    category: Optional[str] = None,
-    featured: bool = Query(default=False),
+    status: Optional[HackathonStatus] = Query(None, description="Filter by hackathon status"),
+    tag: Optional[str] = Query(None, description="Filter by tag"),
+    category: Optional[str] = Query(None, description="Deprecated alias of tag"),
+    featured: Optional[bool] = Query(None, description="Filter by featured flag"),
+    starts_after: Optional[datetime] = Query(None, description="Only events starting at or after this time"),
+    starts_before: Optional[datetime] = Query(None, description="Only events starting before this time"),
+    sort: str = Query("start_date", description="Sort by start_date, prize_pool or created_at"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of hackathons to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Whether to count all matching hackathons"),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
-    """Get all hackathons with optional filters."""
-    query = {"is_deleted": False}
+    """
+    Public hackathon discovery listing.
+
+    Every accepted filter/sort combination is backed by an
+    idx_hackathon_discovery_* index, and pages are fetched by cursor so
+    latency stays flat as the catalog grows. Combinations no index serves
+    are rejected with 400.
+    """
+    try:
+        query, sort_field, direction = discovery_query(
+            status=status.value if status else None,
+            tag=tag or category,
+            featured=featured,
+            starts_after=starts_after,
+            starts_before=starts_before,
+            sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    try:
+        hackathons, next_cursor, total_count = await paginate_hackathons(
+            query, limit, cursor, include_total,
+            sort_field=sort_field,
+            descending=direction == DESCENDING
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return {
+        "hackathons": [h.to_dict() for h in hackathons],
+        "total": total_count,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor
+    }
+
+async def load_hackathon_detail(hackathon_id: str) -> Optional[dict]:
+    """
+    Build the hackathon detail payload, served from the response cache when possible.
+    
+    Returns None if the hackathon does not exist.
+    """
+    object_id = ObjectId(hackathon_id)
+    
+    cache_key = f"{hackathon_tag(hackathon_id)}:detail"
+    tags = [hackathon_tag(hackathon_id)]
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = await response_cache.generation(tags)
+    
+    hackathon = await Hackathon.find_one(
+        {"_id": object_id, "is_deleted": False}
+    )
+    
+    if not hackathon:
+        return None
     
-    if status:
-        query["status"] = status
-    if category:
-        query["categories"] = {"$in": [category]}
-    if featured:
-        query["featured"] = True
+    # Convert to response format
+    hackathon_dict = hackathon.to_dict()
     
-    hackathons = await Hackathon.find(query).to_list()
+    # Get timeline dates
+    timeline = hackathon_dict.get("timeline", {})
+    start_date = timeline.get("event_start") if timeline else datetime.utcnow().isoformat()
+    end_date = timeline.get("event_end") if timeline else (datetime.utcnow() + timedelta(days=3)).isoformat()
+    registration_deadline = timeline.get("registration_end") if timeline else (datetime.utcnow() + timedelta(days=1)).isoformat()
     
-    return [h.to_dict() for h in hackathons]
+    # Format response
+    response = {
+        "id": str(hackathon_dict.get("id", hackathon.id)),
+        "title": hackathon_dict.get("title", "Untitled Hackathon"),
+        "description": hackathon_dict.get("description", ""),
+        "startDate": start_date,
+        "endDate": end_date,
+        "registrationDeadline": registration_deadline,
+        "participants": len(hackathon_dict.get("management_team", [])) + len(hackathon_dict.get("collaborators", [])) + len(hackathon_dict.get("co_organizers", [])),
+        "maxParticipants": hackathon_dict.get("max_participants", 100),
+        "submissionCount": hackathon_dict.get("submitted_projects", 0),
+        "prizePool": str(hackathon_dict.get("total_prize_pool", 0)),
+        "status": hackathon_dict.get("status", "draft").title(),
+        "progress": calculate_progress(hackathon_dict),
+        "bannerImage": hackathon_dict.get("banner_image", ""),
+        "categories": hackathon_dict.get("tags", []),
+        "featured": hackathon_dict.get("is_featured", False),
+        "participants_count": hackathon_dict.get("registered_participants", 0),
+        "submission_count": hackathon_dict.get("submitted_projects", 0),
+        "coverImage": hackathon_dict.get("cover_image", ""),
+        "organizationName": hackathon_dict.get("organization_name", ""),
+        "organizationLogo": hackathon_dict.get("organization_logo", ""),
+        "rules": hackathon_dict.get("rules", ""),
+        "requirements": hackathon_dict.get("requirements", []),
+        "judging_criteria": hackathon_dict.get("judging_criteria", []),
+        "challenges": hackathon_dict.get("challenges", []),
+        "prizes": hackathon_dict.get("prizes", []),
+        "resources": hackathon_dict.get("resources", []),
+        "submission_template": hackathon_dict.get("submission_template", "")
+    }
+    
+    await response_cache.set(cache_key, response, tags=tags, generation=generation)
+    return response
 
 @router.get("/{hackathon_id}")
 async def get_hackathon(
@@ -577,59 +743,14 @@ async def get_hackathon(
 ):
     """Get hackathon details."""
     try:
-        # Convert string ID to ObjectId
-        object_id = ObjectId(hackathon_id)
+        response = await load_hackathon_detail(hackathon_id)
         
-        hackathon = await Hackathon.find_one(
-            {"_id": object_id, "is_deleted": False}
-        )
-        
-        if not hackathon:
+        if not response:
             raise HTTPException(
                 status_code=404,
                 detail="Hackathon not found"
             )
         
-        # Convert to response format
-        hackathon_dict = hackathon.to_dict()
-        
-        # Get timeline dates
-        timeline = hackathon_dict.get("timeline", {})
-        start_date = timeline.get("event_start") if timeline else datetime.utcnow().isoformat()
-        end_date = timeline.get("event_end") if timeline else (datetime.utcnow() + timedelta(days=3)).isoformat()
-        registration_deadline = timeline.get("registration_end") if timeline else (datetime.utcnow() + timedelta(days=1)).isoformat()
-        
-        # Format response
-        response = {
-            "id": str(hackathon_dict.get("id", hackathon.id)),
-            "title": hackathon_dict.get("title", "Untitled Hackathon"),
-            "description": hackathon_dict.get("description", ""),
-            "startDate": start_date,
-            "endDate": end_date,
-            "registrationDeadline": registration_deadline,
-            "participants": len(hackathon_dict.get("management_team", [])) + len(hackathon_dict.get("collaborators", [])) + len(hackathon_dict.get("co_organizers", [])),
-            "maxParticipants": hackathon_dict.get("max_participants", 100),
-            "submissionCount": hackathon_dict.get("submitted_projects", 0),
-            "prizePool": str(hackathon_dict.get("total_prize_pool", 0)),
-            "status": hackathon_dict.get("status", "draft").title(),
-            "progress": calculate_progress(hackathon_dict),
-            "bannerImage": hackathon_dict.get("banner_image", ""),
-            "categories": hackathon_dict.get("tags", []),
-            "featured": hackathon_dict.get("is_featured", False),
-            "participants_count": hackathon_dict.get("registered_participants", 0),
-            "submission_count": hackathon_dict.get("submitted_projects", 0),
-            "coverImage": hackathon_dict.get("cover_image", ""),
-            "organizationName": hackathon_dict.get("organization_name", ""),
-            "organizationLogo": hackathon_dict.get("organization_logo", ""),
-            "rules": hackathon_dict.get("rules", ""),
-            "requirements": hackathon_dict.get("requirements", []),
-            "judging_criteria": hackathon_dict.get("judging_criteria", []),
-            "challenges": hackathon_dict.get("challenges", []),
-            "prizes": hackathon_dict.get("prizes", []),
-            "resources": hackathon_dict.get("resources", []),
-            "submission_template": hackathon_dict.get("submission_template", "")
-        }
-        
         return response
         
     except Exception as e:
@@ -639,11 +760,50 @@ async def get_hackathon(
             detail="Hackathon not found"
         )
 
+@router.get("/{hackathon_id}/bundle")
+async def get_hackathon_bundle(
+    hackathon_id: str,
+    include: Optional[str] = Query(None, description="Comma-separated sections: sponsors, timeline_events, resources, faqs"),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Get hackathon details and its landing page sections in one response.
+    
+    The hackathon is loaded once (usually from cache), then the requested
+    sections are fetched concurrently without their per-endpoint lookup.
+    """
+    sections = list(BUNDLE_SECTIONS)
+    if include:
+        sections = [section.strip() for section in include.split(",") if section.strip()]
+        unknown = [section for section in sections if section not in BUNDLE_SECTIONS]
+        if unknown:
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown bundle sections: {', '.join(unknown)}. Allowed: {', '.join(BUNDLE_SECTIONS)}"
+            )
+    
+    _hackathon_object_id(hackathon_id)
+    detail = await load_hackathon_detail(hackathon_id)
+    if not detail:
+        raise HTTPException(
+            status_code=404,
+            detail="Hackathon not found"
+        )
+    
+    results = await asyncio.gather(
+        *(BUNDLE_SECTIONS[section](hackathon_id, verify_hackathon=False) for section in sections)
+    )
+    
+    return {
+        'hackathon': detail,
+        **dict(zip(sections, results))
+    }
+
 @router.put("/{hackathon_id}")
 async def update_hackathon(
     hackathon_id: str,
     hackathon_data: dict,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Update hackathon details."""
@@ -673,6 +833,7 @@ async def update_hackathon(
     
     hackathon.last_updated_at = datetime.utcnow()
     await hackathon.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id))
     
     return {
         'message': 'Hackathon updated successfully',
@@ -682,7 +843,7 @@ async def update_hackathon(
 @router.delete("/{hackathon_id}")
 async def delete_hackathon(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Delete a hackathon (soft delete)."""
@@ -707,6 +868,7 @@ async def delete_hackathon(
         hackathon.is_deleted = True
         hackathon.deleted_at = datetime.utcnow()
         await hackathon.save()
+        await response_cache.invalidate(hackathon_tag(hackathon_id))
         
         return {"message": "Hackathon deleted successfully"}
         
@@ -721,7 +883,7 @@ async def delete_hackathon(
 async def patch_hackathon(
     hackathon_id: str,
     update_data: dict,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Partially update a hackathon."""
@@ -769,6 +931,7 @@ async def patch_hackathon(
         
         # Save the hackathon
         await hackathon.save()
+        await response_cache.invalidate(hackathon_tag(hackathon_id))
         
         # Return updated hackathon
         return hackathon.to_dict()
@@ -780,52 +943,98 @@ async def patch_hackathon(
             detail=f"Failed to update hackathon: {str(e)}"
         )
 
+def _hackathon_object_id(hackathon_id: str) -> ObjectId:
+    """Parse a hackathon id from the path, treating malformed ids as not found."""
+    try:
+        return ObjectId(hackathon_id)
+    except InvalidId:
+        raise HTTPException(
+            status_code=404,
+            detail="Hackathon not found"
+        )
+
 @router.post("/{hackathon_id}/register")
 async def register_for_hackathon(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
-    """Register current user for a hackathon."""
-    hackathon = await Hackathon.find_one(
-        Hackathon.id == hackathon_id,
-        Hackathon.is_deleted == False
+    """
+    Register current user for a hackathon.
+    
+    The seat is claimed first with a conditional $inc, so concurrent
+    registrations cannot overshoot max_participants, and the registration
+    row is inserted after it. The unique (hackathon_id, user_id) index
+    rejects duplicates, which hand the seat back. A request that fails
+    between the two writes leaves a claimed seat without a row, which the
+    counter reconcile job repairs; it never leaves a row without a seat.
+    
+    Hackathons still carrying the legacy participants array have a counter
+    that never counted those members, so they are refused until
+    scripts/migrate_registrations.py has recounted them.
+    """
+    object_id = _hackathon_object_id(hackathon_id)
+    hackathon_key = str(object_id)
+    
+    hackathon = await Hackathon.find_one({
+        "_id": object_id,
+        "is_deleted": False,
+        "status": {"$in": REGISTRATION_OPEN_STATUSES},
+        "participants": {"$exists": False},
+        "$or": [
+            {"max_participants": {"$lte": 0}},
+            {"$expr": {"$lt": ["$registered_participants", "$max_participants"]}}
+        ]
+    }).update(
+        {
+            "$inc": {"registered_participants": 1},
+            "$set": {"last_updated_at": datetime.utcnow(), "counters_updated_at": datetime.utcnow()}
+        },
+        response_type=UpdateResponse.NEW_DOCUMENT
     )
     
     if not hackathon:
-        raise HTTPException(
-            status_code=404,
-            detail="Hackathon not found"
-        )
-    
-    # Check if registration is open
-    if hackathon.status not in ['active', 'registration_open']:
+        current = await Hackathon.find_one({"_id": object_id, "is_deleted": False})
+        if not current:
+            raise HTTPException(
+                status_code=404,
+                detail="Hackathon not found"
+            )
+        if await HackathonRegistration.is_registered(hackathon_key, str(current_user.id)):
+            raise HTTPException(
+                status_code=400,
+                detail="You are already registered for this hackathon"
+            )
+        if await Hackathon.get_motor_collection().count_documents(
+            {"_id": object_id, "participants": {"$exists": True}}, limit=1
+        ):
+            logger.error(f"Hackathon {hackathon_key} still has a participants array; run scripts/migrate_registrations.py")
+            raise HTTPException(
+                status_code=503,
+                detail="Registration for this hackathon is temporarily unavailable"
+            )
+        if current.status not in REGISTRATION_OPEN_STATUSES:
+            raise HTTPException(
+                status_code=400,
+                detail="Hackathon registration is not open"
+            )
         raise HTTPException(
             status_code=400,
-            detail="Hackathon registration is not open"
+            detail="Hackathon has reached maximum participants"
         )
     
-    # Check if user is already registered
-    if str(current_user.id) in hackathon.participants:
+    registration = HackathonRegistration(hackathon_id=hackathon_key, user_id=str(current_user.id))
+    try:
+        await registration.insert()
+    except DuplicateKeyError:
+        # The user already holds a seat; hand back the one just claimed
+        await Hackathon.increment_counters(hackathon_key, registered_participants=-1)
         raise HTTPException(
             status_code=400,
             detail="You are already registered for this hackathon"
         )
     
-    # Check if hackathon is full
-    if hackathon.max_participants and len(hackathon.participants) >= hackathon.max_participants:
-        raise HTTPException(
-            status_code=400,
-            detail="Hackathon has reached maximum participants"
-        )
-    
-    # Add user to participants
-    if not hackathon.participants:
-        hackathon.participants = []
-    
-    hackathon.participants.append(str(current_user.id))
-    hackathon.last_updated_at = datetime.utcnow()
-    await hackathon.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id))
     
     return {
         'message': 'Successfully registered for hackathon',
@@ -835,48 +1044,102 @@ async def register_for_hackathon(
 @router.post("/{hackathon_id}/unregister")
 async def unregister_from_hackathon(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Unregister current user from a hackathon."""
-    hackathon = await Hackathon.find_one(
-        Hackathon.id == hackathon_id,
-        Hackathon.is_deleted == False
-    )
+    object_id = _hackathon_object_id(hackathon_id)
     
-    if not hackathon:
+    exists = await Hackathon.find_one({"_id": object_id, "is_deleted": False}).project(HackathonCard)
+    if not exists:
         raise HTTPException(
             status_code=404,
             detail="Hackathon not found"
         )
     
-    # Check if user is registered
-    if str(current_user.id) not in hackathon.participants:
+    result = await HackathonRegistration.find_one({
+        "hackathon_id": str(object_id),
+        "user_id": str(current_user.id)
+    }).delete()
+    
+    if not result or result.deleted_count == 0:
         raise HTTPException(
             status_code=400,
             detail="You are not registered for this hackathon"
         )
     
-    # Remove user from participants
-    hackathon.participants.remove(str(current_user.id))
-    hackathon.last_updated_at = datetime.utcnow()
-    await hackathon.save()
+    hackathon = await Hackathon.find_one({"_id": object_id}).update(
+        {
+            "$inc": {"registered_participants": -1},
+            "$set": {"last_updated_at": datetime.utcnow(), "counters_updated_at": datetime.utcnow()}
+        },
+        response_type=UpdateResponse.NEW_DOCUMENT
+    )
+    await response_cache.invalidate(hackathon_tag(hackathon_id))
     
     return {
         'message': 'Successfully unregistered from hackathon',
         'hackathon': hackathon.to_dict()
     }
 
+async def _load_participant_page(
+    hackathon_key: str,
+    limit: int,
+    cursor: Optional[str],
+    user_filter: dict
+) -> list:
+    """
+    Walk registrations in (registered_at, _id) order and resolve each batch
+    of user ids with a single $in query, until limit + 1 matching profiles
+    are found or the registrations run out.
+    
+    Returns:
+        list: (registration, ParticipantProfile) pairs in listing order
+    """
+    # With user filters most of a batch may not match, so scan wider batches
+    batch_size = limit + 1
+    if len(user_filter) > 1:
+        batch_size = max(batch_size, PARTICIPANT_SCAN_BATCH)
+    
+    page = []
+    while len(page) <= limit:
+        registrations = await HackathonRegistration.page_for_hackathon(hackathon_key, batch_size, cursor)
+        if not registrations:
+            break
+        
+        profiles = await User.find({
+            "_id": {"$in": [ObjectId(registration.user_id) for registration in registrations]},
+            **user_filter
+        }).project(ParticipantProfile).to_list()
+        profiles_by_id = {str(profile.id): profile for profile in profiles}
+        
+        for registration in registrations:
+            profile = profiles_by_id.get(registration.user_id)
+            if profile:
+                page.append((registration, profile))
+                if len(page) > limit:
+                    break
+        
+        if len(registrations) < batch_size:
+            break
+        cursor = encode_cursor(registrations[-1].registered_at, registrations[-1].id)
+    
+    return page
+
 @router.get("/{hackathon_id}/participants")
 async def get_hackathon_participants(
     hackathon_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    skill: Optional[str] = None,
+    country: Optional[str] = None,
     db: AsyncIOMotorClient = Depends(get_db)
 ):
-    """Get all participants of a hackathon."""
+    """Get public profiles of a hackathon's participants, newest registrations first."""
+    object_id = _hackathon_object_id(hackathon_id)
     hackathon = await Hackathon.find_one(
-        Hackathon.id == hackathon_id,
-        Hackathon.is_deleted == False
-    )
+        {"_id": object_id, "is_deleted": False}
+    ).project(HackathonCard)
     
     if not hackathon:
         raise HTTPException(
@@ -884,20 +1147,40 @@ async def get_hackathon_participants(
             detail="Hackathon not found"
         )
     
-    # Get user details for all participants
-    participants = []
-    for user_id in hackathon.participants:
-        user = await User.find_one(User.id == user_id)
-        if user:
-            participants.append(user.to_dict())
+    user_filter = {"is_deleted": False}
+    if skill:
+        user_filter["skills"] = skill
+    if country:
+        user_filter["country"] = country
+    
+    try:
+        page = await _load_participant_page(str(object_id), limit, cursor, user_filter)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    has_more = len(page) > limit
+    page = page[:limit]
+    next_cursor = None
+    if has_more:
+        last_registration = page[-1][0]
+        next_cursor = encode_cursor(last_registration.registered_at, last_registration.id)
     
     return {
-        'participants': participants
+        'participants': [
+            {**profile.to_dict(), 'registered_at': registration.registered_at.isoformat() + 'Z'}
+            for registration, profile in page
+        ],
+        'total': hackathon.registered_participants,
+        'has_more': has_more,
+        'next_cursor': next_cursor
     }
 
 @router.post("/admin/fix-access-codes")
 async def fix_access_codes(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Fix missing access codes for all hackathons."""
@@ -908,20 +1191,19 @@ async def fix_access_codes(
             detail="Only administrators can perform this operation"
         )
     
-    # Find all hackathons without access codes
-    hackathons = await Hackathon.find(
-        {"access_code": None}
-    ).to_list()
-    
-    updated_count = 0
-    for hackathon in hackathons:
-        hackathon.generate_access_code_if_needed()
-        await hackathon.save()
-        updated_count += 1
+    # Set an access code on every hackathon that has none, in bulk
+    progress = await run_bulk_update(
+        Hackathon.get_motor_collection(),
+        {"access_code": None},
+        lambda doc: {"$set": {"access_code": generate_access_code(), "updated_at": datetime.utcnow()}},
+        job_name="fix-access-codes"
+    )
+    updated_count = progress["modified"]
     
     return {
         "message": f"Updated {updated_count} hackathons with new access codes",
-        "updated_count": updated_count
+        "updated_count": updated_count,
+        "errors": progress["errors"]
     }
 
 def calculate_progress(hackathon_dict: dict) -> int:
@@ -6,8 +6,10 @@ from pydantic import BaseModel, constr
 
 from models.message import Message, GroupMessage, Group
 from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
 from database.dependencies import get_db
+from utils.responses import FastJSONResponse
 
 router = APIRouter()
 
@@ -39,7 +41,7 @@ class GroupCreate(BaseModel):
 async def send_direct_message(
     receiver_id: str,
     message: MessageCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Send a direct message to a user."""
@@ -69,7 +71,7 @@ async def get_direct_messages(
     user_id: str,
     limit: int = Query(50, gt=0, le=100),
     offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Get direct messages with a specific user."""
@@ -89,13 +91,14 @@ async def get_direct_messages(
         }
     ).sort("-created_at").skip(offset).limit(limit).to_list()
     
-    return [msg.to_dict() for msg in messages]
+    # to_dict output is trusted; skip response_model re-validation
+    return FastJSONResponse([msg.to_dict() for msg in messages])
 
 @router.put("/direct/{message_id}", response_model=dict)
 async def update_direct_message(
     message_id: str,
     message_update: MessageUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Update a direct message."""
@@ -122,7 +125,7 @@ async def update_direct_message(
 @router.delete("/direct/{message_id}")
 async def delete_direct_message(
     message_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Delete a direct message."""
@@ -149,7 +152,7 @@ async def delete_direct_message(
 @router.post("/groups", response_model=dict)
 async def create_group(
     group_data: GroupCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Create a new group."""
@@ -179,7 +182,7 @@ async def create_group(
 async def send_group_message(
     group_id: str,
     message: GroupMessageCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Send a message to a group."""
@@ -216,7 +219,7 @@ async def get_group_messages(
     group_id: str,
     limit: int = Query(50, gt=0, le=100),
     offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Get messages from a group."""
@@ -241,14 +244,15 @@ async def get_group_messages(
         }
     ).sort("-created_at").skip(offset).limit(limit).to_list()
     
-    return [msg.to_dict() for msg in messages]
+    # to_dict output is trusted; skip response_model re-validation
+    return FastJSONResponse([msg.to_dict() for msg in messages])
 
 @router.put("/groups/{group_id}/messages/{message_id}", response_model=dict)
 async def update_group_message(
     group_id: str,
     message_id: str,
     message_update: MessageUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Update a group message."""
@@ -294,7 +298,7 @@ async def update_group_message(
 async def delete_group_message(
     group_id: str,
     message_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Delete a group message."""
@@ -339,7 +343,7 @@ async def delete_group_message(
 async def pin_group_message(
     group_id: str,
     message_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Pin a message in a group."""
@@ -379,7 +383,7 @@ async def pin_group_message(
 async def add_group_member(
     group_id: str,
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Add a member to a group."""
@@ -12,7 +12,9 @@ import uuid
 import logging
 from slugify import slugify
 from dateutil import parser
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
+from utils.metrics import track_outbound
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -48,7 +50,7 @@ def parse_date(date_input):
 @router.post("/create-checkout-session")
 async def create_checkout_session(
     request: CheckoutSessionRequest, 
-    current_user: User = Depends(get_current_user)  # Fixed: User instead of dict
+    current_user: Principal = Depends(get_current_principal)  # Fixed: User instead of dict
 ):
     try:
         package_name = request.package
@@ -72,29 +74,30 @@ async def create_checkout_session(
         hackathon_data['organizer_email'] = current_user.email
         
         # Create Stripe session WITH session_id in success URL
-        session = stripe.checkout.Session.create(
-            payment_method_types=['card'],
-            line_items=[{
-                'price_data': {
-                    'currency': 'aed',
-                    'product_data': {
-                        'name': f'CloudHub Hackathon {package_name} Package',
-                        'description': f'Access to organize hackathons with the {package_name} package features',
+        with track_outbound("stripe", "checkout_session_create"):
+            session = stripe.checkout.Session.create(
+                payment_method_types=['card'],
+                line_items=[{
+                    'price_data': {
+                        'currency': 'aed',
+                        'product_data': {
+                            'name': f'CloudHub Hackathon {package_name} Package',
+                            'description': f'Access to organize hackathons with the {package_name} package features',
+                        },
+                        'unit_amount': price_in_aed * 100,  # Convert to cents
                     },
-                    'unit_amount': price_in_aed * 100,  # Convert to cents
-                },
-                'quantity': 1,
-            }],
-            mode='payment',
-            success_url='http://localhost:3000/dashboard/organizer/my-hackathons?payment=success&session_id={CHECKOUT_SESSION_ID}',
-            cancel_url='http://localhost:3000/dashboard/organizer/my-hackathons?payment=cancelled&session_id={CHECKOUT_SESSION_ID}',
-            customer_email=current_user.email,  # Add customer email
-            metadata={
-                'user_id': str(current_user.id),
-                'package': package_name,
-                'hackathon_title': hackathon_data.get('title', 'Unknown')
-            }
-        )
+                    'quantity': 1,
+                }],
+                mode='payment',
+                success_url='http://localhost:3000/dashboard/organizer/my-hackathons?payment=success&session_id={CHECKOUT_SESSION_ID}',
+                cancel_url='http://localhost:3000/dashboard/organizer/my-hackathons?payment=cancelled&session_id={CHECKOUT_SESSION_ID}',
+                customer_email=current_user.email,  # Add customer email
+                metadata={
+                    'user_id': str(current_user.id),
+                    'package': package_name,
+                    'hackathon_title': hackathon_data.get('title', 'Unknown')
+                }
+            )
         
         logger.info(f"Created Stripe session: {session.id}")
         
@@ -122,13 +125,14 @@ async def create_checkout_session(
 @router.get("/verify-session/{session_id}")
 async def verify_payment_session(
     session_id: str, 
-    current_user: User = Depends(get_current_user)  # Fixed: User instead of dict
+    current_user: Principal = Depends(get_current_principal)  # Fixed: User instead of dict
 ):
     try:
         logger.info(f"Verifying payment session: {session_id} for user: {current_user.email}")
         
         # Retrieve the session from Stripe
-        session = stripe.checkout.Session.retrieve(session_id)
+        with track_outbound("stripe", "checkout_session_retrieve"):
+            session = stripe.checkout.Session.retrieve(session_id)
         logger.info(f"Stripe session status: {session.payment_status}")
         
         if session.payment_status == 'paid':
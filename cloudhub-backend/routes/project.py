@@ -6,9 +6,10 @@ from datetime import datetime
 from models.project import Project
 from models.team import Team
 from models.hackathon import Hackathon
-from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
 from database.dependencies import get_db
+from utils.responses import FastJSONResponse
 
 router = APIRouter(
     prefix="/projects",
@@ -19,7 +20,7 @@ router = APIRouter(
 async def create_project(
     project_data: dict,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Create a new project submission."""
     # Validate required fields
@@ -117,9 +118,10 @@ async def get_projects(
     
     projects = await Project.find(query).to_list()
     
-    return {
+    # to_dict output is trusted; skip response_model re-validation
+    return FastJSONResponse({
         'projects': [project.to_dict() for project in projects]
-    }
+    })
 
 @router.get("/{project_id}", response_model=Dict[str, Any])
 async def get_project(
@@ -142,7 +144,7 @@ async def update_project(
     project_id: str,
     project_data: dict,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update project details."""
     project = await Project.find_one(Project.id == project_id, Project.is_deleted == False)
@@ -192,11 +194,26 @@ async def update_project(
         'project': project.to_dict()
     }
 
+async def _update_live_project(project: Project, fields: dict) -> Optional[str]:
+    """
+    Set fields on a project that is not deleted, in one atomic update.
+    
+    Returns the status the project had just before the update, or None if
+    it was deleted meanwhile. Counter changes are derived from that status,
+    so concurrent transitions of the same project are counted once.
+    """
+    previous = await Project.get_motor_collection().find_one_and_update(
+        {"_id": project.id, "is_deleted": False},
+        {"$set": {**fields, "updated_at": datetime.utcnow()}},
+        projection={"status": 1}
+    )
+    return previous.get("status", "draft") if previous else None
+
 @router.delete("/{project_id}", response_model=Dict[str, str])
 async def delete_project(
     project_id: str,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Delete a project."""
     project = await Project.find_one(Project.id == project_id, Project.is_deleted == False)
@@ -216,9 +233,14 @@ async def delete_project(
             detail="Only team members can delete the project"
         )
     
-    project.is_deleted = True
-    project.deleted_at = datetime.utcnow()
-    await project.save()
+    previous_status = await _update_live_project(project, {"is_deleted": True, "deleted_at": datetime.utcnow()})
+    if previous_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    if previous_status != 'draft':
+        await Hackathon.increment_counters(project.hackathon_id, submitted_projects=-1)
     
     return {
         'message': 'Project deleted successfully'
@@ -228,7 +250,7 @@ async def delete_project(
 async def submit_project(
     project_id: str,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Submit a project for review."""
     project = await Project.find_one(Project.id == project_id, Project.is_deleted == False)
@@ -259,7 +281,16 @@ async def submit_project(
     
     project.status = 'submitted'
     project.submitted_at = datetime.utcnow()
-    await project.save()
+    previous_status = await _update_live_project(
+        project, {"status": project.status, "submitted_at": project.submitted_at}
+    )
+    if previous_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    if previous_status == 'draft':
+        await Hackathon.increment_counters(project.hackathon_id, submitted_projects=1)
     
     return {
         'message': 'Project submitted successfully',
@@ -271,7 +302,7 @@ async def add_mentor_feedback(
     project_id: str,
     feedback_data: dict,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Add mentor feedback to a project."""
     project = await Project.find_one(Project.id == project_id, Project.is_deleted == False)
@@ -313,7 +344,7 @@ async def add_score(
     project_id: str,
     score_data: dict,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Add judge's score to a project."""
     project = await Project.find_one(Project.id == project_id, Project.is_deleted == False)
@@ -356,7 +387,7 @@ async def update_project_status(
     project_id: str,
     status_data: dict,
     db: AsyncIOMotorClient = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update project status."""
     project = await Project.find_one(Project.id == project_id, Project.is_deleted == False)
@@ -385,7 +416,18 @@ async def update_project_status(
     
     project.status = new_status
     project.last_updated_at = datetime.utcnow()
-    await project.save()
+    previous_status = await _update_live_project(
+        project, {"status": project.status, "last_updated_at": project.last_updated_at}
+    )
+    if previous_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    # Moving into or out of draft changes the submission count
+    submission_delta = int(new_status != 'draft') - int(previous_status != 'draft')
+    if submission_delta:
+        await Hackathon.increment_counters(project.hackathon_id, submitted_projects=submission_delta)
     
     return {
         'message': 'Project status updated successfully',
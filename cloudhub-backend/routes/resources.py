@@ -2,28 +2,47 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
 
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+
 from models.resource import Resource, ResourceType, AccessLevel
 from models.hackathon import Hackathon
-from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
+from services.cache_service import response_cache, hackathon_tag
 from schemas.resource import ResourceCreate, ResourceUpdate, ResourceResponse
 from datetime import datetime
 
 router = APIRouter()
 
-@router.get("/{hackathon_id}/resources", response_model=List[ResourceResponse])
-async def get_resources(
+async def list_resources(
     hackathon_id: str,
-    resource_type: Optional[ResourceType] = Query(None),
-    category: Optional[str] = Query(None),
-    access_level: Optional[AccessLevel] = Query(None),
-    featured: Optional[bool] = Query(None),
-    current_user: User = Depends(get_current_user)
-):
-    """Get all resources for a hackathon."""
-    hackathon = await Hackathon.get(hackathon_id)
-    if not hackathon:
-        raise HTTPException(status_code=404, detail="Hackathon not found")
+    resource_type: Optional[ResourceType] = None,
+    category: Optional[str] = None,
+    access_level: Optional[AccessLevel] = None,
+    featured: Optional[bool] = None,
+    verify_hackathon: bool = True
+) -> list:
+    """
+    Load a hackathon's resources through the response cache.
+    
+    Callers that already loaded the hackathon pass verify_hackathon=False.
+    """
+    cache_key = (
+        f"{hackathon_tag(hackathon_id, 'resources')}:"
+        f"{resource_type.value if resource_type else ''}:{category or ''}:"
+        f"{access_level.value if access_level else ''}:{featured}"
+    )
+    tags = [hackathon_tag(hackathon_id), hackathon_tag(hackathon_id, "resources")]
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = await response_cache.generation(tags)
+    
+    if verify_hackathon:
+        hackathon = await Hackathon.get(hackathon_id)
+        if not hackathon:
+            raise HTTPException(status_code=404, detail="Hackathon not found")
     
     query = {"hackathon_id": hackathon_id, "is_deleted": False}
     if resource_type: query["resource_type"] = resource_type
@@ -32,13 +51,27 @@ async def get_resources(
     if featured is not None: query["featured"] = featured
     
     resources = await Resource.find(query).sort("display_order", "featured").to_list()
-    return [ResourceResponse(**resource.to_dict()) for resource in resources]
+    result = [ResourceResponse(**resource.to_dict()) for resource in resources]
+    await response_cache.set(cache_key, result, tags=tags, generation=generation)
+    return result
+
+@router.get("/{hackathon_id}/resources", response_model=List[ResourceResponse])
+async def get_resources(
+    hackathon_id: str,
+    resource_type: Optional[ResourceType] = Query(None),
+    category: Optional[str] = Query(None),
+    access_level: Optional[AccessLevel] = Query(None),
+    featured: Optional[bool] = Query(None),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """Get all resources for a hackathon."""
+    return await list_resources(hackathon_id, resource_type, category, access_level, featured)
 
 @router.post("/{hackathon_id}/resources", response_model=ResourceResponse)
 async def create_resource(
     hackathon_id: str,
     resource_data: ResourceCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Create a new resource."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -51,6 +84,7 @@ async def create_resource(
         created_by=str(current_user.id)
     )
     await resource.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "resources"))
     return ResourceResponse(**resource.to_dict())
 
 @router.put("/{hackathon_id}/resources/{resource_id}", response_model=ResourceResponse)
@@ -58,7 +92,7 @@ async def update_resource(
     hackathon_id: str,
     resource_id: str,
     resource_data: ResourceUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update a resource."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -75,13 +109,14 @@ async def update_resource(
     
     resource.updated_at = datetime.utcnow()
     await resource.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "resources"))
     return ResourceResponse(**resource.to_dict())
 
 @router.delete("/{hackathon_id}/resources/{resource_id}")
 async def delete_resource(
     hackathon_id: str,
     resource_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Delete a resource."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -96,28 +131,36 @@ async def delete_resource(
     resource.deleted_at = datetime.utcnow()
     resource.deleted_by = str(current_user.id)
     await resource.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "resources"))
     return {"message": "Resource deleted successfully"}
 
 @router.post("/{hackathon_id}/resources/{resource_id}/download")
 async def track_download(
     hackathon_id: str,
     resource_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Track resource download."""
-    resource = await Resource.get(resource_id)
-    if not resource or resource.hackathon_id != hackathon_id or resource.is_deleted:
+    try:
+        object_id = PydanticObjectId(resource_id)
+    except InvalidId:
         raise HTTPException(status_code=404, detail="Resource not found")
     
-    resource.downloads += 1
-    resource.last_downloaded = datetime.utcnow()
-    await resource.save()
+    result = await Resource.find_one(
+        {"_id": object_id, "hackathon_id": hackathon_id, "is_deleted": False}
+    ).update({
+        "$inc": {"downloads": 1},
+        "$set": {"last_downloaded": datetime.utcnow()}
+    })
+    if not result or result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Resource not found")
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "resources"))
     return {"message": "Download tracked"}
 
 @router.get("/{hackathon_id}/resources/stats")
 async def get_resource_stats(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get resource statistics."""
     hackathon = await Hackathon.get(hackathon_id)
@@ -4,8 +4,9 @@ from fastapi import status as http_status
 
 from models.sponsor import Sponsor, SponsorshipTier
 from models.hackathon import Hackathon
-from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
+from services.cache_service import response_cache, hackathon_tag
 from schemas.sponsor import (
     SponsorCreate,
     SponsorUpdate,
@@ -15,21 +16,32 @@ from datetime import datetime
 
 router = APIRouter()
 
-@router.get("/{hackathon_id}/sponsors", response_model=List[SponsorResponse])
-async def get_sponsors(
+async def list_sponsors(
     hackathon_id: str,
-    tier: Optional[SponsorshipTier] = Query(None, description="Filter by sponsorship tier"),
-    featured: Optional[bool] = Query(None, description="Filter by featured status"),
-    current_user: User = Depends(get_current_user)
-):
-    """Get all sponsors for a hackathon."""
+    tier: Optional[SponsorshipTier] = None,
+    featured: Optional[bool] = None,
+    verify_hackathon: bool = True
+) -> list:
+    """
+    Load a hackathon's sponsors through the response cache.
+    
+    Callers that already loaded the hackathon pass verify_hackathon=False.
+    """
+    cache_key = f"{hackathon_tag(hackathon_id, 'sponsors')}:{tier.value if tier else ''}:{featured}"
+    tags = [hackathon_tag(hackathon_id), hackathon_tag(hackathon_id, "sponsors")]
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = await response_cache.generation(tags)
+    
     # Check if hackathon exists
-    hackathon = await Hackathon.get(hackathon_id)
-    if not hackathon:
-        raise HTTPException(
-            status_code=http_status.HTTP_404_NOT_FOUND,
-            detail="Hackathon not found"
-        )
+    if verify_hackathon:
+        hackathon = await Hackathon.get(hackathon_id)
+        if not hackathon:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Hackathon not found"
+            )
     
     # Build query
     query = {
@@ -43,13 +55,25 @@ async def get_sponsors(
         query["featured"] = featured
     
     sponsors = await Sponsor.find(query).sort("display_order", "tier").to_list()
-    return [SponsorResponse(**sponsor.to_dict()) for sponsor in sponsors]
+    result = [SponsorResponse(**sponsor.to_dict()) for sponsor in sponsors]
+    await response_cache.set(cache_key, result, tags=tags, generation=generation)
+    return result
+
+@router.get("/{hackathon_id}/sponsors", response_model=List[SponsorResponse])
+async def get_sponsors(
+    hackathon_id: str,
+    tier: Optional[SponsorshipTier] = Query(None, description="Filter by sponsorship tier"),
+    featured: Optional[bool] = Query(None, description="Filter by featured status"),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """Get all sponsors for a hackathon."""
+    return await list_sponsors(hackathon_id, tier, featured)
 
 @router.post("/{hackathon_id}/sponsors", response_model=SponsorResponse)
 async def add_sponsor(
     hackathon_id: str,
     sponsor_data: SponsorCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Add a new sponsor to the hackathon."""
     # Check if hackathon exists and user has permission
@@ -97,6 +121,7 @@ async def add_sponsor(
     )
     
     await sponsor.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "sponsors"))
     return SponsorResponse(**sponsor.to_dict())
 
 @router.put("/{hackathon_id}/sponsors/{sponsor_id}", response_model=SponsorResponse)
@@ -104,7 +129,7 @@ async def update_sponsor(
     hackathon_id: str,
     sponsor_id: str,
     sponsor_data: SponsorUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update a sponsor."""
     # Check permissions
@@ -136,6 +161,7 @@ async def update_sponsor(
     
     sponsor.updated_at = datetime.utcnow()
     await sponsor.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "sponsors"))
     
     return SponsorResponse(**sponsor.to_dict())
 
@@ -143,7 +169,7 @@ async def update_sponsor(
 async def remove_sponsor(
     hackathon_id: str,
     sponsor_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Remove a sponsor."""
     # Check permissions
@@ -172,13 +198,14 @@ async def remove_sponsor(
     sponsor.deleted_at = datetime.utcnow()
     sponsor.deleted_by = str(current_user.id)
     await sponsor.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "sponsors"))
     
     return {"message": "Sponsor removed successfully"}
 
 @router.get("/{hackathon_id}/sponsorship-tiers")
 async def get_sponsorship_tiers(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get sponsorship tiers with information."""
     # Check if hackathon exists
@@ -235,7 +262,7 @@ async def get_sponsorship_tiers(
 @router.get("/{hackathon_id}/sponsors/stats")
 async def get_sponsor_stats(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get sponsor statistics."""
     # Check permissions
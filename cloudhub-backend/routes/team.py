@@ -5,10 +5,10 @@ from datetime import datetime
 import uuid
 
 from models.team import Team
-from models.user import User
 from models.hackathon import Hackathon
 from database.dependencies import get_db
-from auth.jwt_manager import get_current_user, get_admin_user
+from auth.jwt_manager import get_current_principal, get_admin_user
+from auth.principal import Principal
 from schemas.team import TeamCreate, TeamUpdate, TeamResponse, TeamInvite, MilestoneCreate
 
 router = APIRouter(prefix="/teams", tags=["teams"])
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/teams", tags=["teams"])
 @router.post("/", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
 async def create_team(
     team_data: TeamCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Create a new team."""
@@ -59,6 +59,7 @@ async def create_team(
     )
     
     await team.save()
+    await Hackathon.increment_counters(team_data.hackathon_id, total_teams=1)
     
     return team
 
@@ -99,7 +100,7 @@ async def get_team(
 async def update_team(
     team_id: str,
     team_data: TeamUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Update team details."""
@@ -129,7 +130,7 @@ async def update_team(
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_team(
     team_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Delete a team."""
@@ -147,15 +148,21 @@ async def delete_team(
             detail="Only team leader can delete the team"
         )
     
-    team.is_deleted = True
-    team.deleted_at = datetime.utcnow()
-    await team.save()
+    # Only the request that flips is_deleted decrements the counter
+    deleted = await Team.get_motor_collection().find_one_and_update(
+        {"_id": team.id, "is_deleted": False},
+        {"$set": {"is_deleted": True, "deleted_at": datetime.utcnow()}},
+        projection={"_id": 1}
+    )
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Team not found")
+    await Hackathon.increment_counters(team.hackathon_id, total_teams=-1)
 
 @router.post("/{team_id}/join", response_model=TeamResponse)
 async def join_team(
     team_id: str,
     invitation_code: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Join a team using invitation code."""
@@ -202,7 +209,7 @@ async def join_team(
 @router.post("/{team_id}/leave", status_code=status.HTTP_200_OK)
 async def leave_team(
     team_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Leave a team."""
@@ -230,7 +237,7 @@ async def leave_team(
 async def invite_to_team(
     team_id: str,
     invite_data: TeamInvite,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Invite users to join the team."""
@@ -262,7 +269,7 @@ async def invite_to_team(
 async def add_milestone(
     team_id: str,
     milestone_data: MilestoneCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Add a milestone to the team's project."""
@@ -304,7 +311,7 @@ async def add_milestone(
 async def complete_milestone(
     team_id: str,
     milestone_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncIOMotorClient = Depends(get_db)
 ):
     """Mark a milestone as completed."""
@@ -5,7 +5,8 @@ from fastapi import status as http_status
 from models.team_member import TeamMember, TeamMemberRole, TeamMemberStatus, Permission
 from models.hackathon import Hackathon
 from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
 from schemas.team_member import (
     TeamMemberCreate,
     TeamMemberUpdate,
@@ -21,7 +22,7 @@ async def get_team_members(
     hackathon_id: str,
     role: Optional[TeamMemberRole] = Query(None, description="Filter by role"),
     status: Optional[TeamMemberStatus] = Query(None, description="Filter by status"),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get all team members for a hackathon."""
     # Check if user has permission to view team members
@@ -64,7 +65,7 @@ async def get_team_members(
 async def add_team_member(
     hackathon_id: str,
     member_data: TeamMemberCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Add a new team member to the hackathon."""
     # Check if hackathon exists and user has permission
@@ -128,7 +129,7 @@ async def update_team_member(
     hackathon_id: str,
     member_id: str,
     member_data: TeamMemberUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update a team member."""
     # Check permissions
@@ -167,7 +168,7 @@ async def update_team_member(
 async def remove_team_member(
     hackathon_id: str,
     member_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Remove a team member."""
     # Check permissions
@@ -202,7 +203,7 @@ async def remove_team_member(
 @router.get("/{hackathon_id}/roles")
 async def get_role_summary(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get role summary with member counts."""
     # Check permissions
@@ -253,7 +254,7 @@ async def configure_role(
     hackathon_id: str,
     role: TeamMemberRole,
     config_data: RoleConfigRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Configure role settings."""
     # Check permissions
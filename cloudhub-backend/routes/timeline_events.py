@@ -4,8 +4,9 @@ from fastapi import status as http_status
 
 from models.timeline_event import TimelineEvent, TimelineEventType, TimelineEventStatus
 from models.hackathon import Hackathon
-from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
+from services.cache_service import response_cache, hackathon_tag
 from schemas.timeline_event import (
     TimelineEventCreate,
     TimelineEventUpdate,
@@ -15,22 +16,36 @@ from datetime import datetime
 
 router = APIRouter()
 
-@router.get("/{hackathon_id}/timeline-events", response_model=List[TimelineEventResponse])
-async def get_timeline_events(
+async def list_timeline_events(
     hackathon_id: str,
-    event_type: Optional[TimelineEventType] = Query(None, description="Filter by event type"),
-    status: Optional[TimelineEventStatus] = Query(None, description="Filter by status"),
-    is_public: Optional[bool] = Query(None, description="Filter by public visibility"),
-    current_user: User = Depends(get_current_user)
-):
-    """Get all timeline events for a hackathon."""
+    event_type: Optional[TimelineEventType] = None,
+    status: Optional[TimelineEventStatus] = None,
+    is_public: Optional[bool] = None,
+    verify_hackathon: bool = True
+) -> list:
+    """
+    Load a hackathon's timeline events through the response cache.
+    
+    Callers that already loaded the hackathon pass verify_hackathon=False.
+    """
+    cache_key = (
+        f"{hackathon_tag(hackathon_id, 'timeline')}:"
+        f"{event_type.value if event_type else ''}:{status.value if status else ''}:{is_public}"
+    )
+    tags = [hackathon_tag(hackathon_id), hackathon_tag(hackathon_id, "timeline")]
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = await response_cache.generation(tags)
+    
     # Check if hackathon exists
-    hackathon = await Hackathon.get(hackathon_id)
-    if not hackathon:
-        raise HTTPException(
-            status_code=http_status.HTTP_404_NOT_FOUND,
-            detail="Hackathon not found"
-        )
+    if verify_hackathon:
+        hackathon = await Hackathon.get(hackathon_id)
+        if not hackathon:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Hackathon not found"
+            )
     
     # Build query
     query = {
@@ -46,13 +61,26 @@ async def get_timeline_events(
         query["is_public"] = is_public
     
     events = await TimelineEvent.find(query).sort("date").to_list()
-    return [TimelineEventResponse(**event.to_dict()) for event in events]
+    result = [TimelineEventResponse(**event.to_dict()) for event in events]
+    await response_cache.set(cache_key, result, tags=tags, generation=generation)
+    return result
+
+@router.get("/{hackathon_id}/timeline-events", response_model=List[TimelineEventResponse])
+async def get_timeline_events(
+    hackathon_id: str,
+    event_type: Optional[TimelineEventType] = Query(None, description="Filter by event type"),
+    status: Optional[TimelineEventStatus] = Query(None, description="Filter by status"),
+    is_public: Optional[bool] = Query(None, description="Filter by public visibility"),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """Get all timeline events for a hackathon."""
+    return await list_timeline_events(hackathon_id, event_type, status, is_public)
 
 @router.post("/{hackathon_id}/timeline-events", response_model=TimelineEventResponse)
 async def create_timeline_event(
     hackathon_id: str,
     event_data: TimelineEventCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Create a new timeline event."""
     # Check if hackathon exists and user has permission
@@ -88,6 +116,7 @@ async def create_timeline_event(
     )
     
     await event.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "timeline"))
     return TimelineEventResponse(**event.to_dict())
 
 @router.put("/{hackathon_id}/timeline-events/{event_id}", response_model=TimelineEventResponse)
@@ -95,7 +124,7 @@ async def update_timeline_event(
     hackathon_id: str,
     event_id: str,
     event_data: TimelineEventUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update a timeline event."""
     # Check permissions
@@ -127,6 +156,7 @@ async def update_timeline_event(
     
     event.updated_at = datetime.utcnow()
     await event.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "timeline"))
     
     return TimelineEventResponse(**event.to_dict())
 
@@ -134,7 +164,7 @@ async def update_timeline_event(
 async def delete_timeline_event(
     hackathon_id: str,
     event_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Delete a timeline event."""
     # Check permissions
@@ -163,6 +193,7 @@ async def delete_timeline_event(
     event.deleted_at = datetime.utcnow()
     event.deleted_by = str(current_user.id)
     await event.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "timeline"))
     
     return {"message": "Timeline event deleted successfully"}
 
@@ -170,7 +201,7 @@ async def delete_timeline_event(
 async def get_upcoming_events(
     hackathon_id: str,
     limit: int = Query(5, ge=1, le=20, description="Maximum number of events to return"),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get upcoming timeline events."""
     # Check if hackathon exists
@@ -197,7 +228,7 @@ async def update_event_status(
     hackathon_id: str,
     event_id: str,
     status: TimelineEventStatus,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Update the status of a timeline event."""
     # Check permissions
@@ -225,13 +256,14 @@ async def update_event_status(
     event.status = status
     event.updated_at = datetime.utcnow()
     await event.save()
+    await response_cache.invalidate(hackathon_tag(hackathon_id, "timeline"))
     
     return {"message": f"Event status updated to {status.value}"}
 
 @router.get("/{hackathon_id}/timeline-events/stats")
 async def get_timeline_stats(
     hackathon_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """Get timeline event statistics."""
     # Check permissions
@@ -1,19 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from typing import List, Optional, Dict, Any
 from services.bunnynet_service import BunnyNetService
-from models.user import User
-from auth.jwt_manager import get_current_user
+from auth.jwt_manager import get_current_principal
+from auth.principal import Principal
 from config.config import Settings, get_settings
+from services.rate_limit_service import rate_limit
 
 router = APIRouter(
     tags=["File Upload"]
 )
 
-@router.post("/", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("upload"))]
+)
 async def upload_file(
     file: UploadFile = File(...),
     folder: str = Form(""),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     settings: Settings = Depends(get_settings)
 ):
     """Upload a file to BunnyNet CDN."""
@@ -43,7 +49,7 @@ async def upload_file(
 @router.delete("/{file_path:path}", response_model=Dict[str, Any])
 async def delete_file(
     file_path: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     settings: Settings = Depends(get_settings)
 ):
     """Delete a file from BunnyNet CDN."""
@@ -65,7 +71,7 @@ async def delete_file(
 @router.get("/{file_path:path}", response_model=Dict[str, Any])
 async def get_file_info(
     file_path: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     settings: Settings = Depends(get_settings)
 ):
     """Get information about a file in BunnyNet CDN."""
@@ -85,7 +91,7 @@ async def get_file_info(
 @router.get("/list/{folder_path:path}", response_model=Dict[str, Any])
 async def list_files(
     folder_path: str = "",
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     settings: Settings = Depends(get_settings)
 ):
     """List files in a BunnyNet storage folder."""
@@ -101,11 +107,16 @@ async def list_files(
     
     return result
 
-@router.post("/batch", response_model=Dict[str, Any], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/batch",
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("upload"))]
+)
 async def batch_upload(
     files: List[UploadFile] = File(...),
     folder: str = Form(""),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     settings: Settings = Depends(get_settings)
 ):
     """Upload multiple files to BunnyNet CDN."""
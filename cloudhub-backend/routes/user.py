@@ -7,6 +7,7 @@ from datetime import datetime
 from models.user import User
 from schemas.user import UserResponse, UserStatus
 from auth.jwt_manager import get_current_user, get_admin_user
+from auth.principal import Principal, principal_cache
 from database.dependencies import get_db
 
 router = APIRouter(
@@ -86,6 +87,7 @@ async def update_user_profile(
             setattr(current_user, field, value)
     
     await current_user.save()
+    principal_cache.invalidate(current_user.id)
     
     return UserResponse(
         id=str(current_user.id),
@@ -148,7 +150,7 @@ async def get_users(
 async def delete_user(
     user_id: str,
     db: AsyncIOMotorClient = Depends(get_db),
-    admin: User = Depends(get_admin_user)
+    admin: Principal = Depends(get_admin_user)
 ):
     """Delete user (admin only)."""
     user = await User.find_one(User.id == user_id, User.is_deleted == False)
@@ -160,4 +162,5 @@ async def delete_user(
     
     user.is_deleted = True
     user.deleted_at = datetime.utcnow()
-    await user.save() 
\ No newline at end of file
+    await user.save()
+    principal_cache.invalidate(user.id)
\ No newline at end of file
@@ -0,0 +1,149 @@
+import asyncio
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Dict, List
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from bson import ObjectId
+from fastapi import FastAPI
+
+from utils.responses import FastJSONResponse
+
+ITERATIONS = 300
+
+def _timestamp(offset_minutes: int = 0) -> str:
+    return (datetime(2025, 5, 1) + timedelta(minutes=offset_minutes)).isoformat()
+
+def _user(i: int) -> Dict[str, Any]:
+    return {
+        "id": str(ObjectId()),
+        "email": f"user{i}@example.com",
+        "username": f"user{i}",
+        "full_name": f"User {i}",
+        "role": "participant",
+        "skills": ["python", "react", "mongodb"],
+        "created_at": _timestamp(i)
+    }
+
+def my_hackathons_payload(count: int = 50) -> Dict[str, Any]:
+    """Shaped like GET /api/hackathons/my-hackathons."""
+    hackathons = [{
+        "id": str(ObjectId()),
+        "title": f"Hackathon {i}",
+        "description": "Build something great in 48 hours. " * 10,
+        "startDate": _timestamp(i),
+        "endDate": _timestamp(i + 2880),
+        "registrationDeadline": _timestamp(i - 1440),
+        "participants": 12,
+        "maxParticipants": 500,
+        "submissionCount": 40,
+        "prizePool": "25000",
+        "status": "Active",
+        "progress": 42,
+        "bannerImage": "https://cdn.example.com/banner.png",
+        "categories": ["ai", "web", "fintech"],
+        "featured": False,
+        "role": "owner",
+        "participants_count": 320,
+        "submission_count": 40,
+        "coverImage": "https://cdn.example.com/cover.png",
+        "organizationName": "CloudHub",
+        "organizationLogo": "https://cdn.example.com/logo.png"
+    } for i in range(count)]
+    return {"hackathons": hackathons, "total": count, "pages": 1, "has_more": False, "next_cursor": None}
+
+def projects_payload(count: int = 200) -> Dict[str, List[Dict[str, Any]]]:
+    """Shaped like GET /api/projects/."""
+    projects = [{
+        "id": str(ObjectId()),
+        "title": f"Project {i}",
+        "description": "An app that does things. " * 20,
+        "team_id": str(ObjectId()),
+        "hackathon_id": str(ObjectId()),
+        "status": "submitted",
+        "tech_stack": ["fastapi", "nextjs", "mongodb"],
+        "github_url": "https://github.com/example/project",
+        "demo_url": "https://demo.example.com",
+        "images": [f"https://cdn.example.com/{uuid.uuid4()}.png" for _ in range(3)],
+        "scores": [{"judge_id": str(ObjectId()), "score": 8.5, "criteria": "innovation"}],
+        "created_at": _timestamp(i),
+        "updated_at": _timestamp(i + 10),
+        "is_deleted": False,
+        "deleted_at": None
+    } for i in range(count)]
+    return {"projects": projects}
+
+def messages_payload(count: int = 100) -> List[Dict[str, Any]]:
+    """Shaped like GET /api/messages/direct/{user_id}."""
+    sender, receiver = _user(1), _user(2)
+    return [{
+        "id": str(ObjectId()),
+        "created_at": _timestamp(i),
+        "updated_at": _timestamp(i),
+        "is_deleted": False,
+        "deleted_at": None,
+        "sender_id": sender["id"],
+        "receiver_id": receiver["id"],
+        "content": f"Message number {i} with some text in it",
+        "message_type": "text",
+        "attachments": [],
+        "is_read": i % 2 == 0,
+        "read_at": None,
+        "is_edited": False,
+        "edited_at": None,
+        "sender": sender,
+        "receiver": receiver
+    } for i in range(count)]
+
+PAYLOADS = {
+    "/my-hackathons": (my_hackathons_payload(), Dict[str, Any]),
+    "/projects": (projects_payload(), Dict[str, List[Dict[str, Any]]]),
+    "/messages": (messages_payload(), List[dict]),
+}
+
+def build_app() -> FastAPI:
+    """Each payload behind a validating route (before) and a FastJSONResponse route (after)."""
+    app = FastAPI()
+    for path, (payload, response_model) in PAYLOADS.items():
+        def make_routes(payload=payload):
+            async def before():
+                return payload
+
+            async def after():
+                return FastJSONResponse(payload)
+
+            return before, after
+
+        before, after = make_routes()
+        app.get(f"/before{path}", response_model=response_model)(before)
+        app.get(f"/after{path}", response_model=response_model)(after)
+    return app
+
+async def time_route(client: httpx.AsyncClient, url: str) -> float:
+    """Mean milliseconds per request over ITERATIONS calls."""
+    for _ in range(10):
+        await client.get(url)
+    start = perf_counter()
+    for _ in range(ITERATIONS):
+        response = await client.get(url)
+        response.raise_for_status()
+    return (perf_counter() - start) * 1000 / ITERATIONS
+
+async def main():
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        print(f"{'route':<16}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+        for path in PAYLOADS:
+            before = await time_route(client, f"/before{path}")
+            after = await time_route(client, f"/after{path}")
+            print(f"{path:<16}{before:>12.3f}{after:>12.3f}{before / after:>9.2f}x")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,411 @@
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from config.config import settings
+
+SEED_BATCH_SIZE = 1000
+SEED_TAG = "loadtest"
+
+class _StripeSession(dict):
+    """Stands in for stripe.checkout.Session; attributes read like the real object."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+def stub_external_services():
+    """Replace the Stripe and BunnyNet calls with canned, instant responses."""
+    import stripe
+    from services.bunnynet_service import BunnyNetService
+
+    def create_session(**kwargs):
+        session_id = f"cs_test_{random.getrandbits(48):012x}"
+        return _StripeSession(id=session_id, url=f"https://checkout.stripe.test/{session_id}", **kwargs)
+
+    def retrieve_session(session_id, **kwargs):
+        return _StripeSession(id=session_id, payment_status="unpaid", metadata={})
+
+    stripe.checkout.Session.create = staticmethod(create_session)
+    stripe.checkout.Session.retrieve = staticmethod(retrieve_session)
+
+    files = [
+        {"ObjectName": f"file-{i}.png", "Length": 2048 * i, "IsDirectory": False, "LastChanged": "2025-05-01T00:00:00"}
+        for i in range(25)
+    ]
+    BunnyNetService.list_files = lambda self, folder_path="": {"success": True, "files": files, "count": len(files)}
+    BunnyNetService.get_file_info = lambda self, file_path: {"success": True, "file": files[0]}
+    BunnyNetService.upload_file = lambda self, file, filename=None, folder_path="": {
+        "success": True, "url": f"https://cdn.example.com/{folder_path}{filename}", "path": f"{folder_path}{filename}"
+    }
+    BunnyNetService.delete_file = lambda self, file_path: {"success": True}
+
+def open_client(mongo_url: Optional[str]):
+    """A Motor client for mongo_url, or an in-memory stand-in when no URL is given."""
+    if mongo_url:
+        return AsyncIOMotorClient(mongo_url)
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        raise SystemExit("mongomock-motor is not installed; pass --mongo-url to use a local mongod")
+    return AsyncMongoMockClient()
+
+async def seed(scale: Dict[str, int]) -> Dict[str, List[str]]:
+    """
+    Insert synthetic users, hackathons, registrations, teams, projects and messages.
+
+    Returns the ids the scenarios pick from.
+    """
+    from beanie import PydanticObjectId
+    from models.user import User
+    from models.hackathon import Hackathon, HackathonStatus, Timeline, BillingInfo, PricingTier
+    from models.registration import HackathonRegistration
+    from models.team import Team
+    from models.project import Project
+    from models.message import Message
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+
+    async def insert(model, documents):
+        # insert_many does not set ids on the documents; later rows link to them
+        for document in documents:
+            document.id = PydanticObjectId()
+        for start in range(0, len(documents), SEED_BATCH_SIZE):
+            await model.insert_many(documents[start:start + SEED_BATCH_SIZE])
+
+    users = [
+        User(
+            email=f"{SEED_TAG}-user{i}@example.com",
+            password_hash="not-a-real-hash",
+            name=f"Load Test User {i}",
+            role="organizer" if i % 10 == 0 else "participant",
+            skills=rng.sample(["python", "react", "mongodb", "rust", "go", "design"], 3)
+        )
+        for i in range(scale["users"])
+    ]
+    await insert(User, users)
+    organizers = [user for user in users if user.role == "organizer"] or users[:1]
+
+    hackathons = []
+    for i in range(scale["hackathons"]):
+        start = now + timedelta(days=rng.randint(-30, 60))
+        hackathons.append(Hackathon(
+            title=f"Load Test Hackathon {i}",
+            slug=f"{SEED_TAG}-hackathon-{i}",
+            description="Build something great in 48 hours. " * 10,
+            short_description="Build something great",
+            organizer_id=str(organizers[i % len(organizers)].id),
+            organization_name="CloudHub",
+            categories=rng.sample(["ai", "web", "fintech", "health", "climate"], 2),
+            timeline=Timeline(
+                registration_start=start - timedelta(days=14),
+                registration_end=start - timedelta(days=1),
+                event_start=start,
+                event_end=start + timedelta(days=2),
+                judging_start=start + timedelta(days=2),
+                judging_end=start + timedelta(days=4),
+                winners_announcement=start + timedelta(days=5)
+            ),
+            billing=BillingInfo(pricing_tier=PricingTier.STARTER, base_price=1, total_amount=1),
+            status=HackathonStatus.PUBLISHED,
+            created_at=now - timedelta(minutes=i)
+        ))
+    await insert(Hackathon, hackathons)
+
+    registrations, counts = [], defaultdict(int)
+    for user in users:
+        for hackathon in rng.sample(hackathons, min(scale["registrations_per_user"], len(hackathons))):
+            registrations.append(HackathonRegistration(hackathon_id=str(hackathon.id), user_id=str(user.id)))
+            counts[hackathon.id] += 1
+    await insert(HackathonRegistration, registrations)
+
+    teams = []
+    for i in range(scale["teams"]):
+        hackathon = hackathons[i % len(hackathons)]
+        leader = rng.choice(users)
+        teams.append(Team(
+            name=f"Team {i:04d}",
+            hackathon_id=str(hackathon.id),
+            leader_id=str(leader.id),
+            description="A team of builders",
+            required_skills=["python", "react"]
+        ))
+    await insert(Team, teams)
+
+    projects = []
+    for i in range(scale["projects"]):
+        team = teams[i % len(teams)]
+        hackathon = next(h for h in hackathons if str(h.id) == team.hackathon_id)
+        projects.append(Project(
+            title=f"Project {i}",
+            description="An app that does things. " * 20,
+            team=team,
+            hackathon=hackathon,
+            technologies=["fastapi", "nextjs", "mongodb"],
+            repository_url="https://github.com/example/project",
+            status="submitted" if i % 3 else "draft"
+        ))
+    await insert(Project, projects)
+
+    messages = []
+    for i in range(scale["messages"]):
+        sender, receiver = rng.sample(users, 2) if len(users) > 1 else (users[0], users[0])
+        messages.append(Message(
+            sender=sender,
+            receiver=receiver,
+            content=f"Message number {i} with some text in it",
+            created_at=now - timedelta(seconds=i)
+        ))
+    await insert(Message, messages)
+
+    team_counts = defaultdict(int)
+    for team in teams:
+        team_counts[team.hackathon_id] += 1
+    for hackathon in hackathons:
+        await hackathon.set({
+            "registered_participants": counts[hackathon.id],
+            "total_teams": team_counts[str(hackathon.id)]
+        })
+
+    return {
+        "users": [str(user.id) for user in users],
+        "hackathons": [str(hackathon.id) for hackathon in hackathons]
+    }
+
+def build_scenarios(ids: Dict[str, List[str]]) -> List[Tuple[str, str, Any]]:
+    """(name, method, path factory) for each endpoint under test, weighted by repetition."""
+    hackathon = lambda rng: rng.choice(ids["hackathons"])
+    user = lambda rng: rng.choice(ids["users"])
+    scenarios = [
+        ("GET /api/hackathons/", "GET", lambda rng: "/api/hackathons/?limit=20"),
+        ("GET /api/hackathons/{id}", "GET", lambda rng: f"/api/hackathons/{hackathon(rng)}"),
+        ("GET /api/hackathons/{id}/bundle", "GET", lambda rng: f"/api/hackathons/{hackathon(rng)}/bundle"),
+        ("GET /api/hackathons/{id}/participants", "GET", lambda rng: f"/api/hackathons/{hackathon(rng)}/participants"),
+        ("GET /api/hackathons/my-hackathons", "GET", lambda rng: "/api/hackathons/my-hackathons"),
+        # The projects router carries its own /projects prefix
+        ("GET /api/projects/projects/", "GET", lambda rng: f"/api/projects/projects/?hackathon_id={hackathon(rng)}"),
+        ("GET /api/messages/direct/{id}", "GET", lambda rng: f"/api/messages/direct/{user(rng)}"),
+        ("GET /api/auth/me", "GET", lambda rng: "/api/auth/me"),
+        ("GET /api/upload/list/", "GET", lambda rng: "/api/upload/list/"),
+        ("GET /api/payment/verify-session/{id}", "GET", lambda rng: f"/api/payment/verify-session/cs_test_{rng.getrandbits(32):08x}"),
+    ]
+    # Public listing and detail pages dominate real traffic
+    return scenarios[:2] * 3 + scenarios
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    # Rounding first keeps float noise (0.07 * 100 == 7.000000000000001) from moving up a rank
+    rank = math.ceil(round(fraction * len(sorted_values), 9))
+    index = min(len(sorted_values) - 1, max(0, rank - 1))
+    return sorted_values[index]
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: List[Tuple[str, str, Any]],
+    tokens: List[str],
+    concurrency: int,
+    total_requests: int
+) -> Tuple[Dict[str, Dict[str, Any]], float]:
+    """Send total_requests spread over concurrency workers; returns per-endpoint samples and wall time."""
+    samples: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"latencies": [], "errors": 0, "statuses": defaultdict(int)})
+    remaining = iter(range(total_requests))
+
+    async def worker(worker_id: int):
+        rng = random.Random(worker_id)
+        headers = {"Authorization": f"Bearer {tokens[worker_id % len(tokens)]}", "Accept-Encoding": "gzip"}
+        for _ in remaining:
+            name, method, path = rng.choice(scenarios)
+            start = perf_counter()
+            try:
+                response = await client.request(method, path(rng), headers=headers)
+                status_code = response.status_code
+            except Exception:
+                status_code = 0
+            elapsed_ms = (perf_counter() - start) * 1000
+            sample = samples[name]
+            sample["latencies"].append(elapsed_ms)
+            sample["statuses"][status_code] += 1
+            if status_code == 0 or status_code >= 500:
+                sample["errors"] += 1
+
+    start = perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return samples, perf_counter() - start
+
+def summarize(samples: Dict[str, Dict[str, Any]], duration: float) -> Dict[str, Dict[str, Any]]:
+    """Throughput, error count and latency percentiles per endpoint."""
+    summary = {}
+    for name, sample in sorted(samples.items()):
+        latencies = sorted(sample["latencies"])
+        summary[name] = {
+            "requests": len(latencies),
+            "errors": sample["errors"],
+            "statuses": {str(code): count for code, count in sorted(sample["statuses"].items())},
+            "throughput_rps": round(len(latencies) / duration, 2) if duration else 0.0,
+            "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+            "p99_ms": round(percentile(latencies, 0.99), 3)
+        }
+    return summary
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Regressions against a baseline result file.
+
+    An endpoint regresses when its p95 grows, or its throughput drops, by
+    more than tolerance (a fraction), or when it starts returning errors.
+    """
+    regressions = []
+    for name, current in results["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if previous is None:
+            continue
+        if previous["p95_ms"] and current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.2f} -> {current['p95_ms']:.2f} ms")
+        if previous["throughput_rps"] and current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {previous['throughput_rps']:.1f} -> {current['throughput_rps']:.1f} req/s"
+            )
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: errors {previous['errors']} -> {current['errors']}")
+    return regressions
+
+def print_summary(results: Dict[str, Any]):
+    print(f"{'endpoint':<42}{'reqs':>7}{'err':>5}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in results["endpoints"].items():
+        print(
+            f"{name:<42}{stats['requests']:>7}{stats['errors']:>5}{stats['throughput_rps']:>10.1f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+    print(f"total: {results['total_requests']} requests in {results['duration_s']:.2f}s "
+          f"({results['throughput_rps']:.1f} req/s)")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the CloudHub API against seeded synthetic data.")
+    parser.add_argument("--mongo-url", help="MongoDB to seed and test against; defaults to an in-memory stand-in")
+    parser.add_argument("--database", default=f"cloudhub_{SEED_TAG}", help="Database name, dropped before seeding")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--hackathons", type=int, default=50)
+    parser.add_argument("--registrations-per-user", type=int, default=3)
+    parser.add_argument("--teams", type=int, default=100)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests across all clients")
+    parser.add_argument("--warmup", type=int, default=100, help="Requests sent before measuring")
+    parser.add_argument("--output", default="load_test_results.json", help="Where to write the results")
+    parser.add_argument("--baseline", help="Results file to compare against; exits 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95/throughput change, as a fraction")
+    return parser.parse_args(argv)
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    # The load generator is a single client; don't let it trip the limiter
+    settings.RATE_LIMIT_ENABLED = False
+    settings.SLOW_QUERY_EXPLAIN = False
+    settings.DATABASE_NAME = args.database
+
+    import app as application
+    import database.db
+    from auth.jwt_manager import TokenManager
+    from database.health import db_health
+    from database.schema import init_models
+    from services.cache_service import response_cache
+
+    # Per-request logging would dominate the timings
+    logging.getLogger().setLevel(logging.WARNING)
+    stub_external_services()
+
+    client = open_client(args.mongo_url)
+    # get_db() hands out this client instead of connecting to DATABASE_URL
+    database.db.client = client
+    await client.drop_database(args.database)
+    await init_models(client[args.database], [
+        application.User, application.RefreshToken, application.RevokedAccessToken, application.Message, application.GroupMessage,
+        application.Group, application.Project, application.Team, application.Hackathon,
+        application.PendingHackathon, application.TeamMember, application.Sponsor,
+        application.TimelineEvent, application.Resource, application.FAQ, application.HackathonRegistration
+    ])
+    db_health.is_connected = True
+    db_health.beanie_initialized = True
+    await response_cache.connect()
+
+    scale = {
+        "users": max(2, args.users),
+        "hackathons": max(1, args.hackathons),
+        "registrations_per_user": args.registrations_per_user,
+        "teams": max(1, args.teams),
+        "projects": args.projects,
+        "messages": args.messages
+    }
+    seed_start = perf_counter()
+    ids = await seed(scale)
+    print(f"seeded {scale} in {perf_counter() - seed_start:.1f}s")
+
+    tokens = [
+        TokenManager.create_access_token({"sub": user_id, "type": "access"})
+        for user_id in ids["users"][:max(1, args.concurrency)]
+    ]
+    scenarios = build_scenarios(ids)
+
+    transport = httpx.ASGITransport(app=application.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as http:
+        if args.warmup:
+            await run_load(http, scenarios, tokens, args.concurrency, args.warmup)
+        samples, duration = await run_load(http, scenarios, tokens, args.concurrency, args.requests)
+
+    await response_cache.close()
+    database.db.close_db()
+
+    results = {
+        "created_at": datetime.utcnow().isoformat(),
+        "database": "mongod" if args.mongo_url else "in-memory",
+        "scale": scale,
+        "concurrency": args.concurrency,
+        "total_requests": args.requests,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(args.requests / duration, 2) if duration else 0.0,
+        "endpoints": summarize(samples, duration)
+    }
+    print_summary(results)
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,112 @@
+import asyncio
+import sys
+import os
+from datetime import datetime
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from beanie import init_beanie
+from pymongo.errors import BulkWriteError
+
+from database.db import get_db
+from config.config import settings
+from models.hackathon import Hackathon
+from models.registration import HackathonRegistration
+
+HACKATHON_BATCH_SIZE = 100
+INSERT_BATCH_SIZE = 1000
+DUPLICATE_KEY_ERROR = 11000
+
+async def migrate_hackathon(hackathon_id, user_ids) -> int:
+    """
+    Move one hackathon's embedded participants array into hackathon_registrations.
+
+    The old register path appended to the array without ever incrementing
+    registered_participants, so the counter cannot be adjusted and is set
+    from the real row count once the copy is done. That $set is conditional
+    on counters_updated_at still holding the value read before counting; if
+    a registration moved the counter meanwhile, the count is taken again.
+
+    The register endpoint refuses hackathons that still carry the array, so
+    no seat is claimed against the legacy counter before this runs.
+
+    Re-running after a failure is safe: rows that already exist are skipped
+    by the unique (hackathon_id, user_id) index.
+
+    Returns:
+        int: Number of registrations copied
+    """
+    hackathon_key = str(hackathon_id)
+    registrations = HackathonRegistration.get_motor_collection()
+    hackathons = Hackathon.get_motor_collection()
+    now = datetime.utcnow()
+    inserted = 0
+
+    for start in range(0, len(user_ids), INSERT_BATCH_SIZE):
+        batch = user_ids[start:start + INSERT_BATCH_SIZE]
+        documents = [
+            {"hackathon_id": hackathon_key, "user_id": str(user_id), "registered_at": now}
+            for user_id in batch
+        ]
+        try:
+            result = await registrations.insert_many(documents, ordered=False)
+            inserted += len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Users who registered again through the new collection already have a row
+            errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != DUPLICATE_KEY_ERROR]
+            if errors:
+                raise
+            inserted += e.details.get("nInserted", 0)
+
+    while True:
+        doc = await hackathons.find_one({"_id": hackathon_id}, {"counters_updated_at": 1})
+        if doc is None:
+            return inserted
+        counters_updated_at = doc.get("counters_updated_at")
+        registered = await registrations.count_documents({"hackathon_id": hackathon_key})
+        result = await hackathons.update_one(
+            {"_id": hackathon_id, "counters_updated_at": counters_updated_at},
+            {
+                "$set": {"registered_participants": registered, "counters_updated_at": datetime.utcnow()},
+                "$unset": {"participants": ""}
+            }
+        )
+        if result.matched_count:
+            return inserted
+
+async def migrate_registrations(pause_seconds: float = 0.1):
+    """Migrate all hackathons that still carry an embedded participants array."""
+    print("Initializing database connection...")
+    client = get_db()
+    await init_beanie(
+        database=client[settings.DATABASE_NAME],
+        document_models=[Hackathon, HackathonRegistration]
+    )
+
+    collection = Hackathon.get_motor_collection()
+    last_id = None
+    migrated = 0
+
+    while True:
+        query = {"participants": {"$exists": True}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch = await collection.find(query, {"participants": 1}).sort("_id", 1).limit(HACKATHON_BATCH_SIZE).to_list(None)
+        if not batch:
+            break
+
+        for doc in batch:
+            participants = doc.get("participants") or []
+            copied = await migrate_hackathon(doc["_id"], participants)
+            migrated += 1
+            print(f"Migrated hackathon {doc['_id']}: {copied} of {len(participants)} registrations copied")
+
+        last_id = batch[-1]["_id"]
+        # Leave room for live traffic between batches
+        await asyncio.sleep(pause_seconds)
+
+    print(f"\nMigration completed: {migrated} hackathons migrated")
+
+if __name__ == "__main__":
+    asyncio.run(migrate_registrations())
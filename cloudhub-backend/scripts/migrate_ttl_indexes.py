@@ -0,0 +1,65 @@
+import asyncio
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.db import get_db
+from config.config import settings
+from models.token import RefreshToken
+from models.pending_hackathon import PendingHackathon
+
+# Indexes the TTL indexes replace, by collection
+REPLACED_INDEXES = {
+    "pending_hackathons": ["expires_at_1", "is_processed_1"],
+}
+
+async def migrate_model(database, model) -> None:
+    """Build the model's TTL indexes that do not exist yet, then drop the indexes they replace."""
+    collection = database[model.Settings.name]
+    existing = await collection.index_information()
+
+    ttl_indexes = [
+        index for index in model.Settings.indexes
+        if not isinstance(index, str) and "expireAfterSeconds" in index.document
+    ]
+    for index in ttl_indexes:
+        name = index.document["name"]
+        if name in existing:
+            print(f"{collection.name}.{name} already exists")
+            continue
+        # A plain index on the same key would conflict with the TTL one
+        for replaced in REPLACED_INDEXES.get(collection.name, []):
+            if replaced in existing and existing[replaced]["key"] == list(index.document["key"].items()):
+                await collection.drop_index(replaced)
+                del existing[replaced]
+                print(f"Dropped {collection.name}.{replaced}")
+        print(f"Building {collection.name}.{name}...")
+        await collection.create_indexes([index])
+        print(f"Built {collection.name}.{name}")
+
+    for replaced in REPLACED_INDEXES.get(collection.name, []):
+        if replaced in existing:
+            await collection.drop_index(replaced)
+            print(f"Dropped {collection.name}.{replaced}")
+
+async def migrate_ttl_indexes():
+    """
+    Build the refresh token and pending hackathon TTL indexes ahead of a deploy.
+
+    Run this before starting the new version: the index builds then happen
+    here instead of in the worker that reconciles indexes at startup, which
+    finds them already in place. Mongo's TTL monitor takes over expiry from
+    the removed cleanup job; it runs once a minute.
+    """
+    print("Initializing database connection...")
+    database = get_db()[settings.DATABASE_NAME]
+
+    for model in (RefreshToken, PendingHackathon):
+        await migrate_model(database, model)
+
+    print("\nTTL index migration completed")
+
+if __name__ == "__main__":
+    asyncio.run(migrate_ttl_indexes())
@@ -1,6 +1,5 @@
 from datetime import datetime, timedelta
 import uuid
-import bcrypt
 import jwt
 import pyotp
 from typing import Optional, Tuple, Dict, Any
@@ -16,7 +15,8 @@ from models.auth import (
 )
 from models.token import RefreshToken
 from models.user import User
-from auth.utils import get_password_hash
+from auth.utils import hash_password, check_password
+from auth.principal import principal_cache
 
 class AuthService:
     def __init__(self, db: AsyncIOMotorClient):
@@ -36,7 +36,7 @@ class AuthService:
                 raise ValueError("Email already registered")
 
             # Hash password
-            password_hash = get_password_hash(user_data["password"])
+            password_hash = await hash_password(user_data["password"])
             
             # Handle name field
             name = user_data.get("name") or user_data.get("full_name")
@@ -89,6 +89,8 @@ class AuthService:
             
             return user_dict
             
+        except HTTPException:
+            raise
         except ValueError as e:
             raise ValueError(str(e))
         except Exception as e:
@@ -144,7 +146,7 @@ class AuthService:
             )
 
         # Verify password
-        if not bcrypt.checkpw(password.encode(), user["password_hash"].encode()):
+        if not await check_password(password, user["password_hash"]):
             # Increment failed login attempts
             await self.db.users.update_one(
                 {"_id": user["_id"]},
@@ -156,6 +158,8 @@ class AuthService:
                     } if user["failed_login_attempts"] + 1 >= self.MAX_LOGIN_ATTEMPTS else {}
                 }
             )
+            if user["failed_login_attempts"] + 1 >= self.MAX_LOGIN_ATTEMPTS:
+                principal_cache.invalidate(user["_id"])
             
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -175,6 +179,8 @@ class AuthService:
                 }
             }
         )
+        if user.get("account_locked"):
+            principal_cache.invalidate(user["_id"])
 
         # Generate tokens
         access_token = self._create_access_token(str(user["_id"]))
@@ -245,10 +251,7 @@ class AuthService:
             )
 
         # Hash new password
-        password_hash = bcrypt.hashpw(
-            new_password.encode(),
-            bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
-        ).decode()
+        password_hash = await hash_password(new_password)
 
         user.password_hash = password_hash
         user.password_reset_token = None
@@ -7,6 +7,7 @@ from datetime import datetime
 import uuid
 import logging
 from config.config import Settings
+from utils.metrics import track_outbound
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
@@ -36,7 +37,8 @@ class BunnyNetService:
             }
             
             try:
-                response = requests.get(api_url, headers=headers, timeout=30)
+                with track_outbound("bunnynet", "get_storage_zones"):
+                    response = requests.get(api_url, headers=headers, timeout=30)
                 response.raise_for_status()
                 
                 zones = response.json()
@@ -160,12 +162,13 @@ class BunnyNetService:
             logger.info(f"Upload path: {upload_path}")
             
             # Upload to BunnyNet with timeout
-            response = requests.put(
-                upload_url,
-                data=file_data,
-                headers=headers,
-                timeout=60
-            )
+            with track_outbound("bunnynet", "upload"):
+                response = requests.put(
+                    upload_url,
+                    data=file_data,
+                    headers=headers,
+                    timeout=60
+                )
             
             if response.status_code not in (200, 201):
                 error_msg = f"Upload failed with status {response.status_code}: {response.text}"
@@ -215,11 +218,12 @@ class BunnyNetService:
             file_path = file_path.strip('/').replace('\\', '/')
             delete_url = f"{self.base_url}{file_path}"
             
-            response = requests.delete(
-                delete_url,
-                headers=self._get_headers(use_storage_password=True),
-                timeout=30
-            )
+            with track_outbound("bunnynet", "delete"):
+                response = requests.delete(
+                    delete_url,
+                    headers=self._get_headers(use_storage_password=True),
+                    timeout=30
+                )
             
             success = response.status_code in (200, 204)
             
@@ -258,11 +262,12 @@ class BunnyNetService:
                 folder_path = folder_path.strip('/').replace('\\', '/') + '/'
             
             list_url = f"{self.base_url}{folder_path}"
-            response = requests.get(
-                list_url,
-                headers=self._get_headers(use_storage_password=True),
-                timeout=30
-            )
+            with track_outbound("bunnynet", "list"):
+                response = requests.get(
+                    list_url,
+                    headers=self._get_headers(use_storage_password=True),
+                    timeout=30
+                )
             
             if response.status_code == 200:
                 files = response.json()
@@ -0,0 +1,266 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from config.config import settings
+from services.redis_failover import RedisFailover
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cloudhub:cache:"
+TAG_PREFIX = "cloudhub:tag:"
+GENERATION_PREFIX = "cloudhub:gen:"
+
+# Tag generations outlive any request that could still hold an old one
+GENERATION_TTL_SECONDS = 86400
+
+# KEYS: tag sets then generation keys; ARGV: key, value, ttl, then the generations read before loading
+SET_IF_CURRENT_SCRIPT = """
+local tag_count = #KEYS / 2
+for i = 1, tag_count do
+    if (redis.call('GET', KEYS[tag_count + i]) or '0') ~= ARGV[3 + i] then
+        return 0
+    end
+end
+redis.call('SET', '""" + KEY_PREFIX + """' .. ARGV[1], ARGV[2], 'EX', ARGV[3])
+for i = 1, tag_count do
+    redis.call('SADD', KEYS[i], ARGV[1])
+    redis.call('EXPIRE', KEYS[i], ARGV[3])
+end
+return 1
+"""
+
+# KEYS: tag sets then generation keys; bumps each generation, then drops the tagged keys
+INVALIDATE_SCRIPT = """
+local tag_count = #KEYS / 2
+for i = 1, tag_count do
+    redis.call('INCR', KEYS[tag_count + i])
+    redis.call('EXPIRE', KEYS[tag_count + i], ARGV[1])
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[i])) do
+        redis.call('DEL', '""" + KEY_PREFIX + """' .. key)
+    end
+    redis.call('DEL', KEYS[i])
+end
+return 1
+"""
+
+
+def hackathon_tag(hackathon_id: str, section: Optional[str] = None) -> str:
+    """
+    Build the invalidation tag for a hackathon or one of its sections.
+
+    Every cached entry of a hackathon carries the plain tag, so invalidating
+    hackathon:{id} drops the detail view and all sub-resource lists at once.
+    """
+    tag = f"hackathon:{hackathon_id}"
+    return f"{tag}:{section}" if section else tag
+
+
+class MemoryCacheBackend:
+    """
+    Bounded in-process LRU cache with per-entry TTL and tag index.
+
+    A single generation counter, bumped by every invalidation, stands in for
+    per-tag generations: a load racing with any invalidation is not stored.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._generation = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def generation(self, tags: Tuple[str, ...]) -> int:
+        return self._generation
+
+    async def set(self, key: str, value: Any, tags: Tuple[str, ...], ttl: int, generation: int):
+        if generation != self._generation:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    async def invalidate(self, tags: Tuple[str, ...]):
+        self._generation += 1
+        for tag in tags:
+            for key in self._tags.pop(tag, set()):
+                self._remove(key)
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+        self._tags.clear()
+
+    async def close(self):
+        self.clear()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend:
+    """
+    Redis cache; each tag is a set holding the keys to drop with it.
+
+    Each tag also has a generation counter. Invalidation bumps it, and set()
+    only stores an entry whose tags still have the generations the caller
+    read before loading; both run as scripts, so neither interleaves.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.set_if_current = client.register_script(SET_IF_CURRENT_SCRIPT)
+        self.invalidate_tags = client.register_script(INVALIDATE_SCRIPT)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(KEY_PREFIX + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def generation(self, tags: Tuple[str, ...]) -> Tuple[str, ...]:
+        if not tags:
+            return ()
+        values = await self.client.mget([GENERATION_PREFIX + tag for tag in tags])
+        return tuple(value or "0" for value in values)
+
+    async def set(self, key: str, value: Any, tags: Tuple[str, ...], ttl: int, generation: Tuple[str, ...]):
+        await self.set_if_current(
+            keys=[TAG_PREFIX + tag for tag in tags] + [GENERATION_PREFIX + tag for tag in tags],
+            args=[key, json.dumps(value), ttl, *generation]
+        )
+
+    async def invalidate(self, tags: Tuple[str, ...]):
+        await self.invalidate_tags(
+            keys=[TAG_PREFIX + tag for tag in tags] + [GENERATION_PREFIX + tag for tag in tags],
+            args=[GENERATION_TTL_SECONDS]
+        )
+
+    async def close(self):
+        await self.client.close()
+
+
+class ResponseCache(RedisFailover):
+    """
+    Tag-invalidated cache for read-heavy API responses.
+
+    Uses Redis when settings.REDIS_URL is reachable at startup and falls back
+    to a bounded in-process LRU otherwise or while Redis is failing. The
+    in-process cache is per worker, so with several workers and no Redis,
+    entries in other workers expire by TTL rather than by invalidation.
+
+    Loaders read generation() before querying Mongo and hand it to set(), so
+    a load that raced with a write's invalidation is not stored. Tags
+    invalidated while Redis is failing, including by the call that failed,
+    are invalidated in Redis before switching back to it, so entries left
+    there are never served.
+    """
+
+    name = "response cache"
+
+    def __init__(self):
+        super().__init__(MemoryCacheBackend(settings.CACHE_MAX_ENTRIES))
+        self.ttl = settings.CACHE_TTL_SECONDS
+        self._pending_invalidations: Set[str] = set()
+
+    def create_redis_backend(self, client):
+        return RedisCacheBackend(client)
+
+    async def connect(self):
+        if settings.CACHE_ENABLED:
+            await super().connect()
+
+    def on_trip(self):
+        # Entries kept from an earlier outage missed every invalidation since
+        self.memory.clear()
+
+    async def before_restore(self):
+        while self._pending_invalidations:
+            tags = tuple(self._pending_invalidations)
+            self._pending_invalidations.clear()
+            try:
+                await self.redis.invalidate(tags)
+            except Exception:
+                self._pending_invalidations.update(tags)
+                raise
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or cache error."""
+        if not settings.CACHE_ENABLED:
+            return None
+        backend = self.backend
+        try:
+            return await backend.get(key)
+        except Exception as e:
+            self.backend_failed(backend, e, f"cache get for {key}")
+            return None
+
+    async def generation(self, tags: Iterable[str]) -> Optional[Tuple[Any, Any]]:
+        """Snapshot the tags' generations; read it before loading what set() will store."""
+        if not settings.CACHE_ENABLED:
+            return None
+        backend = self.backend
+        try:
+            return backend, await backend.generation(tuple(tags))
+        except Exception as e:
+            self.backend_failed(backend, e, f"cache generation read for {tags}")
+            return None
+
+    async def set(self, key: str, value: Any, tags: Iterable[str], generation: Optional[Tuple[Any, Any]], ttl: Optional[int] = None):
+        """
+        Store a JSON-encodable value under key, tagged for invalidation.
+
+        Skipped when any tag was invalidated after generation was read, or
+        the cache switched backends since.
+        """
+        if generation is None or not settings.CACHE_ENABLED:
+            return
+        backend, tag_generation = generation
+        if backend is not self.backend:
+            return
+        try:
+            await backend.set(key, jsonable_encoder(value), tuple(tags), ttl or self.ttl, tag_generation)
+        except Exception as e:
+            self.backend_failed(backend, e, f"cache set for {key}")
+
+    async def invalidate(self, *tags: str):
+        """Drop every entry carrying any of the given tags."""
+        backend = self.backend
+        if self.redis is not None and backend is not self.redis:
+            self._pending_invalidations.update(tags)
+        try:
+            await backend.invalidate(tags)
+        except Exception as e:
+            if backend is self.redis:
+                self._pending_invalidations.update(tags)
+            self.backend_failed(backend, e, f"cache invalidation for {tags}")
+
+
+response_cache = ResponseCache()
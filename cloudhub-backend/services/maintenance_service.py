@@ -0,0 +1,105 @@
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+# Collection holding resume checkpoints of named maintenance jobs
+CHECKPOINT_COLLECTION = "maintenance_jobs"
+DEFAULT_BATCH_SIZE = 500
+
+async def run_bulk_update(
+    collection,
+    query: Dict[str, Any],
+    build_update: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    projection: Optional[Dict[str, Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    job_name: Optional[str] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """
+    Apply a per-document update to every document matching query.
+
+    Documents are streamed in _id order and written back in unordered
+    bulk_write batches of UpdateOne operations, so no document is loaded in
+    full or replaced, and no model hooks run. Each UpdateOne re-applies
+    query, so documents changed by someone else since they were read are
+    left alone.
+
+    Args:
+        collection: Motor collection to update
+        query: Filter selecting the documents to update
+        build_update: Returns the update document for a read document, or None to skip it
+        projection: Fields build_update needs; defaults to _id only
+        batch_size: Number of documents per read batch and bulk_write
+        job_name: If given, progress is checkpointed under this name and an
+            interrupted run resumes after the last written batch
+        on_progress: Awaited with the progress dict after every batch
+
+    Returns:
+        dict: scanned, modified, errors, batches and last_id counts
+    """
+    checkpoints = collection.database[CHECKPOINT_COLLECTION]
+    progress = {"scanned": 0, "modified": 0, "errors": 0, "batches": 0, "last_id": None}
+
+    if job_name:
+        checkpoint = await checkpoints.find_one({"_id": job_name})
+        if checkpoint and not checkpoint.get("completed"):
+            progress.update({key: checkpoint[key] for key in progress if key in checkpoint})
+            logger.info(f"Resuming maintenance job {job_name} after {progress['last_id']}")
+
+    while True:
+        batch_query = query
+        if progress["last_id"] is not None:
+            batch_query = {"$and": [query, {"_id": {"$gt": progress["last_id"]}}]}
+
+        documents = await collection.find(
+            batch_query, projection or {"_id": 1}
+        ).sort("_id", 1).limit(batch_size).to_list(None)
+        if not documents:
+            break
+
+        operations = []
+        for document in documents:
+            update = build_update(document)
+            if update:
+                operations.append(UpdateOne({"$and": [{"_id": document["_id"]}, query]}, update))
+
+        if operations:
+            try:
+                result = await collection.bulk_write(operations, ordered=False)
+                progress["modified"] += result.modified_count
+            except BulkWriteError as e:
+                progress["modified"] += e.details.get("nModified", 0)
+                progress["errors"] += len(e.details.get("writeErrors", []))
+                logger.error(f"Bulk write errors in maintenance job {job_name or collection.name}: {e.details.get('writeErrors', [])[:3]}")
+
+        progress["scanned"] += len(documents)
+        progress["batches"] += 1
+        progress["last_id"] = documents[-1]["_id"]
+
+        if job_name:
+            await checkpoints.update_one(
+                {"_id": job_name},
+                {"$set": {**progress, "completed": False, "updated_at": datetime.utcnow()}},
+                upsert=True
+            )
+        logger.info(
+            f"Maintenance job {job_name or collection.name}: "
+            f"scanned {progress['scanned']}, modified {progress['modified']}, errors {progress['errors']}"
+        )
+        if on_progress:
+            await on_progress(dict(progress))
+
+    if job_name:
+        await checkpoints.update_one(
+            {"_id": job_name},
+            {"$set": {**progress, "completed": True, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    return progress
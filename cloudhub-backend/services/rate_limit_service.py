@@ -0,0 +1,207 @@
+import logging
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from auth.jwt_manager import TokenManager
+from config.config import settings
+from services.redis_failover import RedisFailover
+from utils.metrics import Counter
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cloudhub:ratelimit:"
+
+# Whether X-Forwarded-For was seen while RATE_LIMIT_TRUST_FORWARDED_FOR is off
+_untrusted_forwarded_for_logged = False
+
+RATE_LIMITED = Counter(
+    "rate_limited_requests_total", "Requests rejected by the rate limiter, by budget.", ("budget",)
+)
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_BUDGET_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+# Refill the bucket and take one token atomically; returns {allowed, retry_after}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return {allowed, tostring(retry_after)}
+"""
+
+def parse_budget(spec: str) -> Tuple[int, float]:
+    """
+    Parse "5/minute" or "100/15minutes" into (capacity, tokens per second).
+
+    The bucket holds `count` tokens and refills at count per period, so a
+    client may burst up to the full budget and then continues at the
+    average rate.
+    """
+    match = _BUDGET_PATTERN.match(spec)
+    if not match:
+        raise ValueError(f"Invalid rate limit: {spec!r}")
+    count, multiplier, unit = match.groups()
+    period = int(multiplier or 1) * _PERIODS[unit]
+    return int(count), int(count) / period
+
+def _parse_budgets(spec: str) -> Dict[str, Tuple[int, float]]:
+    """Parse "login=5/minute,register=3/minute" into a dict of budgets."""
+    budgets = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, budget = item.split("=", 1)
+            budgets[name.strip()] = parse_budget(budget)
+    return budgets
+
+
+class MemoryRateLimitBackend:
+    """Per-process token buckets, bounded to the most recently used keys."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, capacity: int, rate: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            tokens -= 1
+            allowed, retry_after = True, 0.0
+        else:
+            allowed, retry_after = False, (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, retry_after
+
+    async def close(self):
+        self._buckets.clear()
+
+
+class RedisRateLimitBackend:
+    """Token buckets in Redis hashes, shared by every worker."""
+
+    def __init__(self, client):
+        self.client = client
+        self.script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def take(self, key: str, capacity: int, rate: float) -> Tuple[bool, float]:
+        allowed, retry_after = await self.script(keys=[KEY_PREFIX + key], args=[capacity, rate, time.time()])
+        return bool(int(allowed)), float(retry_after)
+
+    async def close(self):
+        await self.client.close()
+
+
+class RateLimiter(RedisFailover):
+    """
+    Token-bucket rate limiter with named budgets.
+
+    Budgets come from settings.RATE_LIMITS ("name=count/period", comma
+    separated); names without an entry use settings.RATE_LIMIT_DEFAULT.
+    Uses Redis when settings.REDIS_URL is reachable at startup, and the
+    in-process buckets otherwise or while Redis is failing.
+    """
+
+    name = "rate limiter"
+
+    def __init__(self):
+        super().__init__(MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS))
+        self.default_budget = parse_budget(settings.RATE_LIMIT_DEFAULT)
+        self.budgets = _parse_budgets(settings.RATE_LIMITS)
+
+    def create_redis_backend(self, client):
+        return RedisRateLimitBackend(client)
+
+    async def connect(self):
+        if settings.RATE_LIMIT_ENABLED:
+            await super().connect()
+
+    async def hit(self, budget: str, identity: str) -> Tuple[bool, float]:
+        """Take a token from identity's bucket for budget; returns (allowed, retry_after)."""
+        capacity, rate = self.budgets.get(budget, self.default_budget)
+        key = f"{budget}:{identity}"
+        backend = self.backend
+        try:
+            return await backend.take(key, capacity, rate)
+        except Exception as e:
+            self.backend_failed(backend, e, "rate limit check")
+            return await self.memory.take(key, capacity, rate)
+
+
+rate_limiter = RateLimiter()
+
+
+def client_identity(request: Request) -> str:
+    """
+    Identify the caller: the user of a valid bearer token, else the client IP.
+
+    The token is only verified, never looked up, so no Mongo work is done.
+    Behind a reverse proxy the client IP is the proxy's unless
+    RATE_LIMIT_TRUST_FORWARDED_FOR is on, so anonymous callers would all
+    share one bucket; that is logged once when it is seen.
+    """
+    global _untrusted_forwarded_for_logged
+    authorization = request.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        try:
+            payload = TokenManager.decode_token(authorization[7:])
+            if payload.get("sub"):
+                return f"user:{payload['sub']}"
+        except HTTPException:
+            pass
+
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+            return f"ip:{forwarded_for.split(',')[0].strip()}"
+        if not _untrusted_forwarded_for_logged:
+            _untrusted_forwarded_for_logged = True
+            logger.warning(
+                "Requests carry X-Forwarded-For but RATE_LIMIT_TRUST_FORWARDED_FOR is off: "
+                "anonymous clients behind the proxy share one rate limit bucket"
+            )
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def rate_limit(budget: str = "default"):
+    """
+    Dependency rejecting the request with 429 once the caller's budget is spent.
+
+    Declare it in the route's (or router's) dependencies so it runs before
+    any other dependency and before the endpoint does any work.
+    """
+    async def dependency(request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        allowed, retry_after = await rate_limiter.hit(budget, client_identity(request))
+        if not allowed:
+            RATE_LIMITED.inc(budget)
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+
+    return dependency
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from typing import Any, Optional
+
+from config.config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional, services stay on their in-process backend
+    aioredis = None
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
+
+
+class RedisFailover:
+    """
+    Base for services that use Redis when it answers and an in-process backend otherwise.
+
+    connect() switches to Redis if it is reachable at startup. When a Redis
+    call fails, backend_failed() trips the service over to the in-process
+    backend, so later requests no longer wait on Redis timeouts, and a
+    background task pings Redis every REDIS_RETRY_SECONDS until it answers,
+    then switches back.
+    """
+
+    name = "service"
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.redis: Optional[Any] = None
+        self.backend = memory
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def create_redis_backend(self, client):
+        raise NotImplementedError
+
+    def on_trip(self):
+        """Called right after switching to the in-process backend."""
+
+    async def before_restore(self):
+        """Called before switching back to Redis; raising keeps the in-process backend."""
+
+    async def connect(self):
+        """Switch to Redis if it is reachable."""
+        if aioredis is None:
+            return
+        client = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=1
+        )
+        try:
+            await client.ping()
+        except Exception as e:
+            logger.warning(f"Redis not reachable, using in-process {self.name}: {str(e)}")
+            await client.close()
+            return
+        self.redis = self.create_redis_backend(client)
+        self.backend = self.redis
+        logger.info(f"{self.name.capitalize()} using Redis")
+
+    async def close(self):
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self.redis is not None:
+            await self.redis.close()
+            self.redis = None
+        self.backend = self.memory
+        await self.memory.close()
+
+    def backend_failed(self, backend, error: Exception, operation: str):
+        """
+        Handle an exception raised by backend.
+
+        A Redis failure trips the service to the in-process backend, logged
+        once rather than on every request; other failures are logged.
+        """
+        if backend is not self.redis:
+            logger.error(f"{self.name.capitalize()} {operation} failed: {str(error)}")
+            return
+        if self.backend is not self.redis:
+            return
+        self.backend = self.memory
+        self.on_trip()
+        logger.error(
+            f"Redis {operation} failed, {self.name} using in-process backend until Redis answers: {str(error)}"
+        )
+        self._probe_task = asyncio.create_task(self._probe())
+
+    async def restore(self) -> bool:
+        """Switch back to Redis if it answers; returns whether it did."""
+        try:
+            await self.redis.client.ping()
+            await self.before_restore()
+        except Exception as e:
+            logger.debug(f"Redis still unavailable for {self.name}: {str(e)}")
+            return False
+        self.backend = self.redis
+        logger.info(f"Redis answering again, {self.name} switched back to it")
+        return True
+
+    async def _probe(self):
+        while True:
+            await asyncio.sleep(settings.REDIS_RETRY_SECONDS)
+            if self.redis is None or await self.restore():
+                break
+        self._probe_task = None
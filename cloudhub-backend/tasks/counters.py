@@ -0,0 +1,102 @@
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+
+from pymongo import UpdateOne
+
+from models.hackathon import Hackathon
+from services.cache_service import response_cache, hackathon_tag
+from models.registration import HackathonRegistration
+from models.team import Team
+from models.project import Project
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_BATCH_SIZE = 500
+COUNTER_FIELDS = ("registered_participants", "total_teams", "submitted_projects")
+# Longer than any request takes between its counter $inc and its row write
+SETTLE_SECONDS = 300
+
+async def _group_counts(collection, match: dict, key: str) -> Counter:
+    """Count documents per hackathon with a single $group aggregation."""
+    counts = Counter()
+    pipeline = [
+        {"$match": match},
+        {"$group": {"_id": key, "count": {"$sum": 1}}}
+    ]
+    async for row in collection.aggregate(pipeline):
+        group_id = row["_id"]
+        # Project.hackathon is a Link, stored as a DBRef
+        group_id = getattr(group_id, "id", group_id)
+        if group_id is not None:
+            counts[str(group_id)] = row["count"]
+    return counts
+
+async def reconcile_hackathon_counters():
+    """
+    Repair drift in the denormalized hackathon statistics counters.
+
+    The counters are maintained with $inc at the point of change; this job
+    recounts registrations, teams and submitted projects with one
+    aggregation per collection and rewrites only the hackathons that differ.
+
+    Hackathons whose counters moved within SETTLE_SECONDS of the recount are
+    skipped: a request may have claimed a seat whose row is not written yet,
+    or be handing one back. Each rewrite is conditional on the counters
+    still holding the values read, so an $inc landing after the read is
+    never overwritten.
+    """
+    try:
+        settled_before = datetime.utcnow() - timedelta(seconds=SETTLE_SECONDS)
+        registrations = await _group_counts(
+            HackathonRegistration.get_motor_collection(), {}, "$hackathon_id"
+        )
+        teams = await _group_counts(
+            Team.get_motor_collection(), {"is_deleted": False}, "$hackathon_id"
+        )
+        submissions = await _group_counts(
+            Project.get_motor_collection(),
+            {"is_deleted": False, "status": {"$ne": "draft"}},
+            "$hackathon"
+        )
+
+        operations, hackathon_ids = [], []
+        repaired = 0
+
+        async def flush():
+            result = await Hackathon.get_motor_collection().bulk_write(operations, ordered=False)
+            await response_cache.invalidate(*(hackathon_tag(hackathon_id) for hackathon_id in hackathon_ids))
+            return result.modified_count
+
+        cursor = Hackathon.get_motor_collection().find(
+            {},
+            {**{field: 1 for field in COUNTER_FIELDS}, "counters_updated_at": 1}
+        )
+        async for doc in cursor:
+            if doc.get("counters_updated_at") and doc["counters_updated_at"] >= settled_before:
+                continue
+
+            hackathon_key = str(doc["_id"])
+            expected = {
+                "registered_participants": registrations.get(hackathon_key, 0),
+                "total_teams": teams.get(hackathon_key, 0),
+                "submitted_projects": submissions.get(hackathon_key, 0)
+            }
+            if any(doc.get(field, 0) != value for field, value in expected.items()):
+                # A missing field or counters_updated_at matches None
+                current = {field: doc.get(field) for field in (*COUNTER_FIELDS, "counters_updated_at")}
+                operations.append(UpdateOne({"_id": doc["_id"], **current}, {"$set": expected}))
+                hackathon_ids.append(hackathon_key)
+
+            if len(operations) >= RECONCILE_BATCH_SIZE:
+                repaired += await flush()
+                operations, hackathon_ids = [], []
+
+        if operations:
+            repaired += await flush()
+
+        if repaired:
+            logger.info(f"Repaired statistics counters for {repaired} hackathons")
+
+    except Exception as e:
+        logger.error(f"Error reconciling hackathon counters: {str(e)}")
@@ -1,20 +1,71 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from .cleanup import cleanup_expired_pending_hackathons
+
+from config.config import settings
+from database import get_db
+from database.leases import LEASE_COLLECTION, acquire_lease
+from .counters import reconcile_hackathon_counters
 
 logger = logging.getLogger(__name__)
 
+# (name, job, interval in seconds)
+PERIODIC_JOBS = [
+    ("reconcile-hackathon-counters", reconcile_hackathon_counters, 3600),
+]
+
+# How often each worker checks for due jobs and renews the leases it holds
+SCHEDULER_TICK_SECONDS = 30
+
+# A lease lapses after a few missed renewals, so another worker takes over
+# the jobs of a holder that died within this long, whatever their interval
+JOB_LEASE_SECONDS = SCHEDULER_TICK_SECONDS * 4
+
+async def _claim_run(database, lease: str, interval: float) -> bool:
+    """Record a run in the lease if interval has passed since the last one; returns whether it did."""
+    now = datetime.utcnow()
+    state = await database[LEASE_COLLECTION].find_one({"_id": lease}, {"last_run_at": 1})
+    last_run_at = state.get("last_run_at") if state else None
+    if last_run_at and last_run_at > now - timedelta(seconds=interval):
+        return False
+    # Recorded before running, so a failing job is retried next interval rather than every tick
+    await database[LEASE_COLLECTION].update_one({"_id": lease}, {"$set": {"last_run_at": now}})
+    return True
+
+async def _run_job(name: str, job):
+    try:
+        await job()
+    except Exception as e:
+        logger.error(f"Error in periodic task {name}: {str(e)}")
+
 async def run_periodic_tasks():
-    """Run periodic background tasks."""
+    """
+    Run periodic background tasks.
+    
+    Every worker runs this loop. A job only runs in the worker holding its
+    lease, which is short and renewed every tick, also while the job runs
+    in its own task, so a dead holder's jobs move to another worker within
+    JOB_LEASE_SECONDS. How often a job runs is decided by the last_run_at
+    stored on its lease, which survives a change of holder, so each job
+    runs once per interval across all workers.
+    """
+    database = get_db()[settings.DATABASE_NAME]
+    running = {}
+    
     while True:
-        try:
-            # Run cleanup tasks
-            await cleanup_expired_pending_hackathons()
-            
-            # Wait for 5 minutes before next run
-            await asyncio.sleep(300)  # 5 minutes
-            
-        except Exception as e:
-            logger.error(f"Error in periodic tasks: {str(e)}")
-            await asyncio.sleep(60)  # Wait 1 minute on error before retrying 
\ No newline at end of file
+        for name, job, interval in PERIODIC_JOBS:
+            lease = f"job:{name}"
+            task = running.get(name)
+            try:
+                if not await acquire_lease(database, lease, JOB_LEASE_SECONDS):
+                    if task is not None and not task.done():
+                        logger.warning(f"Lost lease {lease} while its job was running")
+                    continue
+                if task is not None and not task.done():
+                    continue
+                if await _claim_run(database, lease, interval):
+                    running[name] = asyncio.create_task(_run_job(name, job))
+            except Exception as e:
+                logger.error(f"Error scheduling periodic task {name}: {str(e)}")
+        
+        await asyncio.sleep(SCHEDULER_TICK_SECONDS)
@@ -0,0 +1,99 @@
+import os
+import sys
+import asyncio
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import MemoryCacheBackend, ResponseCache, hackathon_tag
+
+def test_invalidate_by_tag():
+    """Invalidating a hackathon tag drops every entry carrying it."""
+    async def run():
+        cache = MemoryCacheBackend(max_entries=10)
+        await cache.set("detail", {"id": "1"}, (hackathon_tag("1"),), ttl=60, generation=0)
+        await cache.set("faqs", [], (hackathon_tag("1"), hackathon_tag("1", "faqs")), ttl=60, generation=0)
+        await cache.set("other", {"id": "2"}, (hackathon_tag("2"),), ttl=60, generation=0)
+
+        await cache.invalidate((hackathon_tag("1", "faqs"),))
+        assert await cache.get("faqs") is None
+        assert await cache.get("detail") == {"id": "1"}
+
+        await cache.invalidate((hackathon_tag("1"),))
+        assert await cache.get("detail") is None
+        assert await cache.get("other") == {"id": "2"}
+
+    asyncio.run(run())
+
+def test_lru_eviction_and_ttl():
+    """The oldest entry is evicted past max_entries and expired entries miss."""
+    async def run():
+        cache = MemoryCacheBackend(max_entries=2)
+        await cache.set("a", 1, (), ttl=60, generation=0)
+        await cache.set("b", 2, (), ttl=60, generation=0)
+        await cache.set("c", 3, (), ttl=60, generation=0)
+        assert await cache.get("a") is None
+        assert await cache.get("c") == 3
+
+        await cache.set("expired", 4, (), ttl=0, generation=0)
+        assert await cache.get("expired") is None
+
+    asyncio.run(run())
+
+
+def test_load_racing_invalidation_is_not_stored():
+    """A value loaded before an invalidation is dropped when set after it."""
+    async def run():
+        cache = MemoryCacheBackend(max_entries=10)
+        generation = await cache.generation((hackathon_tag("1"),))
+        await cache.invalidate((hackathon_tag("1"),))
+        await cache.set("detail", {"title": "old"}, (hackathon_tag("1"),), ttl=60, generation=generation)
+        assert await cache.get("detail") is None
+
+        generation = await cache.generation((hackathon_tag("1"),))
+        await cache.set("detail", {"title": "new"}, (hackathon_tag("1"),), ttl=60, generation=generation)
+        assert await cache.get("detail") == {"title": "new"}
+
+    asyncio.run(run())
+
+class FlakyBackend(MemoryCacheBackend):
+    """In-process backend standing in for Redis, failing while `down` is set."""
+
+    def __init__(self):
+        super().__init__(max_entries=10)
+        self.client = self
+        self.down = False
+
+    async def ping(self):
+        if self.down:
+            raise ConnectionError("redis down")
+
+    async def get(self, key):
+        await self.ping()
+        return await super().get(key)
+
+    async def invalidate(self, tags):
+        await self.ping()
+        await super().invalidate(tags)
+
+def test_failed_invalidation_is_replayed_before_serving_redis_again():
+    """Entries an invalidation failed to drop are not served; the invalidation runs again before switching back."""
+    async def run():
+        cache = ResponseCache()
+        redis = cache.redis = cache.backend = FlakyBackend()
+        tags = [hackathon_tag("1")]
+        await cache.set("detail", {"title": "old"}, tags, await cache.generation(tags))
+
+        redis.down = True
+        await cache.invalidate(*tags)
+        assert cache.backend is cache.memory
+        assert await cache.get("detail") is None
+
+        assert await cache.restore() is False
+        redis.down = False
+        assert await cache.restore() is True
+        assert cache.backend is redis
+        assert await cache.get("detail") is None
+        await cache.close()
+
+    asyncio.run(run())
@@ -0,0 +1,64 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.hackathon import DISCOVERY_SORTS, _discovery_indexes, discovery_query
+from database.slow_queries import summarize_plan
+
+NOW = datetime(2025, 6, 1)
+FILTERS = [{}, {"status": "published"}, {"tag": "ai"}, {"featured": True}]
+RANGE = {"starts_after": NOW, "starts_before": NOW + timedelta(days=30)}
+
+def accepted_combinations():
+    """Every filter/sort combination the discovery listing accepts."""
+    for sort in DISCOVERY_SORTS:
+        for filters in FILTERS:
+            yield {**filters, "sort": sort}
+            if sort == "start_date":
+                yield {**filters, **RANGE, "sort": sort}
+
+def test_unsupported_combinations_rejected():
+    with pytest.raises(ValueError):
+        discovery_query(status="published", tag="ai")
+    with pytest.raises(ValueError):
+        discovery_query(tag="ai", featured=False)
+    with pytest.raises(ValueError):
+        discovery_query(starts_after=NOW, sort="prize_pool")
+    with pytest.raises(ValueError):
+        discovery_query(sort="title")
+
+@pytest.mark.skipif(not os.getenv("TEST_MONGODB_URL"), reason="set TEST_MONGODB_URL to run explain against MongoDB")
+def test_every_accepted_combination_uses_an_index():
+    """explain shows an index scan without in-memory sort for each accepted combination."""
+    from pymongo import MongoClient
+
+    client = MongoClient(os.environ["TEST_MONGODB_URL"])
+    collection = client["cloudhub_test_discovery"]["hackathons"]
+    collection.drop()
+    collection.create_indexes(_discovery_indexes())
+    collection.insert_many([
+        {
+            "is_deleted": False, "is_private": False, "status": "published", "tags": ["ai"],
+            "is_featured": i % 2 == 0, "total_prize_pool": i * 100,
+            "created_at": NOW - timedelta(hours=i), "timeline": {"event_start": NOW + timedelta(days=i)}
+        }
+        for i in range(50)
+    ])
+
+    try:
+        for combination in accepted_combinations():
+            query, sort_field, direction = discovery_query(**combination)
+            plan = summarize_plan(
+                collection.find(query).sort([(sort_field, direction), ("_id", direction)]).limit(20).explain()
+            )
+            assert not plan["collscan"], combination
+            assert not plan["in_memory_sort"], combination
+            assert any(index.startswith("idx_hackathon_discovery_") for index in plan["indexes"]), combination
+    finally:
+        client.drop_database("cloudhub_test_discovery")
+        client.close()
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+
+import pytest
+from fastapi import HTTPException
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth.jwt_manager import TokenManager, VerifiedTokenCache, verified_tokens
+
+def _token() -> str:
+    return TokenManager.create_access_token({"sub": "user-1", "role": "participant", "type": "access"})
+
+def test_decode_reuses_verified_payload():
+    verified_tokens.clear()
+    token = _token()
+
+    first = TokenManager.decode_token(token)
+    # Callers may modify the returned payload without touching the cache
+    first["sub"] = "someone-else"
+    assert TokenManager.decode_token(token)["sub"] == "user-1"
+
+def test_cached_payload_expires_with_the_token():
+    verified_tokens.clear()
+    token = _token()
+    key = verified_tokens.digest(token)
+    payload = TokenManager.decode_token(token)
+
+    verified_tokens.set(key, {**payload, "exp": time.time() - 1})
+    assert verified_tokens.get(key) is None
+
+def test_revoked_token_is_rejected():
+    verified_tokens.clear()
+    token = _token()
+    TokenManager.decode_token(token)
+
+    TokenManager.revoke_access_token(token)
+    with pytest.raises(HTTPException) as exc:
+        TokenManager.decode_token(token)
+    assert exc.value.status_code == 401
+
+def test_revocations_are_kept_until_they_expire():
+    """Revocations are not bounded by the payload cache size, even when it is disabled."""
+    cache = VerifiedTokenCache(max_entries=0)
+    now = time.time()
+    for i in range(100):
+        cache.revoke(cache.digest(f"token-{i}"), now + 60)
+    cache.revoke(cache.digest("expiring"), now + 0.01)
+
+    assert all(cache.is_revoked(cache.digest(f"token-{i}")) for i in range(100))
+    time.sleep(0.02)
+    assert not cache.is_revoked(cache.digest("expiring"))
+    assert len(cache._revoked) == 100
@@ -0,0 +1,61 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pagination import (
+    encode_cursor,
+    decode_cursor,
+    keyset_filter,
+    with_cursor,
+    InvalidCursorError
+)
+
+def test_cursor_round_trip_datetime():
+    """A datetime sort key and its ObjectId survive encoding."""
+    created_at = datetime(2025, 5, 26, 14, 19, 50, 123456)
+    doc_id = ObjectId()
+
+    value, decoded_id = decode_cursor(encode_cursor(created_at, doc_id))
+
+    assert value == created_at
+    assert decoded_id == doc_id
+
+def test_cursor_round_trip_number():
+    """Numeric sort keys are preserved as numbers."""
+    doc_id = ObjectId()
+
+    value, decoded_id = decode_cursor(encode_cursor(15000.5, doc_id))
+
+    assert value == 15000.5
+    assert decoded_id == doc_id
+
+def test_invalid_cursor_rejected():
+    """Garbage cursors raise InvalidCursorError instead of a server error."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+def test_keyset_filter_descending():
+    """The filter selects strictly older items, using _id as tie-breaker."""
+    created_at = datetime(2025, 5, 26)
+    doc_id = ObjectId()
+
+    after = keyset_filter("created_at", encode_cursor(created_at, doc_id))
+
+    assert after == {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": doc_id}}
+        ]
+    }
+
+def test_with_cursor_without_cursor_returns_query():
+    """The first page uses the base query unchanged."""
+    query = {"organizer_id": "abc"}
+
+    assert with_cursor(query, "created_at", None) is query
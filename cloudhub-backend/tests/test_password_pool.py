@@ -0,0 +1,49 @@
+import os
+import sys
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth.utils import PasswordHashPool, check_password, get_password_hash
+
+def test_check_password_runs_in_pool():
+    hashed = get_password_hash("correct horse")
+
+    async def run():
+        assert await check_password("correct horse", hashed) is True
+        assert await check_password("wrong horse", hashed) is False
+
+    asyncio.run(run())
+
+def test_pool_keeps_event_loop_responsive_and_rejects_when_full():
+    """Blocking work runs off the loop; callers beyond max_pending get a 503."""
+    async def run():
+        pool = PasswordHashPool(workers=2, max_pending=2)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        work = [asyncio.create_task(pool.run("hash", time.sleep, 0.2)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc:
+            await pool.run("hash", time.sleep, 0.2)
+        assert exc.value.status_code == 503
+
+        await asyncio.gather(*work)
+        ticking.cancel()
+        pool.shutdown()
+        assert ticks >= 10
+        assert pool.pending == 0
+
+    asyncio.run(run())
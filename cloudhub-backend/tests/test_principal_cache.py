@@ -0,0 +1,42 @@
+import os
+import sys
+
+from bson import ObjectId
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth.principal import Principal, PrincipalCache
+
+def _principal(role: str = "participant") -> Principal:
+    return Principal(id=ObjectId(), email="user@example.com", role=role)
+
+def test_cache_hit_and_invalidate():
+    cache = PrincipalCache(ttl=60, max_entries=10)
+    principal = _principal()
+    key = str(principal.id)
+
+    cache.set(key, principal, cache.generation)
+    assert cache.get(key) == principal
+
+    cache.invalidate(principal.id)
+    assert cache.get(key) is None
+
+def test_load_racing_an_invalidation_is_not_cached():
+    """A lookup that started before an invalidation may have read the old document."""
+    cache = PrincipalCache(ttl=60, max_entries=10)
+    principal = _principal()
+    generation = cache.generation
+
+    cache.invalidate(principal.id)
+    cache.set(str(principal.id), principal, generation)
+    assert cache.get(str(principal.id)) is None
+
+def test_cache_is_bounded():
+    cache = PrincipalCache(ttl=60, max_entries=2)
+    principals = [_principal() for _ in range(3)]
+    for principal in principals:
+        cache.set(str(principal.id), principal, cache.generation)
+
+    assert cache.get(str(principals[0].id)) is None
+    assert cache.get(str(principals[2].id)) == principals[2]
@@ -0,0 +1,63 @@
+import os
+import sys
+import asyncio
+
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.rate_limit_service import MemoryRateLimitBackend, RateLimiter, parse_budget
+
+def test_parse_budget():
+    assert parse_budget("5/minute") == (5, 5 / 60)
+    assert parse_budget("100/15minutes") == (100, 100 / 900)
+    with pytest.raises(ValueError):
+        parse_budget("5 per minute")
+
+def test_bucket_allows_burst_then_rejects():
+    """A full bucket allows `capacity` requests, then reports when the next token arrives."""
+    async def run():
+        backend = MemoryRateLimitBackend(max_keys=10)
+        results = [await backend.take("login:ip:1", 3, 3 / 60) for _ in range(4)]
+
+        assert [allowed for allowed, _ in results] == [True, True, True, False]
+        assert 0 < results[-1][1] <= 20
+        # Other callers have their own bucket
+        assert (await backend.take("login:ip:2", 3, 3 / 60))[0] is True
+
+    asyncio.run(run())
+
+def test_redis_failure_switches_to_in_process_buckets():
+    """After one Redis failure, checks go to the in-process buckets until Redis answers again."""
+    class FlakyRedis(MemoryRateLimitBackend):
+        def __init__(self):
+            super().__init__(max_keys=10)
+            self.client = self
+            self.calls = 0
+            self.down = True
+
+        async def ping(self):
+            if self.down:
+                raise ConnectionError("redis down")
+
+        async def take(self, key, capacity, rate):
+            self.calls += 1
+            await self.ping()
+            return await super().take(key, capacity, rate)
+
+    async def run():
+        limiter = RateLimiter()
+        redis = limiter.redis = limiter.backend = FlakyRedis()
+
+        for _ in range(3):
+            assert (await limiter.hit("login", "ip:1"))[0] is True
+        assert redis.calls == 1
+        assert limiter.backend is limiter.memory
+
+        redis.down = False
+        assert await limiter.restore() is True
+        assert limiter.backend is redis
+        await limiter.close()
+
+    asyncio.run(run())
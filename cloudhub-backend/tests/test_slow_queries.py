@@ -0,0 +1,49 @@
+import os
+import sys
+
+from bson import ObjectId
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.slow_queries import command_shape, summarize_plan
+
+def test_command_shape_strips_values():
+    """Two finds differing only in values have the same shape."""
+    first = command_shape("find", {
+        "find": "projects",
+        "filter": {"team_id": "abc", "$or": [{"status": "draft"}, {"_id": {"$in": [ObjectId()]}}]},
+        "sort": {"created_at": -1}
+    })
+    second = command_shape("find", {
+        "find": "projects",
+        "filter": {"team_id": "xyz", "$or": [{"status": "submitted"}, {"_id": {"$in": []}}]},
+        "sort": {"created_at": -1}
+    })
+
+    assert first == second
+    assert first["filter"] == {"team_id": "?", "$or": [{"status": "?"}, {"_id": {"$in": "?"}}]}
+
+def test_summarize_plan_flags_collscan_and_sort():
+    """Only the winning plan counts; rejected plans are ignored."""
+    plan = summarize_plan({
+        "queryPlanner": {
+            "winningPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}},
+            "rejectedPlans": [{"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "team_id_1"}}]
+        }
+    })
+
+    assert plan["collscan"] is True
+    assert plan["in_memory_sort"] is True
+    assert plan["indexes"] == []
+
+def test_summarize_plan_index_scan():
+    plan = summarize_plan({
+        "queryPlanner": {
+            "winningPlan": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": "team_id_1"}}
+        }
+    })
+
+    assert plan["collscan"] is False
+    assert plan["in_memory_sort"] is False
+    assert plan["indexes"] == ["team_id_1"]
@@ -3,42 +3,9 @@ import traceback
 from functools import wraps
 from flask import jsonify, current_app
 from werkzeug.exceptions import HTTPException
-import sys
-import os
-from logging.handlers import RotatingFileHandler
 from typing import Dict, Any
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from datetime import datetime
-
-def setup_logging():
-    """Configure logging settings."""
-    # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
-        
-    # Generate log filename with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file = f'logs/app_{timestamp}.log'
-    
-    # Configure logging
-    logging.basicConfig(
-        level=logging.DEBUG,  # Set to DEBUG to capture all log levels
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()  # Also log to console
-        ]
-    )
-    
-    # Set specific loggers to appropriate levels
-    logging.getLogger('uvicorn').setLevel(logging.INFO)
-    logging.getLogger('fastapi').setLevel(logging.INFO)
-    logging.getLogger('beanie').setLevel(logging.INFO)
-    
-    # Our application loggers should stay at DEBUG
-    logging.getLogger('database.db').setLevel(logging.DEBUG)
-    logging.getLogger('app').setLevel(logging.DEBUG)
 
 def handle_error(error):
     """Generic error handler."""
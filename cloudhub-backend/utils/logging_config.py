@@ -0,0 +1,170 @@
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional, Tuple
+
+from config.config import settings
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                payload[key] = value
+        return json.dumps(payload, default=str)
+
+class ErrorSamplingFilter(logging.Filter):
+    """
+    Rate-limit repeated warnings and errors.
+
+    Records are grouped by the call site that logged them. Each call site may
+    emit `burst` records per `window` seconds; the rest are dropped and
+    counted, and the count is attached to the next record that gets through.
+    """
+
+    def __init__(self, window: float, burst: int):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._sites: Dict[Tuple[str, str, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or self.window <= 0:
+            return True
+
+        key = (record.name, record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            # [window start, emitted in window, suppressed since last emit]
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.window:
+                suppressed = site[2] if site else 0
+                self._sites[key] = [now, 1, 0]
+            elif site[1] < self.burst:
+                site[1] += 1
+                suppressed = 0
+            else:
+                site[2] += 1
+                return False
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+class _PreparedQueueHandler(QueueHandler):
+    """QueueHandler that keeps `extra` fields and leaves formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def _parse_levels(spec: str) -> Dict[str, str]:
+    """Parse "beanie=WARNING,routes.hackathon=DEBUG" into a dict."""
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+def log_file_path() -> str:
+    """
+    The file this process logs to: settings.LOG_FILE, with the pid added
+    when several worker processes run (logs/app.log -> logs/app.1234.log).
+
+    Each file has a single writer, since RotatingFileHandler cannot rotate
+    a file other processes are still appending to.
+    """
+    if settings.WORKERS <= 1 or settings.DEBUG:
+        return settings.LOG_FILE
+    root, ext = os.path.splitext(settings.LOG_FILE)
+    return f"{root}.{os.getpid()}{ext}"
+
+def setup_logging():
+    """
+    Configure application logging.
+
+    Loggers only put records on an in-memory queue; a QueueListener thread
+    formats them and writes them to stderr and a size-rotated file, so log
+    I/O never runs on the event loop. Levels come from settings.LOG_LEVEL
+    and the per-logger overrides in settings.LOG_LEVELS.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = JsonFormatter() if settings.LOG_JSON else logging.Formatter(settings.LOG_FORMAT)
+
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+
+    if settings.LOG_FILE:
+        log_dir = os.path.dirname(settings.LOG_FILE)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            log_file_path(),
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _PreparedQueueHandler(log_queue)
+    queue_handler.addFilter(ErrorSamplingFilter(
+        settings.LOG_ERROR_SAMPLE_WINDOW_SECONDS,
+        settings.LOG_ERROR_SAMPLE_BURST
+    ))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    # Library loggers stay quieter than the application by default
+    logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
+    logging.getLogger('pymongo').setLevel(logging.WARNING)
+    logging.getLogger('beanie').setLevel(logging.INFO)
+    for name, level in _parse_levels(settings.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,86 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(sort_value: Any, doc_id: Any) -> str:
+    """
+    Encode the sort key of the last item on a page into an opaque cursor.
+
+    Args:
+        sort_value: Value of the primary sort field (datetime or number)
+        doc_id: The document's _id, used as tie-breaker
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    if isinstance(sort_value, datetime):
+        payload = {"t": "dt", "v": sort_value.isoformat()}
+    else:
+        payload = {"t": "n", "v": sort_value}
+    payload["i"] = str(doc_id)
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Returns:
+        tuple: (sort_value, ObjectId)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if payload.get("t") == "dt":
+            sort_value = datetime.fromisoformat(payload["v"])
+        else:
+            sort_value = payload["v"]
+        return sort_value, ObjectId(payload["i"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise InvalidCursorError(f"Invalid cursor: {str(e)}") from e
+
+
+def keyset_filter(field: str, cursor: Optional[str], descending: bool = True) -> Dict[str, Any]:
+    """
+    Build the Mongo filter selecting documents after the cursor position
+    for a (field, _id) sort.
+
+    Returns an empty dict when no cursor is given.
+    """
+    if not cursor:
+        return {}
+    sort_value, last_id = decode_cursor(cursor)
+    op = "$lt" if descending else "$gt"
+    return {
+        "$or": [
+            {field: {op: sort_value}},
+            {field: sort_value, "_id": {op: last_id}},
+        ]
+    }
+
+
+def keyset_sort(field: str, descending: bool = True) -> List[Tuple[str, int]]:
+    """Sort specification matching keyset_filter."""
+    direction = -1 if descending else 1
+    return [(field, direction), ("_id", direction)]
+
+
+def with_cursor(query: Dict[str, Any], field: str, cursor: Optional[str], descending: bool = True) -> Dict[str, Any]:
+    """Combine a base query with the keyset filter for the cursor."""
+    after = keyset_filter(field, cursor, descending)
+    if not after:
+        return query
+    return {"$and": [query, after]}